@@ -0,0 +1,144 @@
+import asyncio
+import os
+import aiohttp
+from eth_account import Account
+from dotenv import load_dotenv
+from web3 import Web3
+from web3.eth import AsyncEth
+from web3.exceptions import TransactionNotFound
+from nonce_manager import NonceManager
+from simple_storage import compile_simple_storage
+
+load_dotenv()
+
+chain_id = int(os.getenv("CHAIN_ID"))
+my_address = os.getenv("MY_ADDRESS")
+private_key = os.getenv("MY_PRIVATE_KEY")
+
+
+async def connect(provider_url, pool_size=32):
+    """
+    Async web3 whose requests all go through one pooled aiohttp session.
+    """
+    session = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=pool_size, keepalive_timeout=60)
+    )
+    provider = Web3.AsyncHTTPProvider(provider_url)
+    await provider.cache_async_session(session)
+    return Web3(provider, modules={"eth": (AsyncEth,)}, middlewares=[]), session
+
+
+class AsyncNonceManager(NonceManager):
+    """
+    NonceManager of an async web3, reading the count without blocking the loop.
+    """
+
+    def __init__(self, w3, address):
+        super().__init__(w3, address)
+        self.lock = asyncio.Lock()
+
+    async def get_pending_count(self):
+        return await self.w3.eth.get_transaction_count(self.address, "pending")
+
+    async def next(self):
+        async with self.lock:
+            if self.next_nonce is None:
+                self.next_nonce = await self.get_pending_count()
+            return self.take()
+
+    async def resync(self):
+        async with self.lock:
+            self.next_nonce = await self.get_pending_count()
+
+
+class AsyncEngine:
+    """
+    Runs SimpleStorage deploys, stores and reads as coroutines on one node.
+
+    At most `concurrency` operations are in flight, the others wait for a
+    slot. Gas estimates and receipt waits overlap freely, only the signing
+    and sending of transactions is done one at a time, in nonce order.
+    """
+
+    def __init__(self, w3, concurrency=32, poll_interval=0.1, timeout=120):
+        self.w3 = w3
+        self.slots = asyncio.Semaphore(concurrency)
+        self.send_lock = asyncio.Lock()
+        self.nonce_manager = AsyncNonceManager(w3, my_address)
+        abi, bytecode = compile_simple_storage()
+        self.simple_storage = w3.eth.contract(abi=abi, bytecode=bytecode)
+        self.poll_interval = poll_interval
+        self.timeout = timeout
+
+    async def wait_for_receipt(self, transaction_hash):
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.timeout
+        while True:
+            try:
+                return await self.w3.eth.get_transaction_receipt(transaction_hash)
+            except TransactionNotFound:
+                if loop.time() > deadline:
+                    raise
+            await asyncio.sleep(self.poll_interval)
+
+    async def send(self, transaction):
+        async with self.send_lock:
+            try:
+                transaction["nonce"] = await self.nonce_manager.next()
+                signed_transaction = Account.sign_transaction(
+                    transaction, private_key=private_key
+                )
+                return await self.w3.eth.send_raw_transaction(
+                    signed_transaction.rawTransaction
+                )
+            except Exception:
+                await self.nonce_manager.resync()
+                raise
+
+    async def transact(self, data, to=None):
+        transaction = {"from": my_address, "chainId": chain_id, "data": data}
+        if to is not None:
+            transaction["to"] = to
+        async with self.slots:
+            transaction["gasPrice"], transaction["gas"] = await asyncio.gather(
+                self.w3.eth.gas_price, self.w3.eth.estimate_gas(transaction)
+            )
+            transaction_hash = await self.send(transaction)
+            return await self.wait_for_receipt(transaction_hash)
+
+    async def deploy(self):
+        receipt = await self.transact(self.simple_storage.bytecode)
+        return receipt.contractAddress
+
+    async def store(self, address, value):
+        data = self.simple_storage.encodeABI(fn_name="store", args=[value])
+        return await self.transact(data, to=address)
+
+    async def retrieve(self, address):
+        data = self.simple_storage.encodeABI(fn_name="retrieve")
+        async with self.slots:
+            result = await self.w3.eth.call({"to": address, "data": data})
+        return int.from_bytes(result, "big")
+
+
+async def main():
+    w3, session = await connect(os.getenv("CHAIN_PROVIDER_URL"))
+    try:
+        engine = AsyncEngine(w3)
+        print("Deploying contract...")
+        address = await engine.deploy()
+        print("Contract deployed.")
+
+        print("Retrive on contract: ", await engine.retrieve(address))
+
+        print("Store a transaction by the contract...")
+        await engine.store(address, 10)
+        print("Tranaction stored.")
+
+        print("Retrive on contract: ", await engine.retrieve(address))
+    finally:
+        await session.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,76 @@
+"""
+Latency percentiles of SimpleStorage operations fanned out on one node.
+
+Deploys a few contracts, then runs stores and retrieve() reads on them all
+at once through async_deploy.AsyncEngine, against the node of .env.
+"""
+
+import asyncio
+import os
+import statistics
+import sys
+import time
+from async_deploy import AsyncEngine, connect
+
+ROW = "{:<9} {:>5} ops  p50 {:>7.1f}ms  p90 {:>7.1f}ms  p99 {:>7.1f}ms  max {:>7.1f}ms"
+
+
+async def timed(latencies, operation):
+    started_at = time.perf_counter()
+    result = await operation
+    latencies.append(time.perf_counter() - started_at)
+    return result
+
+
+def print_percentiles(name, latencies):
+    cuts = statistics.quantiles(latencies, n=100)
+    print(
+        ROW.format(
+            name,
+            len(latencies),
+            cuts[49] * 1000,
+            cuts[89] * 1000,
+            cuts[98] * 1000,
+            max(latencies) * 1000,
+        )
+    )
+
+
+async def run(contracts, stores, reads, concurrency):
+    w3, session = await connect(os.getenv("CHAIN_PROVIDER_URL"), concurrency)
+    try:
+        engine = AsyncEngine(w3, concurrency)
+        latencies = {"deploy": [], "store": [], "retrieve": []}
+
+        started_at = time.perf_counter()
+        addresses = await asyncio.gather(
+            *[timed(latencies["deploy"], engine.deploy()) for _ in range(contracts)]
+        )
+        operations = [
+            timed(latencies["store"], engine.store(addresses[i % contracts], i))
+            for i in range(stores)
+        ] + [
+            timed(latencies["retrieve"], engine.retrieve(addresses[i % contracts]))
+            for i in range(reads)
+        ]
+        await asyncio.gather(*operations)
+        elapsed = time.perf_counter() - started_at
+    finally:
+        await session.close()
+
+    for name, operation_latencies in latencies.items():
+        print_percentiles(name, operation_latencies)
+    total = contracts + stores + reads
+    print(
+        "{} ops in {:.2f}s ({:.1f} ops/s) at concurrency {}".format(
+            total, elapsed, total / elapsed, concurrency
+        )
+    )
+
+
+def main(contracts=10, stores=200, reads=500, concurrency=32):
+    asyncio.run(run(contracts, stores, reads, concurrency))
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
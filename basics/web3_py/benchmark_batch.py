@@ -0,0 +1,132 @@
+"""
+RPC round trips per transaction, through a proxy that delays every request.
+
+Sends N store() calls and N retrieve() reads, first one by one as deploy.py
+used to, then batched through rpc_batch. CHAIN_PROVIDER_URL is pointed at a
+local proxy that adds `delay_ms` to every round trip to the real node.
+"""
+
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import requests
+from dotenv import load_dotenv
+
+
+class DelayProxy:
+    def __init__(self, upstream_url, delay):
+        self.upstream_url = upstream_url
+        self.delay = delay
+        self.lock = threading.Lock()
+        self.round_trips = 0
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), self.get_handler())
+
+    def get_handler(self):
+        proxy = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers["Content-Length"]))
+                response = proxy.forward(body)
+                self.send_response(response.status_code)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(response.content)))
+                self.end_headers()
+                self.wfile.write(response.content)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+    def forward(self, body):
+        with self.lock:
+            self.round_trips += 1
+        time.sleep(self.delay)
+        return requests.post(
+            self.upstream_url,
+            data=body,
+            headers={"Content-Type": "application/json"},
+        )
+
+    @property
+    def url(self):
+        return "http://127.0.0.1:{}".format(self.server.server_address[1])
+
+    def start(self):
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def stop(self):
+        self.server.shutdown()
+
+
+def send_like_before(deploy, builder):
+    # as deploy.py did before the nonce manager and the gas price cache: gas
+    # price and nonce from the node for every transaction, then block on the
+    # receipt
+    transaction = builder.build_transaction(
+        {
+            "gasPrice": deploy.w3.eth.gas_price,
+            "chainId": deploy.chain_id,
+            "from": deploy.my_address,
+            "nonce": deploy.w3.eth.get_transaction_count(deploy.my_address),
+        }
+    )
+    signed_transaction = deploy.w3.eth.account.sign_transaction(
+        transaction, private_key=deploy.private_key
+    )
+    transaction_hash = deploy.w3.eth.send_raw_transaction(
+        signed_transaction.rawTransaction
+    )
+    return deploy.w3.eth.wait_for_transaction_receipt(transaction_hash)
+
+
+def measure(name, proxy, count, run):
+    proxy.round_trips = 0
+    started_at = time.perf_counter()
+    run()
+    elapsed = time.perf_counter() - started_at
+    print(
+        "{:<10} {:>6} round trips {:>6.2f} per tx {:>8.2f}s".format(
+            name, proxy.round_trips, proxy.round_trips / count, elapsed
+        )
+    )
+
+
+def main(count=50, delay_ms=50):
+    load_dotenv()
+    proxy = DelayProxy(os.getenv("CHAIN_PROVIDER_URL"), delay_ms / 1000)
+    proxy.start()
+    os.environ["CHAIN_PROVIDER_URL"] = proxy.url
+    # only now, so its clients connect through the proxy
+    import deploy
+
+    try:
+        simple_storage = deploy.deploy_simple_storage()
+        deploy.nonce_manager.resync()
+        builders = [simple_storage.functions.store(i) for i in range(count)]
+
+        def one_by_one():
+            for builder in builders:
+                send_like_before(deploy, builder)
+            for _ in range(count):
+                simple_storage.functions.retrieve().call()
+
+        def batched():
+            deploy.send_transactions_in_batches(builders)
+            deploy.retrieve_all([simple_storage.address] * count)
+
+        print(
+            "{} stores and {} reads, {}ms per round trip".format(count, count, delay_ms)
+        )
+        measure("one by one", proxy, count, one_by_one)
+        deploy.nonce_manager.resync()
+        measure("batched", proxy, count, batched)
+    finally:
+        proxy.stop()
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
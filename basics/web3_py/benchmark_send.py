@@ -0,0 +1,48 @@
+"""
+Transactions per second of `store` calls, sent one by one as deploy.py used
+to and pipelined.
+
+Run against a local node, e.g. `ganache --chain.chainId 1337` with the
+CHAIN_PROVIDER_URL, CHAIN_ID, MY_ADDRESS and MY_PRIVATE_KEY of deploy.py.
+"""
+
+import sys
+import time
+import deploy
+from benchmark_batch import send_like_before
+
+
+def measure(name, count, send):
+    started_at = time.perf_counter()
+    receipts = send()
+    elapsed = time.perf_counter() - started_at
+    assert len(receipts) == count and all(r.status == 1 for r in receipts)
+    print(
+        "{:<12} {:>5} txs {:>8.2f}s {:>8.1f} tx/s".format(
+            name, count, elapsed, count / elapsed
+        )
+    )
+    return count / elapsed
+
+
+def main(count=200, depth=16):
+    simple_storage = deploy.deploy_simple_storage()
+    builders = [simple_storage.functions.store(i) for i in range(count)]
+
+    one_by_one = measure(
+        "one by one",
+        count,
+        lambda: [send_like_before(deploy, b) for b in builders],
+    )
+    # the sends above went around the nonce manager
+    deploy.nonce_manager.resync()
+    pipelined = measure(
+        "pipelined",
+        count,
+        lambda: deploy.send_transactions_and_get_receipts(builders, depth),
+    )
+    print("speedup x{:.1f} at depth {}".format(pipelined / one_by_one, depth))
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
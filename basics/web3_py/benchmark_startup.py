@@ -0,0 +1,38 @@
+"""
+Startup time of deploy.py up to the point it could send its first transaction.
+
+The first run compiles into an empty cache, the following ones load the
+artifacts from it. Nothing is sent, so no node is needed.
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+
+def time_import(env):
+    started_at = time.perf_counter()
+    subprocess.run([sys.executable, "-c", "import deploy"], env=env, check=True)
+    return time.perf_counter() - started_at
+
+
+def main(runs=5):
+    with tempfile.TemporaryDirectory() as cache_dir:
+        env = {
+            "CHAIN_PROVIDER_URL": "http://127.0.0.1:8545",
+            "CHAIN_ID": "1337",
+            **os.environ,
+            "COMPILE_CACHE_DIR": cache_dir,
+        }
+        cold = time_import(env)
+        warm = [time_import(env) for _ in range(runs)]
+
+    print("cold {:>8.3f}s".format(cold))
+    print("warm {:>8.3f}s (median of {})".format(statistics.median(warm), runs))
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
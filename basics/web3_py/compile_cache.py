@@ -0,0 +1,47 @@
+import hashlib
+import json
+import os
+
+DEFAULT_CACHE_DIR = "./.compile_cache"
+
+
+def get_cache_key(standard_input, solc_version):
+    # sources and settings are both part of the standard json input
+    key = json.dumps({"input": standard_input, "solc": solc_version}, sort_keys=True)
+    return hashlib.sha256(key.encode()).hexdigest()
+
+
+def install_solc_if_missing(solc_version):
+    from solcx import get_installed_solc_versions, install_solc
+
+    installed = {str(version) for version in get_installed_solc_versions()}
+    if solc_version not in installed:
+        install_solc(solc_version)
+
+
+def compile_standard_cached(standard_input, solc_version, cache_dir=None):
+    """
+    `solcx.compile_standard`, with its output cached on disk by input hash.
+
+    solcx is only imported on a cache miss, so a warm start pays for neither
+    the compiler nor its import.
+    """
+    cache_dir = cache_dir or os.getenv("COMPILE_CACHE_DIR", DEFAULT_CACHE_DIR)
+    path = os.path.join(
+        cache_dir, get_cache_key(standard_input, solc_version) + ".json"
+    )
+    if os.path.exists(path):
+        with open(path, "r") as file:
+            return json.load(file), False
+
+    from solcx import compile_standard
+
+    install_solc_if_missing(solc_version)
+    compiled = compile_standard(standard_input, solc_version=solc_version)
+
+    os.makedirs(cache_dir, exist_ok=True)
+    temporary_path = path + ".tmp"
+    with open(temporary_path, "w") as file:
+        json.dump(compiled, file)
+    os.replace(temporary_path, path)
+    return compiled, True
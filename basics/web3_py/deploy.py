@@ -1,36 +1,13 @@
-import json
 import os
-from solcx import compile_standard, install_solc
 from web3 import Web3
 from dotenv import load_dotenv
+from nonce_manager import NonceManager, PipelinedSender
+from rpc_batch import BatchClient, BatchSender
+from simple_storage import compile_simple_storage
 
 load_dotenv()
 
-with open("./SimpleStorage.sol", "r") as file:
-    simple_storage_file = file.read()
-
-install_solc("0.6.0")
-compiled_sol = compile_standard(
-    {
-        "language": "Solidity",
-        "sources": {"SimpleStorage.sol": {"content": simple_storage_file}},
-        "settings": {
-            "outputSelection": {
-                "*": {"*": ["abi", "metadata", "evm.bytecode", "evm.sourceMap"]}
-            }
-        },
-    },
-    solc_version="0.6.0",
-)
-
-with open("./compiled_code.json", "w") as file:
-    json.dump(compiled_sol, file)
-
-bytecode = compiled_sol["contracts"]["SimpleStorage.sol"]["SimpleStorage"]["evm"][
-    "bytecode"
-]["object"]
-
-abi = compiled_sol["contracts"]["SimpleStorage.sol"]["SimpleStorage"]["abi"]
+abi, bytecode = compile_simple_storage()
 
 w3 = Web3(Web3.HTTPProvider(os.getenv("CHAIN_PROVIDER_URL")))
 chain_id = int(os.getenv("CHAIN_ID"))
@@ -38,14 +15,16 @@ my_address = os.getenv("MY_ADDRESS")
 private_key = os.getenv("MY_PRIVATE_KEY")
 
 SimpleStorage = w3.eth.contract(abi=abi, bytecode=bytecode)
+nonce_manager = NonceManager(w3, my_address)
+rpc_client = BatchClient(os.getenv("CHAIN_PROVIDER_URL"))
 
 
 def get_transaction_build_params():
     return {
-        "gasPrice": w3.eth.gas_price,
+        "gasPrice": rpc_client.get_gas_price(),
         "chainId": chain_id,
         "from": my_address,
-        "nonce": w3.eth.getTransactionCount(my_address),
+        "nonce": nonce_manager.next(),
     }
 
 
@@ -55,28 +34,58 @@ def get_signed_transaction(builder):
 
 
 def send_transaction_and_get_receipt(builder):
-    signed_transaction = get_signed_transaction(builder)
-    transaction_hash = w3.eth.send_raw_transaction(signed_transaction.rawTransaction)
+    try:
+        signed_transaction = get_signed_transaction(builder)
+        transaction_hash = w3.eth.send_raw_transaction(
+            signed_transaction.rawTransaction
+        )
+    except Exception:
+        nonce_manager.resync()
+        raise
     return w3.eth.wait_for_transaction_receipt(transaction_hash)
 
 
-print("Deploying contract...")
-contract_creation_transaction_receipt = send_transaction_and_get_receipt(
-    SimpleStorage.constructor()
-)
-print("Contract deployed.")
+def send_transactions_and_get_receipts(builders, depth=16):
+    sender = PipelinedSender(w3, nonce_manager, private_key, chain_id, depth)
+    return sender.send_all(builders)
+
+
+def get_batch_sender():
+    return BatchSender(rpc_client, nonce_manager, private_key, chain_id)
+
+
+def send_transactions_in_batches(builders, batch_size=50):
+    sender = get_batch_sender()
+    receipts = []
+    for start in range(0, len(builders), batch_size):
+        receipts.extend(sender.send_all(builders[start : start + batch_size]))
+    return receipts
+
+
+def retrieve_all(addresses):
+    data = SimpleStorage.encodeABI(fn_name="retrieve")
+    results = get_batch_sender().call_all([(address, data) for address in addresses])
+    return [int(result, 16) for result in results]
+
+
+def deploy_simple_storage():
+    receipt = send_transaction_and_get_receipt(SimpleStorage.constructor())
+    return w3.eth.contract(address=receipt.contractAddress, abi=abi)
+
+
+def main():
+    print("Deploying contract...")
+    simple_storage = deploy_simple_storage()
+    print("Contract deployed.")
 
-simple_storage = w3.eth.contract(
-    address=contract_creation_transaction_receipt.contractAddress, abi=abi
-)
+    print("Retrive on contract: ", simple_storage.functions.retrieve().call())
 
-print("Retrive on contract: ", simple_storage.functions.retrieve().call())
+    print("Store a transaction by the contract...")
+    send_transaction_and_get_receipt(simple_storage.functions.store(10))
+    print("Tranaction stored.")
 
+    print("Retrive on contract: ", simple_storage.functions.retrieve().call())
 
-print("Store a transaction by the contract...")
-transaction_receipt = send_transaction_and_get_receipt(
-    simple_storage.functions.store(10)
-)
-print("Tranaction stored.")
 
-print("Retrive on contract: ", simple_storage.functions.retrieve().call())
+if __name__ == "__main__":
+    main()
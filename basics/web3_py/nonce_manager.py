@@ -0,0 +1,104 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+
+class NonceManager:
+    """
+    Hands out the nonces of one account without asking the node every time.
+
+    The pending transaction count is read once and then counted locally.
+    `resync` reads it again, after a send failed and the local count may be
+    ahead of or behind the node.
+    """
+
+    def __init__(self, w3, address):
+        self.w3 = w3
+        self.address = address
+        self.lock = threading.Lock()
+        self.next_nonce = None
+
+    def get_pending_count(self):
+        return self.w3.eth.get_transaction_count(self.address, "pending")
+
+    def take(self):
+        # only with the lock held and the count read
+        nonce = self.next_nonce
+        self.next_nonce += 1
+        return nonce
+
+    def next(self):
+        with self.lock:
+            if self.next_nonce is None:
+                self.next_nonce = self.get_pending_count()
+            return self.take()
+
+    def resync(self):
+        with self.lock:
+            self.next_nonce = self.get_pending_count()
+
+
+class PipelinedSender:
+    """
+    Sends signed transactions back to back, up to `depth` of them unconfirmed.
+
+    Receipts are waited for on a pool of threads, so the next transaction is
+    signed and sent while the previous ones are being mined.
+    """
+
+    def __init__(self, w3, nonce_manager, private_key, chain_id, depth=16, timeout=120):
+        self.w3 = w3
+        self.nonce_manager = nonce_manager
+        self.private_key = private_key
+        self.chain_id = chain_id
+        self.depth = depth
+        self.timeout = timeout
+
+    def sign(self, builder, nonce, gas_price):
+        transaction = builder.build_transaction(
+            {
+                "gasPrice": gas_price,
+                "chainId": self.chain_id,
+                "from": self.nonce_manager.address,
+                "nonce": nonce,
+            }
+        )
+        return self.w3.eth.account.sign_transaction(
+            transaction, private_key=self.private_key
+        )
+
+    def send(self, builder, gas_price):
+        nonce = self.nonce_manager.next()
+        try:
+            signed_transaction = self.sign(builder, nonce, gas_price)
+            return self.w3.eth.send_raw_transaction(signed_transaction.rawTransaction)
+        except Exception:
+            # the nonce may or may not have reached the node, only it knows
+            self.nonce_manager.resync()
+            raise
+
+    def wait_for_receipt(self, transaction_hash):
+        try:
+            return self.w3.eth.wait_for_transaction_receipt(
+                transaction_hash, timeout=self.timeout
+            )
+        except Exception:
+            # a dropped transaction leaves a gap the following nonces wait on
+            self.nonce_manager.resync()
+            raise
+
+    def send_all(self, builders):
+        gas_price = self.w3.eth.gas_price
+        in_flight = threading.BoundedSemaphore(self.depth)
+        receipts = []
+        with ThreadPoolExecutor(max_workers=self.depth) as pool:
+            for builder in builders:
+                in_flight.acquire()
+                try:
+                    transaction_hash = self.send(builder, gas_price)
+                except Exception:
+                    in_flight.release()
+                    raise
+                receipt = pool.submit(self.wait_for_receipt, transaction_hash)
+                receipt.add_done_callback(lambda _: in_flight.release())
+                receipts.append(receipt)
+            return [receipt.result() for receipt in receipts]
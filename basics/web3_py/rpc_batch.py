@@ -0,0 +1,194 @@
+import itertools
+import threading
+import time
+import requests
+from eth_account import Account
+
+
+class RpcError(ValueError):
+    pass
+
+
+class BatchClient:
+    """
+    Thin JSON-RPC client that sends independent requests as one batch.
+
+    Results of `cached` methods, like the gas price and the fee history, are
+    kept for `ttl` seconds and shared by every transaction built in the
+    meantime.
+    """
+
+    def __init__(self, url, ttl=2.0, timeout=30):
+        self.url = url
+        self.ttl = ttl
+        self.timeout = timeout
+        self.session = requests.Session()
+        self.ids = itertools.count()
+        self.lock = threading.Lock()
+        self.cache = {}
+
+    def post(self, payload):
+        response = self.session.post(self.url, json=payload, timeout=self.timeout)
+        response.raise_for_status()
+        return response.json()
+
+    def batch(self, calls):
+        """
+        Results of `(method, params)` calls, in order, from one round trip.
+        """
+        if not calls:
+            return []
+        requests_by_id = {
+            next(self.ids): {"jsonrpc": "2.0", "method": method, "params": params}
+            for method, params in calls
+        }
+        payload = [{"id": i, **request} for i, request in requests_by_id.items()]
+        result = self.post(payload)
+        if not isinstance(result, list):
+            # the node rejected the batch as a whole
+            raise RpcError(result.get("error", result))
+        responses = {response["id"]: response for response in result}
+
+        results = []
+        for i in requests_by_id:
+            if "error" in responses[i]:
+                raise RpcError(responses[i]["error"])
+            results.append(responses[i]["result"])
+        return results
+
+    def call(self, method, params=[]):
+        return self.batch([(method, params)])[0]
+
+    def cached(self, method, params=[]):
+        key = (method, repr(params))
+        with self.lock:
+            entry = self.cache.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+
+        result = self.call(method, params)
+        with self.lock:
+            self.cache[key] = (time.monotonic() + self.ttl, result)
+        return result
+
+    def get_gas_price(self):
+        return int(self.cached("eth_gasPrice"), 16)
+
+    def get_fee_history(self, block_count=5, reward_percentiles=[50]):
+        fee_history = self.cached(
+            "eth_feeHistory", [hex(block_count), "latest", reward_percentiles]
+        )
+        return {
+            "base_fees": [int(fee, 16) for fee in fee_history["baseFeePerGas"]],
+            "rewards": [
+                [int(reward, 16) for reward in block_rewards]
+                for block_rewards in fee_history.get("reward", [])
+            ],
+        }
+
+    def close(self):
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+def to_rpc_call(transaction):
+    return {
+        key: hex(value) if isinstance(value, int) else value
+        for key, value in transaction.items()
+        if key in ["from", "to", "data", "value"]
+    }
+
+
+class BatchSender:
+    """
+    Sends transactions in batches over a BatchClient.
+
+    One batch estimates the gas of all of them, one sends them all signed,
+    and receipts are polled for all pending hashes at once. Receipts are the
+    raw JSON-RPC results, with hex encoded numbers.
+    """
+
+    def __init__(self, client, nonce_manager, private_key, chain_id):
+        self.client = client
+        self.nonce_manager = nonce_manager
+        self.private_key = private_key
+        self.chain_id = chain_id
+
+    def build(self, builder, gas_price):
+        # every field is given, so building the transaction is offline
+        return builder.build_transaction(
+            {
+                "gas": 0,
+                "gasPrice": gas_price,
+                "chainId": self.chain_id,
+                "from": self.nonce_manager.address,
+                "nonce": 0,
+            }
+        )
+
+    def estimate_gas(self, transactions):
+        estimates = self.client.batch(
+            [("eth_estimateGas", [to_rpc_call(t)]) for t in transactions]
+        )
+        return [int(estimate, 16) for estimate in estimates]
+
+    def sign(self, transaction, gas):
+        transaction = {**transaction, "gas": gas, "nonce": self.nonce_manager.next()}
+        return Account.sign_transaction(transaction, private_key=self.private_key)
+
+    def send_all(self, builders):
+        gas_price = self.client.get_gas_price()
+        transactions = [self.build(builder, gas_price) for builder in builders]
+        signed_transactions = [
+            self.sign(transaction, gas)
+            for transaction, gas in zip(transactions, self.estimate_gas(transactions))
+        ]
+        try:
+            transaction_hashes = self.client.batch(
+                [
+                    ("eth_sendRawTransaction", [signed.rawTransaction.hex()])
+                    for signed in signed_transactions
+                ]
+            )
+        except Exception:
+            # part of the batch may have been accepted
+            self.nonce_manager.resync()
+            raise
+        return self.wait_for_receipts(transaction_hashes)
+
+    def wait_for_receipts(self, transaction_hashes, poll_interval=0.1, timeout=120):
+        receipts = {}
+        deadline = time.monotonic() + timeout
+        while True:
+            pending = [h for h in transaction_hashes if h not in receipts]
+            results = self.client.batch(
+                [("eth_getTransactionReceipt", [h]) for h in pending]
+            )
+            receipts.update(
+                (h, receipt) for h, receipt in zip(pending, results) if receipt
+            )
+            if len(receipts) == len(transaction_hashes):
+                return [receipts[h] for h in transaction_hashes]
+            if time.monotonic() > deadline:
+                raise TimeoutError(
+                    "{} transactions not mined".format(
+                        len(transaction_hashes) - len(receipts)
+                    )
+                )
+            time.sleep(poll_interval)
+
+    def call_all(self, calls):
+        """
+        `eth_call` results of `(address, data)` pairs, from one round trip.
+        """
+        return self.client.batch(
+            [
+                ("eth_call", [{"to": address, "data": data}, "latest"])
+                for address, data in calls
+            ]
+        )
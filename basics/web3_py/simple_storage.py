@@ -0,0 +1,30 @@
+import json
+from compile_cache import compile_standard_cached
+
+
+def compile_simple_storage():
+    """
+    abi and bytecode of SimpleStorage.sol, from the compile cache if it has them.
+    """
+    with open("./SimpleStorage.sol", "r") as file:
+        simple_storage_file = file.read()
+
+    compiled_sol, is_compiled = compile_standard_cached(
+        {
+            "language": "Solidity",
+            "sources": {"SimpleStorage.sol": {"content": simple_storage_file}},
+            "settings": {
+                "outputSelection": {
+                    "*": {"*": ["abi", "metadata", "evm.bytecode", "evm.sourceMap"]}
+                }
+            },
+        },
+        "0.6.0",
+    )
+
+    if is_compiled:
+        with open("./compiled_code.json", "w") as file:
+            json.dump(compiled_sol, file)
+
+    simple_storage = compiled_sol["contracts"]["SimpleStorage.sol"]["SimpleStorage"]
+    return simple_storage["abi"], simple_storage["evm"]["bytecode"]["object"]
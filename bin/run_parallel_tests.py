@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+"""
+Runs the unit tests of the brownie projects across parallel workers.
+
+Test modules are sharded by their last known duration. Every worker runs its
+shards in its own copy of each project, on its own development chain and
+port, and the junit reports of all workers are merged into one.
+"""
+
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import xml.etree.ElementTree as ElementTree
+from concurrent.futures import ThreadPoolExecutor
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PROJECTS = {
+    "stake-yield": "tests/unit",
+    "lottery_app": "tests/unit",
+    "nft": "tests/unit",
+    "basics/brownie/fund_me": "tests",
+    "basics/brownie/upgrades": "tests",
+}
+DURATIONS_PATH = os.path.join(ROOT, ".test_durations.json")
+# modules that never ran yet are assumed to deploy a few contracts
+DEFAULT_DURATION = 10.0
+NO_TESTS_COLLECTED = 5
+NOT_COPIED = shutil.ignore_patterns(
+    ".git", "node_modules", "__pycache__", ".pytest_cache", "reports"
+)
+
+
+def find_test_modules(project):
+    project_dir = os.path.join(ROOT, project)
+    modules = []
+    for directory, _, filenames in os.walk(
+        os.path.join(project_dir, PROJECTS[project])
+    ):
+        for filename in filenames:
+            if filename.startswith("test_") and filename.endswith(".py"):
+                path = os.path.join(directory, filename)
+                modules.append(os.path.relpath(path, project_dir))
+    return sorted(modules)
+
+
+def load_durations():
+    if not os.path.exists(DURATIONS_PATH):
+        return {}
+    with open(DURATIONS_PATH, "r") as file:
+        return json.load(file)
+
+
+def save_durations(durations):
+    temporary_path = DURATIONS_PATH + ".tmp"
+    with open(temporary_path, "w") as file:
+        json.dump(durations, file, indent=2, sort_keys=True)
+    os.replace(temporary_path, DURATIONS_PATH)
+
+
+def get_duration(durations, project, module):
+    return durations.get("{}/{}".format(project, module), DEFAULT_DURATION)
+
+
+def shard(modules, workers, durations):
+    """
+    Longest modules first, each to the least loaded worker.
+
+    Returns the {project: [modules]} runs of every worker.
+    """
+    loads = [0.0] * workers
+    shards = [{} for _ in range(workers)]
+    by_duration = sorted(
+        modules, key=lambda module: get_duration(durations, *module), reverse=True
+    )
+    for project, module in by_duration:
+        worker = loads.index(min(loads))
+        loads[worker] += get_duration(durations, project, module)
+        shards[worker].setdefault(project, []).append(module)
+    return shards
+
+
+def compile_project(project):
+    # workers copy the build folder, so it has to be up to date before they start
+    result = subprocess.run(
+        ["brownie", "compile"],
+        cwd=os.path.join(ROOT, project),
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError("{} failed to compile:\n{}".format(project, result.stdout))
+
+
+def copy_project(project, worker_dir):
+    # brownie test writes build/tests.json and reports/ inside the project,
+    # workers running modules of the same project would overwrite each other
+    project_dir = os.path.join(worker_dir, project)
+    shutil.copytree(os.path.join(ROOT, project), project_dir, ignore=NOT_COPIED)
+    # the copies find /shared at the same relative path as the originals
+    shared_dir = os.path.join(worker_dir, "shared")
+    if not os.path.exists(shared_dir):
+        shutil.copytree(os.path.join(ROOT, "shared"), shared_dir, ignore=NOT_COPIED)
+    return project_dir
+
+
+def run_worker(worker, runs, port, report_dir):
+    results = []
+    for project, modules in sorted(runs.items()):
+        name = "{}-{}".format(worker, project.replace("/", "-"))
+        project_dir = copy_project(project, os.path.join(report_dir, str(worker)))
+        report_path = os.path.join(report_dir, name + ".xml")
+        log_path = os.path.join(report_dir, name + ".log")
+        started_at = time.perf_counter()
+        with open(log_path, "w") as log:
+            returncode = subprocess.call(
+                ["brownie", "test", *modules, "--network", "development"]
+                + ["--junitxml", report_path],
+                cwd=project_dir,
+                env={**os.environ, "DEVELOPMENT_PORT": str(port)},
+                stdout=log,
+                stderr=subprocess.STDOUT,
+            )
+        results.append(
+            {
+                "worker": worker,
+                "project": project,
+                "modules": modules,
+                "returncode": returncode,
+                "seconds": time.perf_counter() - started_at,
+                "report_path": report_path,
+                "log_path": log_path,
+            }
+        )
+    return results
+
+
+def get_testcases(result):
+    if not os.path.exists(result["report_path"]):
+        return []
+    testcases = ElementTree.parse(result["report_path"]).getroot().iter("testcase")
+    testcases = list(testcases)
+    for testcase in testcases:
+        testcase.set(
+            "classname", "{}.{}".format(result["project"], testcase.get("classname"))
+        )
+    return testcases
+
+
+def get_outcome(testcase):
+    for outcome in ["failure", "error", "skipped"]:
+        if testcase.find(outcome) is not None:
+            return outcome
+    return "passed"
+
+
+def get_module(testcase, project):
+    # classname is the dotted module path, prefixed with the project above
+    classname = testcase.get("classname")[len(project) + 1 :]
+    return "{}/{}.py".format(project, classname.replace(".", "/"))
+
+
+def merge_reports(results):
+    counts = {"passed": 0, "failure": 0, "error": 0, "skipped": 0}
+    durations = {}
+    suite = ElementTree.Element("testsuite", name="unit")
+    for result in results:
+        testcases = get_testcases(result)
+        if result["returncode"] not in (0, NO_TESTS_COLLECTED) and not any(
+            get_outcome(testcase) in ("failure", "error") for testcase in testcases
+        ):
+            # the worker died before it could report, keep it from passing
+            testcase = ElementTree.SubElement(
+                suite, "testcase", classname=result["project"], name="worker"
+            )
+            ElementTree.SubElement(testcase, "error", message=result["log_path"])
+            counts["error"] += 1
+        for testcase in testcases:
+            suite.append(testcase)
+            counts[get_outcome(testcase)] += 1
+            module = get_module(testcase, result["project"])
+            durations[module] = durations.get(module, 0) + float(
+                testcase.get("time", 0)
+            )
+
+    suite.set("tests", str(sum(counts.values())))
+    suite.set("failures", str(counts["failure"]))
+    suite.set("errors", str(counts["error"]))
+    suite.set("skipped", str(counts["skipped"]))
+    report = ElementTree.Element("testsuites")
+    report.append(suite)
+    return report, counts, durations
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("-n", "--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--base-port", type=int, default=8600)
+    parser.add_argument("--junitxml", help="where to write the merged report")
+    parser.add_argument("projects", nargs="*", default=list(PROJECTS))
+    args = parser.parse_args()
+
+    started_at = time.perf_counter()
+    modules = [
+        (project, module)
+        for project in args.projects
+        for module in find_test_modules(project)
+    ]
+    durations = load_durations()
+    shards = [runs for runs in shard(modules, args.workers, durations) if runs]
+    if not shards:
+        print("No test modules found")
+        return 0
+
+    with ThreadPoolExecutor(max_workers=len(args.projects)) as pool:
+        list(pool.map(compile_project, args.projects))
+
+    with tempfile.TemporaryDirectory() as report_dir:
+        with ThreadPoolExecutor(max_workers=len(shards)) as pool:
+            workers = pool.map(
+                lambda worker: run_worker(
+                    worker, shards[worker], args.base_port + worker, report_dir
+                ),
+                range(len(shards)),
+            )
+            results = [result for worker in workers for result in worker]
+
+        report, counts, module_durations = merge_reports(results)
+        if args.junitxml:
+            ElementTree.ElementTree(report).write(args.junitxml)
+
+        failed = [
+            result
+            for result in results
+            if result["returncode"] not in (0, NO_TESTS_COLLECTED)
+        ]
+        for result in failed:
+            print("== worker {} {}".format(result["worker"], result["project"]))
+            with open(result["log_path"], "r") as log:
+                print(log.read())
+
+    save_durations({**durations, **module_durations})
+
+    for result in results:
+        print(
+            "worker {} port {} {:<24} {:>3} modules {:>8.2f}s".format(
+                result["worker"],
+                args.base_port + result["worker"],
+                result["project"],
+                len(result["modules"]),
+                result["seconds"],
+            )
+        )
+    print(
+        "{} passed, {} skipped, {} failed, {} errors in {:.2f}s on {} workers".format(
+            counts["passed"],
+            counts["skipped"],
+            counts["failure"],
+            counts["error"],
+            time.perf_counter() - started_at,
+            len(shards),
+        )
+    )
+    return 1 if failed or counts["failure"] or counts["error"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
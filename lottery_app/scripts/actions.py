@@ -1,5 +1,7 @@
-import time
-from scripts.helpers import get_account
+from scripts.dependencies import get_mock_contract
+from scripts.helpers import get_account, is_local_network
+from vrf import wait_for_request_of
+from vrf_fulfiller import auto_fulfill
 from brownie import Lottery
 
 
@@ -15,15 +17,24 @@ def join():
     lottery.join({"from": account, "value": lottery.getEntryFeeInWei()})
 
 
-def end():
+def end(fulfiller=None):
     account = get_account()
     lottery = Lottery[-1]
-    lottery.end({"from": account})
-    time.sleep(60)
+    end_tx = lottery.end({"from": account})
+    if is_local_network() and fulfiller is None:
+        # nothing fulfills the mock in the background, so do it here
+        get_mock_contract("vrf_coordinator").fulfillRandomWords(
+            end_tx.events["RandomNumberRequested"]["requestId"],
+            lottery.address,
+            {"from": account},
+        )
+    else:
+        wait_for_request_of(end_tx, "RandomNumberRequested")
     print(f"Winner is: {lottery.winner()}")
 
 
 def main():
-    start()
-    join()
-    end()
+    with auto_fulfill() as fulfiller:
+        start()
+        join()
+        end(fulfiller)
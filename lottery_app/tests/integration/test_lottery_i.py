@@ -1,5 +1,5 @@
-import time
 from scripts.deploy import deploy
+from vrf import wait_for_request_of
 from scripts.helpers import get_account, is_local_network
 import pytest
 
@@ -14,8 +14,8 @@ def test_full_lottery():
 
     expected_new_balance = lottery.balance() + get_account().balance()
 
-    lottery.end({"from": get_account()})
-    time.sleep(60)
+    end_tx = lottery.end({"from": get_account()})
+    wait_for_request_of(end_tx, "RandomNumberRequested")
 
     assert lottery.winner() == get_account().address
     assert lottery.balance() == 0
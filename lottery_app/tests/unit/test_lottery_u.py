@@ -6,12 +6,25 @@ from scripts.deploy import deploy
 import pytest
 
 
-def test_entry_fee():
+@pytest.fixture(scope="module", autouse=True)
+def shared_setup(request):
     if is_not_local_network():
         pytest.skip()
+    request.getfixturevalue("module_isolation")
 
-    lottery = deploy()
 
+@pytest.fixture(autouse=True)
+def isolation(shared_setup, fn_isolation):
+    # the lottery is deployed once, every test reverts to it in one call
+    pass
+
+
+@pytest.fixture(scope="module")
+def lottery(shared_setup):
+    return deploy()
+
+
+def test_entry_fee(lottery):
     today_price = 2000
     expected_eth = 10 / today_price
     expected_wei = str(Web3.toWei(expected_eth, "ether"))
@@ -22,22 +35,12 @@ def test_entry_fee():
     assert actual_wei[0:2] == expected_wei[0:2]
 
 
-def test_cant_join_unless_started():
-    if is_not_local_network():
-        pytest.skip()
-
-    lottery = deploy()
-
+def test_cant_join_unless_started(lottery):
     with pytest.raises(exceptions.VirtualMachineError):
         lottery.join({"from": get_account(), "value": lottery.getEntryFeeInWei()})
 
 
-def test_only_owner_can_start():
-    if is_not_local_network():
-        pytest.skip()
-
-    lottery = deploy()
-
+def test_only_owner_can_start(lottery):
     with pytest.raises(exceptions.VirtualMachineError):
         lottery.start({"from": accounts[1]})
 
@@ -45,22 +48,14 @@ def test_only_owner_can_start():
     assert lottery.getStatus() == "Open"
 
 
-def test_can_started_only_in_closed_status():
-    if is_not_local_network():
-        pytest.skip()
-
-    lottery = deploy()
+def test_can_started_only_in_closed_status(lottery):
     lottery.start({"from": get_account()})
 
     with pytest.raises(exceptions.VirtualMachineError):
         lottery.start({"from": get_account()})
 
 
-def test_cant_join_with_wrong_entry_fee():
-    if is_not_local_network():
-        pytest.skip()
-
-    lottery = deploy()
+def test_cant_join_with_wrong_entry_fee(lottery):
     lottery.start({"from": get_account()})
 
     with pytest.raises(exceptions.VirtualMachineError):
@@ -68,11 +63,7 @@ def test_cant_join_with_wrong_entry_fee():
         lottery.join({"from": get_account(), "value": lottery.getEntryFeeInWei() + 100})
 
 
-def test_can_join():
-    if is_not_local_network():
-        pytest.skip()
-
-    lottery = deploy()
+def test_can_join(lottery):
     lottery.start({"from": get_account()})
     lottery.join({"from": get_account(), "value": lottery.getEntryFeeInWei()})
     assert lottery.players(0) == get_account().address
@@ -81,11 +72,7 @@ def test_can_join():
     assert lottery.players(1) == accounts[1].address
 
 
-def test_only_owner_can_end():
-    if is_not_local_network():
-        pytest.skip()
-
-    lottery = deploy()
+def test_only_owner_can_end(lottery):
     lottery.start({"from": get_account()})
 
     with pytest.raises(exceptions.VirtualMachineError):
@@ -95,12 +82,7 @@ def test_only_owner_can_end():
     assert lottery.getStatus() == "Calculating Winner"
 
 
-def test_can_ended_only_in_open_status():
-    if is_not_local_network():
-        pytest.skip()
-
-    lottery = deploy()
-
+def test_can_ended_only_in_open_status(lottery):
     with pytest.raises(exceptions.VirtualMachineError):
         lottery.end({"from": get_account()})
 
@@ -109,11 +91,7 @@ def test_can_ended_only_in_open_status():
     assert lottery.getStatus() == "Calculating Winner"
 
 
-def test_end_should_choose_winner():
-    if is_not_local_network():
-        pytest.skip()
-
-    lottery = deploy()
+def test_end_should_choose_winner(lottery):
     lottery.start({"from": get_account()})
     lottery.join({"from": get_account(), "value": lottery.getEntryFeeInWei()})
     lottery.join({"from": accounts[1], "value": lottery.getEntryFeeInWei()})
@@ -0,0 +1,49 @@
+from brownie import accounts
+from scripts.dependencies import get_mock_contract
+from scripts.helpers import is_not_local_network, get_account
+from scripts.deploy import deploy
+from vrf import get_fulfillment, wait_for, wait_for_request_of
+import pytest
+
+
+def start_and_end_lottery():
+    lottery = deploy()
+    lottery.start({"from": get_account()})
+    lottery.join({"from": accounts[1], "value": lottery.getEntryFeeInWei()})
+    return lottery, lottery.end({"from": get_account()})
+
+
+def test_wait_for_fulfilled_request():
+    if is_not_local_network():
+        pytest.skip()
+
+    lottery, end_tx = start_and_end_lottery()
+    get_mock_contract("vrf_coordinator").fulfillRandomWordsWithOverride(
+        end_tx.events["RandomNumberRequested"]["requestId"],
+        lottery.address,
+        [8],
+        {"from": get_account()},
+    )
+
+    fulfillment = wait_for_request_of(end_tx, "RandomNumberRequested")
+
+    assert fulfillment["success"]
+    assert lottery.winner() == accounts[1].address
+
+
+def test_wait_for_pending_request_times_out():
+    if is_not_local_network():
+        pytest.skip()
+
+    _, end_tx = start_and_end_lottery()
+    request_id = end_tx.events["RandomNumberRequested"]["requestId"]
+    coordinator = get_mock_contract("vrf_coordinator")
+
+    with pytest.raises(TimeoutError):
+        wait_for(
+            lambda: get_fulfillment(
+                coordinator.address, request_id, end_tx.block_number
+            ),
+            timeout=0.3,
+            initial_interval=0.1,
+        )
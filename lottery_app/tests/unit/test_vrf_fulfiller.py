@@ -0,0 +1,61 @@
+from brownie import accounts, exceptions
+from scripts.dependencies import get_mock_contract
+from scripts.helpers import is_not_local_network, get_account
+from scripts.deploy import deploy
+from vrf import wait_for_request_of
+from vrf_fulfiller import AutoFulfiller, get_seeded_words
+import pytest
+
+
+def test_auto_fulfiller_ends_lottery():
+    if is_not_local_network():
+        pytest.skip()
+
+    lottery = deploy()
+    lottery.start({"from": get_account()})
+    lottery.join({"from": accounts[1], "value": lottery.getEntryFeeInWei()})
+    lottery.join({"from": accounts[2], "value": lottery.getEntryFeeInWei()})
+
+    fulfiller = AutoFulfiller(
+        get_mock_contract("vrf_coordinator"), accounts[-1], interval=0.05, seed=7
+    ).start()
+    try:
+        end_tx = lottery.end({"from": get_account()})
+        wait_for_request_of(end_tx, "RandomNumberRequested")
+    finally:
+        fulfiller.stop()
+
+    request_id = end_tx.events["RandomNumberRequested"]["requestId"]
+    expected_winner = accounts[1 + get_seeded_words(7, request_id, 1)[0] % 2]
+    assert fulfiller.fulfilled == 1
+    assert lottery.winner() == expected_winner.address
+    assert lottery.getStatus() == "Closed"
+
+
+def test_auto_fulfiller_skips_only_fulfilled_requests():
+    if is_not_local_network():
+        pytest.skip()
+
+    lottery = deploy()
+    coordinator = get_mock_contract("vrf_coordinator")
+    lottery.start({"from": get_account()})
+    lottery.join({"from": accounts[1], "value": lottery.getEntryFeeInWei()})
+    end_tx = lottery.end({"from": get_account()})
+    request = {
+        "request_id": end_tx.events["RandomNumberRequested"]["requestId"],
+        "consumer": lottery.address,
+        "num_words": 1,
+    }
+    fulfiller = AutoFulfiller(coordinator, accounts[-1], seed=7)
+
+    # a request for a word count the mock doesn't expect reverts otherwise
+    with pytest.raises((exceptions.VirtualMachineError, ValueError)):
+        fulfiller.fulfill_batch([{**request, "num_words": 2}])
+
+    coordinator.fulfillRandomWords(
+        request["request_id"], lottery, {"from": get_account()}
+    )
+    fulfiller.fulfill_batch([request])
+
+    assert fulfiller.fulfilled == 0
+    assert lottery.getStatus() == "Closed"
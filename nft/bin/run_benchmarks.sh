@@ -0,0 +1,9 @@
+#  benchmarks against a local stand-in IPFS server
+python -m scripts.benchmarks.ipfs_upload
+python -m scripts.benchmarks.streaming_upload
+
+#  token scans and gas on development
+brownie run scripts/benchmarks/token_scan.py
+brownie run scripts/benchmarks/token_uri_gas.py
+brownie run scripts/benchmarks/batch_mint.py
+brownie run scripts/benchmarks/vrf_load.py
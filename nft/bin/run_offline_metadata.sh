@@ -0,0 +1,3 @@
+#  set `ipfs_upload.offline: true` in brownie-config.yaml, then
+brownie run scripts/advanced_collectible/create_metadata.py --network rinkeby
+brownie run scripts/advanced_collectible/pin_car.py --network rinkeby
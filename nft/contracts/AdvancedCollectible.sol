@@ -3,11 +3,14 @@ pragma solidity ^0.8.0;
 
 import "@openzeppelin/contracts/token/ERC721/extensions/ERC721URIStorage.sol";
 import "@openzeppelin/contracts/utils/Counters.sol";
+import "@openzeppelin/contracts/utils/Strings.sol";
+import "@openzeppelin/contracts/access/Ownable.sol";
 import "@chainlink/contracts/src/v0.8/interfaces/VRFCoordinatorV2Interface.sol";
 import "@chainlink/contracts/src/v0.8/VRFConsumerBaseV2.sol";
 
-contract AdvancedCollectible is ERC721URIStorage, VRFConsumerBaseV2 {
+contract AdvancedCollectible is ERC721URIStorage, VRFConsumerBaseV2, Ownable {
     using Counters for Counters.Counter;
+    using Strings for uint256;
     Counters.Counter private _tokenIds;
 
     enum Breed {
@@ -21,6 +24,13 @@ contract AdvancedCollectible is ERC721URIStorage, VRFConsumerBaseV2 {
     VRFCoordinatorV2Interface internal vrf;
     bytes32 internal vrfKey;
     uint64 internal sId;
+    string internal baseURI;
+
+    // 20000 + 100000 * 24 stays under the 2.5M callback gas of live coordinators
+    uint32 internal constant MAX_BATCH_SIZE = 24;
+    uint32 internal constant CREATE_CALLBACK_GAS = 100000;
+    uint32 internal constant CALLBACK_BASE_GAS = 20000;
+    uint32 internal constant CALLBACK_GAS_PER_TOKEN = 100000;
 
     event RequestedCollectible(uint256 requestId, address sender);
     event BreedAssigned(uint256 tokenId, Breed breed);
@@ -36,24 +46,63 @@ contract AdvancedCollectible is ERC721URIStorage, VRFConsumerBaseV2 {
     }
 
     function create() public returns (uint256) {
-        uint256 requestId = vrf.requestRandomWords(vrfKey, sId, 3, 100000, 1);
+        return requestCollectibles(1, CREATE_CALLBACK_GAS);
+    }
+
+    /**
+     * Mints `_count` tokens with a single VRF request of `_count` words.
+     * The callback gas limit grows with the batch, up to getMaxBatchSize().
+     */
+    function createBatch(uint32 _count) public returns (uint256) {
+        require(_count > 0, "Count must be greater than 0.");
+        require(_count <= MAX_BATCH_SIZE, "Count is over the batch limit.");
+
+        return
+            requestCollectibles(
+                _count,
+                CALLBACK_BASE_GAS + CALLBACK_GAS_PER_TOKEN * _count
+            );
+    }
+
+    function getMaxBatchSize() public pure returns (uint32) {
+        return MAX_BATCH_SIZE;
+    }
+
+    function requestCollectibles(uint32 _count, uint32 _callbackGasLimit)
+        internal
+        returns (uint256)
+    {
+        uint256 requestId = vrf.requestRandomWords(
+            vrfKey,
+            sId,
+            3,
+            _callbackGasLimit,
+            _count
+        );
         requestSenders[requestId] = msg.sender;
         emit RequestedCollectible(requestId, msg.sender);
+        return requestId;
     }
 
     function fulfillRandomWords(uint256 requestId, uint256[] memory randomWords)
         internal
         override
     {
-        uint256 newItemId = _tokenIds.current();
+        address sender = requestSenders[requestId];
 
-        Breed breed = Breed(randomWords[0] % 3);
-        tokens[newItemId] = breed;
-        emit BreedAssigned(newItemId, breed);
+        for (uint256 i = 0; i < randomWords.length; i++) {
+            uint256 newItemId = _tokenIds.current();
 
-        _mint(requestSenders[requestId], newItemId);
+            Breed breed = Breed(randomWords[i] % 3);
+            tokens[newItemId] = breed;
+            emit BreedAssigned(newItemId, breed);
 
-        _tokenIds.increment();
+            _mint(sender, newItemId);
+
+            _tokenIds.increment();
+        }
+
+        delete requestSenders[requestId];
     }
 
     function setTokenURI(uint256 tokenId, string memory _tokenURI) public {
@@ -64,6 +113,40 @@ contract AdvancedCollectible is ERC721URIStorage, VRFConsumerBaseV2 {
         _setTokenURI(tokenId, _tokenURI);
     }
 
+    /**
+     * One directory of metadata for the whole collection,
+     * instead of a setTokenURI transaction per token.
+     */
+    function setBaseURI(string memory _newBaseURI) public onlyOwner {
+        baseURI = _newBaseURI;
+    }
+
+    /**
+     * A URI set by setTokenURI wins, otherwise the URI points to
+     * `<baseURI><tokenId>-<BREED>.json` in the metadata directory.
+     */
+    function tokenURI(uint256 tokenId)
+        public
+        view
+        override
+        returns (string memory)
+    {
+        string memory _tokenURI = super.tokenURI(tokenId);
+        if (bytes(_tokenURI).length > 0 || bytes(baseURI).length == 0) {
+            return _tokenURI;
+        }
+        return
+            string(
+                abi.encodePacked(
+                    baseURI,
+                    tokenId.toString(),
+                    "-",
+                    getBreedNameOf(tokenId),
+                    ".json"
+                )
+            );
+    }
+
     function getTokenCount() public view returns (uint256) {
         return _tokenIds.current();
     }
@@ -0,0 +1,9 @@
+import os
+import sys
+
+# modules shared by the brownie projects of this repo live in /shared
+SHARED_DIR = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), os.pardir, os.pardir, "shared"
+)
+if SHARED_DIR not in sys.path:
+    sys.path.append(SHARED_DIR)
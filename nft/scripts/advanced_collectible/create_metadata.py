@@ -1,8 +1,12 @@
+import copy
 import json
 from brownie import AdvancedCollectible, config, network
 from metadata.boilerplate import metadata_boilerplate
-import requests
 from pathlib import Path
+from scripts.ipfs import IpfsUploader
+from scripts.ipfs_cache import UploadCache
+from scripts.ipfs_offline import OfflineIpfsUploader
+from scripts.advanced_collectible.token_reader import get_breeds
 
 
 def get_metadata_file_name(token_id, breed):
@@ -17,68 +21,101 @@ def get_image_path(breed):
     return "./img/{}.png".format(breed.lower().replace("_", "-"))
 
 
-def upload_breed_image_to_ipfs_and_get_url(breed):
-    return upload_file_to_ipfs_and_get_url(get_image_path(breed))
+def get_upload_config():
+    return config.get("ipfs_upload", {})
 
 
-def save_metadata_file_and_upload_to_ipfs(token_id, breed, metadata):
-    metadata_file_name = get_metadata_file_name(token_id, breed)
-    with open(metadata_file_name, "w") as file:
-        json.dump(metadata, file)
-    upload_file_to_ipfs_and_get_url(metadata_file_name)
+def is_offline_upload():
+    return get_upload_config().get("offline", False)
+
 
+def get_car_path():
+    car_dir = get_upload_config().get("car_dir", "./car")
+    return "{}/{}.car".format(car_dir, network.show_active())
 
-def add_to_local_ipfs_and_get_qm_hash(file_binary):
-    response = requests.post(
-        config["ipfs_url"] + "/api/v0/add", files={"file": file_binary}
+
+def get_upload_cache(upload_config):
+    cache_dir = upload_config.get("cache_dir", "./.ipfs_cache")
+    return UploadCache(
+        "{}/{}.json".format(cache_dir, network.show_active()),
+        max_entries=upload_config.get("cache_max_entries", 10000),
     )
-    return response.json()["Hash"]
 
 
-def pin_to_pinata(file_binary, filename):
-    requests.post(
-        "https://api.pinata.cloud/pinning/pinFileToIPFS",
-        files={"file": (filename, file_binary)},
-        headers={
-            "pinata_api_key": config["pinata"]["api_key"],
-            "pinata_secret_api_key": config["pinata"]["api_secret"],
-        },
+def get_ipfs_uploader():
+    if is_offline_upload():
+        return get_offline_ipfs_uploader()
+    return get_online_ipfs_uploader()
+
+
+def get_offline_ipfs_uploader():
+    upload_config = get_upload_config()
+    return OfflineIpfsUploader(
+        cid_version=upload_config.get("cid_version", 0),
+        concurrency=upload_config.get("concurrency", 8),
     )
 
 
-def upload_file_to_ipfs_and_get_url(filepath):
-    filename = filepath.split("/")[-1:][0]
+def get_online_ipfs_uploader():
+    upload_config = get_upload_config()
+    return IpfsUploader(
+        config["ipfs_url"],
+        config["pinata"]["api_key"],
+        config["pinata"]["api_secret"],
+        concurrency=upload_config.get("concurrency", 8),
+        retries=upload_config.get("retries", 3),
+        backoff=upload_config.get("backoff", 0.5),
+        cache=get_upload_cache(upload_config),
+    )
+
+
+def upload_breed_image_to_ipfs_and_get_url(uploader, breed):
+    return uploader.upload_file_to_ipfs_and_get_url(get_image_path(breed))
 
-    with Path(filepath).open("rb") as fp:
-        file_binary = fp.read()
-        ipfs_hash = add_to_local_ipfs_and_get_qm_hash(file_binary)
-        pin_to_pinata(file_binary, filename)
 
-    return "ipfs://{}?filename={}".format(ipfs_hash, filename)
+def save_metadata_file_and_upload_to_ipfs(uploader, token_id, breed, metadata):
+    metadata_file_name = get_metadata_file_name(token_id, breed)
+    with open(metadata_file_name, "w") as file:
+        json.dump(metadata, file)
+    uploader.upload_file_to_ipfs_and_get_url(metadata_file_name)
 
 
-def build_metadata(breed):
-    metadata = metadata_boilerplate
+def build_metadata(uploader, breed):
+    metadata = copy.deepcopy(metadata_boilerplate)
     metadata["name"] = breed
     metadata["description"] = "An adorable {} pup!".format(breed)
-    metadata["image"] = upload_breed_image_to_ipfs_and_get_url(breed)
+    metadata["image"] = upload_breed_image_to_ipfs_and_get_url(uploader, breed)
     return metadata
 
 
-def create_metadata_of_token(token_id, breed):
-    if does_metadata_file_exists(token_id, breed):
+def create_metadata_of_token(uploader, token_id, breed):
+    # offline runs rebuild every file, the archive must hold the whole collection
+    if does_metadata_file_exists(token_id, breed) and not is_offline_upload():
         return
 
-    metadata = build_metadata(breed)
-    save_metadata_file_and_upload_to_ipfs(token_id, breed, metadata)
+    metadata = build_metadata(uploader, breed)
+    save_metadata_file_and_upload_to_ipfs(uploader, token_id, breed, metadata)
 
 
 def create_metadata():
     advanced_collectible = AdvancedCollectible[-1]
     token_count = advanced_collectible.getTokenCount()
-    for i in range(token_count):
-        breed = advanced_collectible.getBreedNameOf(i)
-        create_metadata_of_token(i, breed)
+    breeds = get_breeds(advanced_collectible, range(token_count))
+    Path("./metadata/{}".format(network.show_active())).mkdir(exist_ok=True)
+
+    with get_ipfs_uploader() as uploader:
+        uploader.map(
+            lambda token_id: create_metadata_of_token(
+                uploader, token_id, breeds[token_id]
+            ),
+            range(token_count),
+        )
+        print("Uploaded {}".format(uploader.stats))
+
+        if is_offline_upload():
+            car_path = get_car_path()
+            root = uploader.export_car(car_path)
+            print("Exported collection ipfs://{} to {}".format(root, car_path))
 
 
 def main():
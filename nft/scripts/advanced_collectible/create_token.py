@@ -1,5 +1,7 @@
 from brownie import AdvancedCollectible
 from scripts.helpers import get_account
+from vrf import wait_for_request_of
+from vrf_fulfiller import auto_fulfill
 
 
 def create_token(account):
@@ -9,5 +11,24 @@ def create_token(account):
     return create_tx
 
 
-def main():
-    create_token(get_account())
+def create_token_batch(account, count):
+    advanced_collectible = AdvancedCollectible[-1]
+    create_tx = advanced_collectible.createBatch(count, {"from": account})
+    create_tx.wait(1)
+    return create_tx
+
+
+def create_tokens(account, count):
+    batch_size = AdvancedCollectible[-1].getMaxBatchSize()
+    return [
+        create_token_batch(account, min(batch_size, count - start))
+        for start in range(0, count, batch_size)
+    ]
+
+
+def main(count=1):
+    with auto_fulfill() as fulfiller:
+        create_txs = create_tokens(get_account(), int(count))
+        if fulfiller is not None:
+            for create_tx in create_txs:
+                wait_for_request_of(create_tx, "RequestedCollectible")
@@ -0,0 +1,116 @@
+from brownie import AdvancedCollectible, config, web3
+from scripts.helpers import is_not_local_network
+from log_indexer import (
+    LogIndexer,
+    decode_words,
+    get_database_path,
+    get_deployment_block,
+    get_indexer_settings,
+    to_hex,
+)
+
+BREEDS = ["PUG", "SHIBA_INU", "ST_BERNARD"]
+BREED_ASSIGNED = "BreedAssigned(uint256,uint8)"
+REQUESTED_COLLECTIBLE = "RequestedCollectible(uint256,address)"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS breeds (
+    contract TEXT NOT NULL,
+    token_id INTEGER NOT NULL,
+    breed TEXT NOT NULL,
+    block INTEGER NOT NULL,
+    PRIMARY KEY (contract, token_id)
+);
+CREATE TABLE IF NOT EXISTS requests (
+    contract TEXT NOT NULL,
+    request_id TEXT NOT NULL,
+    sender TEXT NOT NULL,
+    block INTEGER NOT NULL,
+    PRIMARY KEY (contract, request_id)
+);
+"""
+
+
+def get_indexer_config():
+    return config.get("event_indexer", {})
+
+
+class EventIndexer(LogIndexer):
+    """
+    Incrementally indexes BreedAssigned and RequestedCollectible into sqlite.
+    """
+
+    schema = SCHEMA
+
+    def get_handlers(self):
+        return {
+            BREED_ASSIGNED: self.store_breed_assigned,
+            REQUESTED_COLLECTIBLE: self.store_requested_collectible,
+        }
+
+    def store_log(self, contract_address, log):
+        topic = to_hex(log["topics"][0])
+        self.topics[topic](contract_address, decode_words(log["data"]), log)
+
+    def store_breed_assigned(self, contract_address, words, log):
+        token_id, breed = words
+        self.database.execute(
+            "INSERT OR REPLACE INTO breeds VALUES (?, ?, ?, ?)",
+            (contract_address, token_id, BREEDS[breed], log["blockNumber"]),
+        )
+
+    def store_requested_collectible(self, contract_address, words, log):
+        request_id, sender = words
+        self.database.execute(
+            "INSERT OR REPLACE INTO requests VALUES (?, ?, ?, ?)",
+            (
+                contract_address,
+                str(request_id),
+                web3.toChecksumAddress(sender.to_bytes(20, "big")),
+                log["blockNumber"],
+            ),
+        )
+
+    def get_breeds(self, contract_address, token_ids=None):
+        rows = self.database.execute(
+            "SELECT token_id, breed FROM breeds WHERE contract = ?",
+            (contract_address,),
+        )
+        breeds = dict(rows)
+        if token_ids is None:
+            return breeds
+        return {i: breeds[i] for i in token_ids if i in breeds}
+
+    def get_request_sender(self, contract_address, request_id):
+        row = self.database.execute(
+            "SELECT sender FROM requests WHERE contract = ? AND request_id = ?",
+            (contract_address, str(request_id)),
+        ).fetchone()
+        return None if row is None else row[0]
+
+
+def is_event_indexer_enabled():
+    # an index of a local chain is kept in memory, rebuilt on every read
+    return is_not_local_network() and get_indexer_config().get("enabled", False)
+
+
+def get_event_indexer():
+    indexer_config = get_indexer_config()
+    return EventIndexer(
+        get_database_path(indexer_config), **get_indexer_settings(indexer_config)
+    )
+
+
+def sync_collectible(indexer, collectible):
+    indexer.sync(
+        collectible.address,
+        get_deployment_block(collectible, "event_indexer_start_block"),
+    )
+
+
+def main():
+    collectible = AdvancedCollectible[-1]
+    with get_event_indexer() as indexer:
+        sync_collectible(indexer, collectible)
+        breeds = indexer.get_breeds(collectible.address)
+    print("Indexed {} breeds of {}".format(len(breeds), collectible.address))
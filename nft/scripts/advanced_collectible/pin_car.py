@@ -0,0 +1,21 @@
+from brownie import network
+from scripts.advanced_collectible.create_metadata import (
+    get_car_path,
+    get_online_ipfs_uploader,
+)
+
+
+def pin_car():
+    car_path = get_car_path()
+    with get_online_ipfs_uploader() as uploader:
+        roots = uploader.import_car_to_local_ipfs(car_path)
+        for root in roots:
+            uploader.pin_hash_to_pinata(
+                root, "{}-collection".format(network.show_active())
+            )
+            print("Pinned collection ipfs://{}".format(root))
+    return roots
+
+
+def main():
+    pin_car()
@@ -0,0 +1,52 @@
+from pathlib import Path
+from brownie import AdvancedCollectible, network
+from scripts.helpers import get_account
+from scripts.ipfs_offline import OfflineIpfsUploader
+from scripts.advanced_collectible.create_metadata import (
+    get_upload_config,
+    get_online_ipfs_uploader,
+    is_offline_upload,
+)
+
+
+def get_metadata_directory():
+    return "./metadata/{}".format(network.show_active())
+
+
+def get_metadata_car_path():
+    car_dir = get_upload_config().get("car_dir", "./car")
+    return "{}/{}-metadata.car".format(car_dir, network.show_active())
+
+
+def export_metadata_directory():
+    metadata_files = sorted(
+        str(p) for p in Path(get_metadata_directory()).glob("*.json")
+    )
+    with OfflineIpfsUploader(
+        cid_version=get_upload_config().get("cid_version", 0)
+    ) as uploader:
+        uploader.upload_files(metadata_files)
+        return uploader.export_car(get_metadata_car_path())
+
+
+def publish_metadata_directory():
+    root = export_metadata_directory()
+    if not is_offline_upload():
+        with get_online_ipfs_uploader() as uploader:
+            uploader.import_car_to_local_ipfs(get_metadata_car_path())
+            uploader.pin_hash_to_pinata(
+                root, "{}-metadata".format(network.show_active())
+            )
+    return root
+
+
+def set_base_uri(collectible, root):
+    base_uri = "ipfs://{}/".format(root)
+    tx = collectible.setBaseURI(base_uri, {"from": get_account()})
+    tx.wait(1)
+    print("Token URIs now resolve under {}".format(base_uri))
+    return tx
+
+
+def main():
+    set_base_uri(AdvancedCollectible[-1], publish_metadata_directory())
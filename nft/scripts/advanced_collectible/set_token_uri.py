@@ -1,5 +1,10 @@
-from brownie import AdvancedCollectible
+from brownie import AdvancedCollectible, config
 from scripts.helpers import get_open_sea_url, get_account
+from scripts.advanced_collectible.token_reader import get_breeds, get_token_uris
+from scripts.advanced_collectible.set_base_uri import (
+    publish_metadata_directory,
+    set_base_uri,
+)
 
 metadata_links = {
     "PUG": "ipfs://Qmd9MCGtdVz2miNumBHDbvj8bigSgTwnr4SbyH6DNnpWdt?filename=0-PUG.json",
@@ -8,8 +13,7 @@ metadata_links = {
 }
 
 
-def set_token_uri(collectible, token_id):
-    breed = collectible.getBreedNameOf(token_id)
+def set_token_uri(collectible, token_id, breed):
     collectible.setTokenURI(token_id, metadata_links[breed], {"from": get_account()})
     print(
         "Awesome! You can view your NFT at {}".format(
@@ -18,17 +22,26 @@ def set_token_uri(collectible, token_id):
     )
 
 
-def does_not_have_uri(collectible, token_id):
-    return not collectible.tokenURI(token_id).startswith("https://")
+def does_not_have_uri(token_uri):
+    return not token_uri.startswith("https://")
 
 
 def set_all_token_uri():
     advanced_collectible = AdvancedCollectible[-1]
     token_count = advanced_collectible.getTokenCount()
-    for i in range(token_count):
-        if does_not_have_uri(advanced_collectible, i):
-            set_token_uri(advanced_collectible, i)
+    token_uris = get_token_uris(advanced_collectible, range(token_count))
+    token_ids = [i for i in range(token_count) if does_not_have_uri(token_uris[i])]
+    breeds = get_breeds(advanced_collectible, token_ids)
+    for token_id in token_ids:
+        set_token_uri(advanced_collectible, token_id, breeds[token_id])
+
+
+def is_base_uri_mode():
+    return config.get("token_uri_mode", "per_token") == "base_uri"
 
 
 def main():
-    set_all_token_uri()
+    if is_base_uri_mode():
+        set_base_uri(AdvancedCollectible[-1], publish_metadata_directory())
+    else:
+        set_all_token_uri()
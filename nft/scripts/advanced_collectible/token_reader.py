@@ -0,0 +1,57 @@
+from brownie import multicall, config
+from scripts.helpers import get_active_network_config
+from scripts.advanced_collectible.event_indexer import (
+    get_event_indexer,
+    is_event_indexer_enabled,
+    sync_collectible,
+)
+
+DEFAULT_BATCH_SIZE = 200
+
+
+def get_batch_size():
+    return config.get("multicall_batch_size", DEFAULT_BATCH_SIZE)
+
+
+def get_multicall_address():
+    # local chains deploy their own Multicall2 when this is missing
+    return get_active_network_config().get("multicall2")
+
+
+def batch_read(function, token_ids, batch_size=None, convert=str):
+    batch_size = batch_size or get_batch_size()
+    token_ids = list(token_ids)
+    results = {}
+    with multicall(address=get_multicall_address()):
+        for start in range(0, len(token_ids), batch_size):
+            batch = {
+                token_id: function(token_id)
+                for token_id in token_ids[start : start + batch_size]
+            }
+            multicall.flush()
+            # multicall hands out lazy proxies, json.dump can't serialize them
+            for token_id, result in batch.items():
+                results[token_id] = convert(result)
+    return results
+
+
+def get_indexed_breeds(collectible, token_ids):
+    with get_event_indexer() as indexer:
+        sync_collectible(indexer, collectible)
+        return indexer.get_breeds(collectible.address, token_ids)
+
+
+def get_breeds(collectible, token_ids):
+    token_ids = list(token_ids)
+    breeds = {}
+    if is_event_indexer_enabled():
+        breeds = get_indexed_breeds(collectible, token_ids)
+
+    missing_token_ids = [i for i in token_ids if i not in breeds]
+    if missing_token_ids:
+        breeds.update(batch_read(collectible.getBreedNameOf, missing_token_ids))
+    return breeds
+
+
+def get_token_uris(collectible, token_ids):
+    return batch_read(collectible.tokenURI, token_ids)
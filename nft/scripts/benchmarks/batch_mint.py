@@ -0,0 +1,33 @@
+import time
+from scripts.helpers import get_account
+from scripts.dependencies import get_mock_contract
+from scripts.advanced_collectible.deploy import deploy
+from scripts.advanced_collectible.create_token import create_token_batch
+
+BATCH_SIZES = [1, 10, 50]
+
+
+def mint_batch(collectible, count):
+    started_at = time.perf_counter()
+    create_tx = create_token_batch(get_account(), count)
+    fulfill_tx = get_mock_contract("vrf_coordinator").fulfillRandomWords(
+        create_tx.events["RequestedCollectible"]["requestId"],
+        collectible.address,
+        {"from": get_account()},
+    )
+    seconds = time.perf_counter() - started_at
+    return create_tx.gas_used + fulfill_tx.gas_used, seconds
+
+
+def main():
+    collectible = deploy()
+    # first mint pays for initializing storage, keep it out of the numbers
+    mint_batch(collectible, 1)
+
+    for count in BATCH_SIZES:
+        gas_used, seconds = mint_batch(collectible, count)
+        print(
+            "n = {:>2}: {:>9,} gas, {:>7,} gas/token, 2 txs, {:.3f}s ({:.4f}s/token)".format(
+                count, gas_used, gas_used // count, seconds, seconds / count
+            )
+        )
@@ -0,0 +1,65 @@
+import os
+import tempfile
+import requests
+from scripts.ipfs import IpfsUploader, UploadStats, get_file_name
+from scripts.benchmarks.local_ipfs_server import LocalIpfsServer
+
+FILE_COUNT = 200
+FILE_SIZE = 64 * 1024
+LATENCY = 0.05
+
+
+def create_files(directory, count, size):
+    filepaths = []
+    for i in range(count):
+        filepath = os.path.join(directory, "{}.bin".format(i))
+        with open(filepath, "wb") as file:
+            file.write(os.urandom(size))
+        filepaths.append(filepath)
+    return filepaths
+
+
+def upload_serially(server, filepaths):
+    # as create_metadata.py used to: one file after the other, added and then
+    # pinned, each request on a new connection
+    stats = UploadStats()
+    for filepath in filepaths:
+        with open(filepath, "rb") as fp:
+            file_binary = fp.read()
+        requests.post(server.url + "/api/v0/add", files={"file": file_binary})
+        requests.post(
+            server.url + "/pinning/pinFileToIPFS",
+            files={"file": (get_file_name(filepath), file_binary)},
+        )
+        stats.add(len(file_binary))
+    return stats
+
+
+def upload_concurrently(server, filepaths, concurrency):
+    with IpfsUploader(
+        server.url,
+        pinata_url=server.url + "/pinning/pinFileToIPFS",
+        concurrency=concurrency,
+    ) as uploader:
+        uploader.upload_files(filepaths)
+        return uploader.stats
+
+
+def benchmark(count=FILE_COUNT, size=FILE_SIZE, latency=LATENCY):
+    with tempfile.TemporaryDirectory() as directory, LocalIpfsServer(latency) as server:
+        filepaths = create_files(directory, count, size)
+        print(
+            "{} files of {} bytes, {}s latency per request".format(count, size, latency)
+        )
+        print("serial         : {}".format(upload_serially(server, filepaths)))
+        for concurrency in [4, 8, 16, 32]:
+            stats = upload_concurrently(server, filepaths, concurrency)
+            print("concurrency {:>2} : {}".format(concurrency, stats))
+
+
+def main():
+    benchmark()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,19 @@
+from brownie import web3
+
+
+class RpcCounter:
+    """Counts the json-rpc requests sent to the node inside the `with` block."""
+
+    def __enter__(self):
+        self.count = 0
+        self.make_request = web3.provider.make_request
+
+        def make_counted_request(method, params):
+            self.count += 1
+            return self.make_request(method, params)
+
+        web3.provider.make_request = make_counted_request
+        return self
+
+    def __exit__(self, *args):
+        web3.provider.make_request = self.make_request
@@ -0,0 +1,92 @@
+import multiprocessing
+import os
+import resource
+import tempfile
+import time
+import requests
+from scripts.ipfs import IpfsUploader
+from scripts.benchmarks.local_ipfs_server import LocalIpfsServer
+
+SIZES_IN_MB = [1, 10, 100, 500]
+MB = 1024 * 1024
+
+
+def create_file(directory, size_in_mb):
+    filepath = os.path.join(directory, "{}mb.bin".format(size_in_mb))
+    chunk = os.urandom(MB)
+    with open(filepath, "wb") as file:
+        for _ in range(size_in_mb):
+            file.write(chunk)
+    return filepath
+
+
+def upload_buffered(server_url, filepath):
+    # the way create_metadata used to upload, kept here as the baseline
+    with open(filepath, "rb") as fp:
+        file_binary = fp.read()
+        requests.post(server_url + "/api/v0/add", files={"file": file_binary})
+        requests.post(
+            server_url + "/pinning/pinFileToIPFS",
+            files={"file": ("file", file_binary)},
+        )
+
+
+def upload_streaming(server_url, filepath):
+    with IpfsUploader(
+        server_url, pinata_url=server_url + "/pinning/pinFileToIPFS", concurrency=1
+    ) as uploader:
+        uploader.upload_file_to_ipfs_and_get_url(filepath)
+
+
+def get_peak_rss_in_mb():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def measure(upload, server_url, filepath, results):
+    rss_before = get_peak_rss_in_mb()
+    started_at = time.perf_counter()
+    upload(server_url, filepath)
+    results.put((time.perf_counter() - started_at, rss_before, get_peak_rss_in_mb()))
+
+
+def run_in_fresh_process(upload, server_url, filepath):
+    # peak rss never goes down, so every measurement gets its own process
+    results = multiprocessing.Queue()
+    process = multiprocessing.Process(
+        target=measure, args=(upload, server_url, filepath, results)
+    )
+    process.start()
+    result = results.get()
+    process.join()
+    return result
+
+
+def benchmark(sizes_in_mb=SIZES_IN_MB):
+    with tempfile.TemporaryDirectory() as directory, LocalIpfsServer(0) as server:
+        for size_in_mb in sizes_in_mb:
+            filepath = create_file(directory, size_in_mb)
+            for name, upload in [
+                ("buffered", upload_buffered),
+                ("streaming", upload_streaming),
+            ]:
+                seconds, rss_before, rss_peak = run_in_fresh_process(
+                    upload, server.url, filepath
+                )
+                print(
+                    "{:>4} MB {:<9}: {:7.2f} MB/s, peak rss {:7.1f} MB (+{:.1f} MB)".format(
+                        size_in_mb,
+                        name,
+                        size_in_mb / seconds,
+                        rss_peak,
+                        rss_peak - rss_before,
+                    )
+                )
+            os.remove(filepath)
+
+
+def main():
+    benchmark()
+
+
+if __name__ == "__main__":
+    main()
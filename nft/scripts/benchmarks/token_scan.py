@@ -0,0 +1,54 @@
+import time
+from scripts.helpers import get_account
+from scripts.dependencies import get_mock_contract
+from scripts.advanced_collectible.deploy import deploy
+from scripts.advanced_collectible.create_token import create_token
+from scripts.advanced_collectible.token_reader import get_breeds, get_token_uris
+from scripts.benchmarks.rpc_counter import RpcCounter
+
+TOKEN_COUNT = 300
+
+
+def mint_tokens(collectible, count):
+    vrf_coordinator = get_mock_contract("vrf_coordinator")
+    for i in range(count):
+        create_tx = create_token(get_account())
+        vrf_coordinator.fulfillRandomWordsWithOverride(
+            create_tx.events["RequestedCollectible"]["requestId"],
+            collectible.address,
+            [i],
+            {"from": get_account()},
+        )
+
+
+def scan_serially(collectible, token_count):
+    return {
+        "breeds": [collectible.getBreedNameOf(i) for i in range(token_count)],
+        "uris": [collectible.tokenURI(i) for i in range(token_count)],
+    }
+
+
+def scan_in_batches(collectible, token_count):
+    return {
+        "breeds": get_breeds(collectible, range(token_count)),
+        "uris": get_token_uris(collectible, range(token_count)),
+    }
+
+
+def measure(name, scan, collectible, token_count):
+    with RpcCounter() as counter:
+        started_at = time.perf_counter()
+        scan(collectible, token_count)
+        seconds = time.perf_counter() - started_at
+    print("{:<9}: {:>5} rpc requests in {:.2f}s".format(name, counter.count, seconds))
+
+
+def main():
+    collectible = deploy()
+    mint_tokens(collectible, TOKEN_COUNT)
+    # warm up, deploys Multicall2 on the local chain
+    get_breeds(collectible, [0])
+
+    print("Scanning breeds and uris of {} tokens".format(TOKEN_COUNT))
+    measure("serial", scan_serially, collectible, TOKEN_COUNT)
+    measure("multicall", scan_in_batches, collectible, TOKEN_COUNT)
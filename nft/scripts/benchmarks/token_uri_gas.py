@@ -0,0 +1,43 @@
+from brownie import chain
+from scripts.helpers import get_account
+from scripts.advanced_collectible.deploy import deploy
+from scripts.advanced_collectible.set_token_uri import metadata_links
+from scripts.benchmarks.token_scan import mint_tokens
+
+TOKEN_COUNTS = [1, 100, 1000]
+BASE_URI = "ipfs://bafybeiczsscdsbs7ffqz55asqdf3smv6klcw3gofszvwlyarci47bgf354/"
+
+
+def get_per_token_gas(collectible, token_counts):
+    gas_used = 0
+    gas_by_count = {}
+    for token_id in range(max(token_counts)):
+        breed = collectible.getBreedNameOf(token_id)
+        tx = collectible.setTokenURI(
+            token_id, metadata_links[breed], {"from": get_account()}
+        )
+        gas_used += tx.gas_used
+        if token_id + 1 in token_counts:
+            gas_by_count[token_id + 1] = gas_used
+    return gas_by_count
+
+
+def get_base_uri_gas(collectible):
+    return collectible.setBaseURI(BASE_URI, {"from": get_account()}).gas_used
+
+
+def main():
+    collectible = deploy()
+    mint_tokens(collectible, max(TOKEN_COUNTS))
+
+    chain.snapshot()
+    per_token_gas = get_per_token_gas(collectible, TOKEN_COUNTS)
+    chain.revert()
+    base_uri_gas = get_base_uri_gas(collectible)
+
+    for token_count in TOKEN_COUNTS:
+        print(
+            "{:>5} tokens: setTokenURI {:>12,} gas, setBaseURI {:>8,} gas".format(
+                token_count, per_token_gas[token_count], base_uri_gas
+            )
+        )
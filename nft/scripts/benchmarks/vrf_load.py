@@ -0,0 +1,35 @@
+import time
+from brownie import accounts
+from scripts.helpers import get_account
+from scripts.dependencies import get_mock_contract
+from scripts.advanced_collectible.deploy import deploy
+from vrf import wait_for
+from vrf_fulfiller import AutoFulfiller
+
+REQUEST_COUNT = 300
+
+
+def main():
+    collectible = deploy()
+    fulfiller = AutoFulfiller(
+        get_mock_contract("vrf_coordinator"), accounts[-1], interval=0.05, seed=42
+    )
+
+    started_at = time.perf_counter()
+    fulfiller.start()
+    for _ in range(REQUEST_COUNT):
+        collectible.create({"from": get_account(), "required_confs": 0})
+    wait_for(
+        lambda: collectible.getTokenCount() == REQUEST_COUNT,
+        timeout=600,
+        initial_interval=0.05,
+        max_interval=0.5,
+    )
+    seconds = time.perf_counter() - started_at
+    fulfiller.stop()
+
+    print(
+        "{} requests fulfilled in {:.2f}s ({:.0f} requests/min)".format(
+            fulfiller.fulfilled, seconds, fulfiller.fulfilled * 60 / seconds
+        )
+    )
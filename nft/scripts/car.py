@@ -0,0 +1,34 @@
+from scripts.unixfs import encode_varint
+
+CAR_VERSION = 1
+
+
+def encode_car_header(root):
+    # dag-cbor of {"roots": [root], "version": 1}, roots are CBOR tag 42 CIDs
+    tagged_root = b"\0" + root
+    header = (
+        b"\xa2"
+        + b"\x65roots"
+        + b"\x81\xd8\x2a"
+        + b"\x58"
+        + bytes([len(tagged_root)])
+        + tagged_root
+        + b"\x67version"
+        + bytes([CAR_VERSION])
+    )
+    return encode_varint(len(header)) + header
+
+
+class CarWriter:
+    def __init__(self, fp, root):
+        self.fp = fp
+        self.written = set()
+        self.fp.write(encode_car_header(root))
+
+    def write_block(self, cid, block):
+        if cid in self.written:
+            return
+        self.written.add(cid)
+        self.fp.write(encode_varint(len(cid) + len(block)))
+        self.fp.write(cid)
+        self.fp.write(block)
@@ -0,0 +1,227 @@
+import io
+import json
+import os
+import time
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+import requests
+from requests.adapters import HTTPAdapter
+
+PINATA_PIN_FILE_URL = "https://api.pinata.cloud/pinning/pinFileToIPFS"
+PINATA_PIN_BY_HASH_URL = "https://api.pinata.cloud/pinning/pinByHash"
+RETRY_STATUSES = [429, 500, 502, 503, 504]
+
+
+def create_session(pool_size):
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def get_file_name(filepath):
+    return str(filepath).split("/")[-1:][0]
+
+
+class MultipartFileBody:
+    """
+    Multipart form body of a single file that is read from disk while sending.
+
+    Each destination opens its own handle, so the file is never held in memory.
+    """
+
+    def __init__(self, filepath, filename):
+        boundary = uuid.uuid4().hex
+        self.content_type = "multipart/form-data; boundary={}".format(boundary)
+        head = (
+            "--{}\r\n"
+            'Content-Disposition: form-data; name="file"; filename="{}"\r\n'
+            "Content-Type: application/octet-stream\r\n\r\n"
+        ).format(boundary, filename).encode()
+        tail = "\r\n--{}--\r\n".format(boundary).encode()
+
+        self.fp = open(filepath, "rb")
+        self.parts = [io.BytesIO(head), self.fp, io.BytesIO(tail)]
+        self.length = len(head) + os.path.getsize(filepath) + len(tail)
+
+    def __len__(self):
+        return self.length
+
+    def read(self, size=-1):
+        result = b""
+        while self.parts and (size < 0 or len(result) < size):
+            chunk = self.parts[0].read(-1 if size < 0 else size - len(result))
+            if not chunk:
+                self.parts.pop(0)
+            result += chunk
+        return result
+
+    def close(self):
+        self.fp.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+class UploadStats:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.started_at = time.perf_counter()
+        self.files = 0
+        self.bytes = 0
+
+    def add(self, size):
+        with self.lock:
+            self.files += 1
+            self.bytes += size
+
+    def report(self):
+        elapsed = max(time.perf_counter() - self.started_at, 1e-9)
+        return {
+            "files": self.files,
+            "bytes": self.bytes,
+            "seconds": elapsed,
+            "files_per_second": self.files / elapsed,
+            "bytes_per_second": self.bytes / elapsed,
+        }
+
+    def __str__(self):
+        report = self.report()
+        return "{} files, {} bytes in {:.2f}s ({:.2f} files/s, {:.0f} bytes/s)".format(
+            report["files"],
+            report["bytes"],
+            report["seconds"],
+            report["files_per_second"],
+            report["bytes_per_second"],
+        )
+
+
+class IpfsUploader:
+    """
+    Uploads files to the local IPFS node and pins them on pinata.
+
+    Both requests of a file run at the same time, files are uploaded by a
+    bounded pool of workers and every request goes through one pooled session.
+    """
+
+    def __init__(
+        self,
+        ipfs_url,
+        pinata_api_key=None,
+        pinata_api_secret=None,
+        pinata_url=PINATA_PIN_FILE_URL,
+        pinata_pin_by_hash_url=PINATA_PIN_BY_HASH_URL,
+        concurrency=8,
+        retries=3,
+        backoff=0.5,
+        cache=None,
+    ):
+        self.ipfs_url = ipfs_url
+        self.pinata_url = pinata_url
+        self.pinata_pin_by_hash_url = pinata_pin_by_hash_url
+        self.pinata_headers = {
+            "pinata_api_key": pinata_api_key,
+            "pinata_secret_api_key": pinata_api_secret,
+        }
+        self.concurrency = concurrency
+        self.retries = retries
+        self.backoff = backoff
+        self.session = create_session(concurrency * 2)
+        self.request_pool = ThreadPoolExecutor(max_workers=concurrency * 2)
+        self.cache = cache
+        self.stats = UploadStats()
+
+    def with_retry(self, send):
+        for attempt in range(self.retries + 1):
+            is_last_attempt = attempt == self.retries
+            try:
+                response = send()
+                if response.status_code not in RETRY_STATUSES or is_last_attempt:
+                    response.raise_for_status()
+                    return response
+            except (requests.ConnectionError, requests.Timeout):
+                if is_last_attempt:
+                    raise
+            time.sleep(self.backoff * (2**attempt))
+
+    def post(self, url, **kwargs):
+        return self.with_retry(lambda: self.session.post(url, **kwargs))
+
+    def post_file(self, url, filepath, filename, headers=None):
+        # every attempt streams the file again from a fresh handle
+        def send():
+            with MultipartFileBody(filepath, filename) as body:
+                return self.session.post(
+                    url,
+                    data=body,
+                    headers={**(headers or {}), "Content-Type": body.content_type},
+                )
+
+        return self.with_retry(send)
+
+    def add_to_local_ipfs_and_get_qm_hash(self, filepath, filename):
+        response = self.post_file(self.ipfs_url + "/api/v0/add", filepath, filename)
+        return response.json()["Hash"]
+
+    def pin_to_pinata(self, filepath, filename):
+        self.post_file(self.pinata_url, filepath, filename, self.pinata_headers)
+
+    def import_car_to_local_ipfs(self, car_path):
+        response = self.post_file(
+            self.ipfs_url + "/api/v0/dag/import", car_path, get_file_name(car_path)
+        )
+        self.stats.add(os.path.getsize(car_path))
+        # one json line per root of the archive
+        roots = [json.loads(line) for line in response.text.splitlines() if line]
+        return [root["Root"]["Cid"]["/"] for root in roots if "Root" in root]
+
+    def pin_hash_to_pinata(self, ipfs_hash, name):
+        self.post(
+            self.pinata_pin_by_hash_url,
+            json={"hashToPin": ipfs_hash, "pinataMetadata": {"name": name}},
+            headers=self.pinata_headers,
+        )
+
+    def upload_file_and_get_qm_hash(self, filepath, filename):
+        ipfs_hash = self.request_pool.submit(
+            self.add_to_local_ipfs_and_get_qm_hash, filepath, filename
+        )
+        pinned = self.request_pool.submit(self.pin_to_pinata, filepath, filename)
+        pinned.result()
+        self.stats.add(os.path.getsize(filepath))
+
+        return ipfs_hash.result()
+
+    def upload_file_to_ipfs_and_get_url(self, filepath):
+        filename = get_file_name(filepath)
+        upload = lambda: self.upload_file_and_get_qm_hash(filepath, filename)
+        if self.cache is None:
+            ipfs_hash = upload()
+        else:
+            ipfs_hash = self.cache.get_or_upload(filepath, upload)
+
+        return "ipfs://{}?filename={}".format(ipfs_hash, filename)
+
+    def map(self, function, items):
+        with ThreadPoolExecutor(max_workers=self.concurrency) as file_pool:
+            return list(file_pool.map(function, items))
+
+    def upload_files(self, filepaths):
+        return self.map(self.upload_file_to_ipfs_and_get_url, filepaths)
+
+    def close(self):
+        if self.cache is not None:
+            self.cache.save()
+        self.request_pool.shutdown()
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
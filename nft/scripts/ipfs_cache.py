@@ -0,0 +1,134 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from concurrent.futures import Future
+
+HASH_CHUNK_SIZE = 1024 * 1024
+SAVE_EVERY = 100
+
+
+def get_content_hash(filepath):
+    digest = hashlib.sha256()
+    with open(filepath, "rb") as fp:
+        for chunk in iter(lambda: fp.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class UploadCache:
+    """
+    Persistent content hash -> CID cache of uploaded files.
+
+    Entries are keyed by the sha256 of the file content, so a changed file
+    never hits a stale CID. File paths are indexed by (size, mtime) to skip
+    re-hashing untouched files, and the least recently used CIDs are evicted
+    once the cache grows over `max_entries`.
+    """
+
+    def __init__(self, path, max_entries=10000):
+        self.path = path
+        self.max_entries = max_entries
+        self.lock = threading.Lock()
+        self.in_flight = {}
+        self.unsaved = 0
+        self.cids, self.files = self.load()
+
+    def load(self):
+        if not os.path.exists(self.path):
+            return {}, {}
+        with open(self.path, "r") as file:
+            cache = json.load(file)
+        return cache["cids"], cache["files"]
+
+    def save(self):
+        with self.lock:
+            self.files = {
+                path: entry
+                for path, entry in self.files.items()
+                if os.path.exists(path)
+            }
+            cache = json.dumps({"cids": self.cids, "files": self.files})
+            self.unsaved = 0
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temporary_path = self.path + ".tmp"
+        with open(temporary_path, "w") as file:
+            file.write(cache)
+        os.replace(temporary_path, self.path)
+
+    def get_content_hash(self, filepath):
+        path = os.path.abspath(filepath)
+        stat = os.stat(path)
+        with self.lock:
+            entry = self.files.get(path)
+        if (
+            entry
+            and entry["size"] == stat.st_size
+            and entry["mtime"] == stat.st_mtime_ns
+        ):
+            return entry["sha256"]
+
+        content_hash = get_content_hash(path)
+        with self.lock:
+            self.files[path] = {
+                "size": stat.st_size,
+                "mtime": stat.st_mtime_ns,
+                "sha256": content_hash,
+            }
+        return content_hash
+
+    def set(self, content_hash, cid):
+        with self.lock:
+            self.cids[content_hash] = {"cid": cid, "used_at": time.time()}
+            self.evict()
+            self.unsaved += 1
+            should_save = self.unsaved >= SAVE_EVERY
+        if should_save:
+            self.save()
+
+    def evict(self):
+        overflow = len(self.cids) - self.max_entries
+        if overflow <= 0:
+            return
+        least_recently_used = sorted(self.cids, key=lambda h: self.cids[h]["used_at"])
+        for content_hash in least_recently_used[:overflow]:
+            del self.cids[content_hash]
+
+    def invalidate(self, filepath):
+        path = os.path.abspath(filepath)
+        with self.lock:
+            entry = self.files.pop(path, None)
+            if entry:
+                self.cids.pop(entry["sha256"], None)
+
+    def get_or_upload(self, filepath, upload):
+        content_hash = self.get_content_hash(filepath)
+
+        # same content may be uploading on another worker, wait for that one
+        with self.lock:
+            entry = self.cids.get(content_hash)
+            if entry is not None:
+                entry["used_at"] = time.time()
+                return entry["cid"]
+            future = self.in_flight.get(content_hash)
+            is_uploader = future is None
+            if is_uploader:
+                future = self.in_flight[content_hash] = Future()
+        if not is_uploader:
+            return future.result()
+
+        try:
+            cid = upload()
+            self.set(content_hash, cid)
+            future.set_result(cid)
+            return cid
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self.lock:
+                del self.in_flight[content_hash]
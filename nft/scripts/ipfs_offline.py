@@ -0,0 +1,66 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from scripts.car import CarWriter
+from scripts.ipfs import UploadStats, get_file_name
+from scripts.unixfs import add_directory, add_file_from_path, cid_to_string
+
+
+class OfflineIpfsUploader:
+    """
+    Drop-in for IpfsUploader that computes CIDs locally instead of uploading.
+
+    Every file is collected into one directory, so the whole collection can be
+    exported as a single CAR archive and pinned with one bulk upload.
+    """
+
+    def __init__(self, cid_version=0, concurrency=8):
+        self.cid_version = cid_version
+        self.concurrency = concurrency
+        self.lock = threading.Lock()
+        self.files = {}
+        self.stats = UploadStats()
+
+    def upload_file_to_ipfs_and_get_url(self, filepath):
+        filename = get_file_name(filepath)
+        node = add_file_from_path(filepath, self.cid_version)
+
+        with self.lock:
+            if filename in self.files and self.files[filename][1].cid != node.cid:
+                raise ValueError("Different files are named {}.".format(filename))
+            self.files[filename] = (filepath, node)
+        self.stats.add(node.filesize)
+
+        return "ipfs://{}?filename={}".format(cid_to_string(node.cid), filename)
+
+    def map(self, function, items):
+        with ThreadPoolExecutor(max_workers=self.concurrency) as file_pool:
+            return list(file_pool.map(function, items))
+
+    def upload_files(self, filepaths):
+        return self.map(self.upload_file_to_ipfs_and_get_url, filepaths)
+
+    def export_car(self, car_path):
+        entries = {filename: node for filename, (_, node) in self.files.items()}
+        root = add_directory(entries, self.cid_version)
+
+        directory = os.path.dirname(car_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(car_path, "wb") as fp:
+            car = CarWriter(fp, root.cid)
+            for filename in sorted(self.files):
+                filepath, _ = self.files[filename]
+                add_file_from_path(filepath, self.cid_version, car.write_block)
+            add_directory(entries, self.cid_version, car.write_block)
+
+        return cid_to_string(root.cid)
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
@@ -0,0 +1,157 @@
+import hashlib
+
+# same defaults as `ipfs add`: 256KiB chunks, balanced dag of 174 links per node
+CHUNK_SIZE = 256 * 1024
+MAX_LINKS = 174
+
+DAG_PB = 0x70
+RAW = 0x55
+SHA2_256 = 0x12
+
+UNIXFS_RAW = 0
+UNIXFS_DIRECTORY = 1
+UNIXFS_FILE = 2
+
+BASE58_ALPHABET = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
+BASE32_ALPHABET = "abcdefghijklmnopqrstuvwxyz234567"
+
+
+def encode_varint(value):
+    result = bytearray()
+    while value > 0x7F:
+        result.append((value & 0x7F) | 0x80)
+        value >>= 7
+    result.append(value)
+    return bytes(result)
+
+
+def encode_varint_field(number, value):
+    return encode_varint(number << 3) + encode_varint(value)
+
+
+def encode_bytes_field(number, value):
+    return encode_varint(number << 3 | 2) + encode_varint(len(value)) + value
+
+
+def encode_unixfs_data(data_type, data=b"", filesize=None, blocksizes=()):
+    result = encode_varint_field(1, data_type)
+    if data:
+        result += encode_bytes_field(2, data)
+    if filesize is not None:
+        result += encode_varint_field(3, filesize)
+    for blocksize in blocksizes:
+        result += encode_varint_field(4, blocksize)
+    return result
+
+
+def encode_pb_node(links, data):
+    result = b""
+    for link in links:
+        encoded_link = (
+            encode_bytes_field(1, link["cid"])
+            + encode_bytes_field(2, link["name"].encode())
+            + encode_varint_field(3, link["tsize"])
+        )
+        result += encode_bytes_field(2, encoded_link)
+    return result + encode_bytes_field(1, data)
+
+
+def get_cid(block, codec, cid_version):
+    multihash = bytes([SHA2_256, 32]) + hashlib.sha256(block).digest()
+    if cid_version == 0:
+        return multihash
+    return encode_varint(1) + encode_varint(codec) + multihash
+
+
+def encode_base58(value):
+    number = int.from_bytes(value, "big")
+    result = ""
+    while number > 0:
+        number, remainder = divmod(number, 58)
+        result = BASE58_ALPHABET[remainder] + result
+    leading_zeros = len(value) - len(value.lstrip(b"\0"))
+    return BASE58_ALPHABET[0] * leading_zeros + result
+
+
+def encode_base32(value):
+    bits = "".join("{:08b}".format(byte) for byte in value)
+    bits += "0" * (-len(bits) % 5)
+    return "".join(
+        BASE32_ALPHABET[int(bits[i : i + 5], 2)] for i in range(0, len(bits), 5)
+    )
+
+
+def cid_to_string(cid):
+    if len(cid) == 34 and cid[0] == SHA2_256:
+        return encode_base58(cid)
+    return "b" + encode_base32(cid)
+
+
+def ignore_block(cid, block):
+    pass
+
+
+class DagNode:
+    def __init__(self, cid, tsize, filesize):
+        self.cid = cid
+        self.tsize = tsize
+        self.filesize = filesize
+
+    def link(self, name=""):
+        return {"cid": self.cid, "name": name, "tsize": self.tsize}
+
+
+def add_block(block, codec, cid_version, emit):
+    cid = get_cid(block, codec, cid_version)
+    emit(cid, block)
+    return cid
+
+
+def add_leaf(chunk, cid_version, emit, data_type=UNIXFS_FILE):
+    # CIDv1 follows `ipfs add --cid-version=1`, which stores leaves as raw blocks
+    if cid_version == 1:
+        return DagNode(add_block(chunk, RAW, 1, emit), len(chunk), len(chunk))
+
+    block = encode_pb_node([], encode_unixfs_data(data_type, chunk, len(chunk)))
+    return DagNode(add_block(block, DAG_PB, 0, emit), len(block), len(chunk))
+
+
+def add_parent(children, cid_version, emit):
+    filesize = sum(child.filesize for child in children)
+    data = encode_unixfs_data(
+        UNIXFS_FILE, filesize=filesize, blocksizes=[c.filesize for c in children]
+    )
+    block = encode_pb_node([child.link() for child in children], data)
+    tsize = len(block) + sum(child.tsize for child in children)
+    return DagNode(add_block(block, DAG_PB, cid_version, emit), tsize, filesize)
+
+
+def add_file(fp, cid_version=0, emit=ignore_block):
+    layer = []
+    for chunk in iter(lambda: fp.read(CHUNK_SIZE), b""):
+        # the balanced layout of `ipfs add` starts from a File leaf that is the
+        # whole file until a second chunk comes, every later leaf is Raw
+        data_type = UNIXFS_RAW if layer else UNIXFS_FILE
+        layer.append(add_leaf(chunk, cid_version, emit, data_type))
+    if not layer:
+        layer.append(add_leaf(b"", cid_version, emit))
+
+    while len(layer) > 1:
+        layer = [
+            add_parent(layer[i : i + MAX_LINKS], cid_version, emit)
+            for i in range(0, len(layer), MAX_LINKS)
+        ]
+    return layer[0]
+
+
+def add_file_from_path(filepath, cid_version=0, emit=ignore_block):
+    with open(filepath, "rb") as fp:
+        return add_file(fp, cid_version, emit)
+
+
+def add_directory(entries, cid_version=0, emit=ignore_block):
+    links = [entries[name].link(name) for name in sorted(entries)]
+    block = encode_pb_node(links, encode_unixfs_data(UNIXFS_DIRECTORY))
+    tsize = len(block) + sum(link["tsize"] for link in links)
+    filesize = sum(entry.filesize for entry in entries.values())
+    return DagNode(add_block(block, DAG_PB, cid_version, emit), tsize, filesize)
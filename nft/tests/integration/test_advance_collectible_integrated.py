@@ -1,8 +1,8 @@
 from scripts.helpers import is_dev_network, get_account
 from scripts.advanced_collectible.deploy import deploy
 from scripts.advanced_collectible.create_token import create_token
+from vrf import wait_for_request_of
 import pytest
-import time
 
 
 def test_advanced_collectible_integrated():
@@ -10,8 +10,8 @@ def test_advanced_collectible_integrated():
         pytest.skip()
 
     collectible = deploy()
-    create_token(get_account())
-    time.sleep(60)
+    create_tx = create_token(get_account())
+    wait_for_request_of(create_tx, "RequestedCollectible")
 
     assert collectible.getTokenCount() == 1
     assert collectible.ownerOf(0) == get_account()
@@ -0,0 +1,20 @@
+from scripts.dependencies import get_mock_contract
+from scripts.helpers import get_account
+from scripts.advanced_collectible.create_token import create_token
+import pytest
+
+
+@pytest.fixture
+def create_token_and_fulfill_random():
+    def create_and_fulfill(collectible, account, random):
+        create_tx = create_token(account)
+
+        get_mock_contract("vrf_coordinator").fulfillRandomWordsWithOverride(
+            create_tx.events["RequestedCollectible"]["requestId"],
+            collectible.address,
+            [random],
+            {"from": get_account()},
+        )
+        return create_tx
+
+    return create_and_fulfill
@@ -1,9 +1,9 @@
 from scripts.dependencies import get_mock_contract
 from scripts.helpers import is_not_local_network, get_account
 from scripts.advanced_collectible.deploy import deploy
-from scripts.advanced_collectible.create_token import create_token
+from scripts.advanced_collectible.create_token import create_token, create_token_batch
 import pytest
-from brownie import accounts
+from brownie import accounts, exceptions
 
 
 def create_token_and_fulfill_random(collectible, account, random):
@@ -40,3 +40,42 @@ def test_advanced_collectible_create_multiple_token():
     assert collectible.getTokenCount() == 2
     assert collectible.getBreedNameOf(1) == "PUG"
     assert collectible.ownerOf(1) == accounts[1]
+
+
+def test_advanced_collectible_create_token_batch():
+    if is_not_local_network():
+        pytest.skip()
+
+    collectible = deploy()
+    create_tx = create_token_batch(accounts[1], 3)
+
+    get_mock_contract("vrf_coordinator").fulfillRandomWordsWithOverride(
+        create_tx.events["RequestedCollectible"]["requestId"],
+        collectible.address,
+        [8, 12, 10],
+        {"from": get_account()},
+    )
+
+    assert collectible.getTokenCount() == 3
+    assert collectible.getBreedNameOf(0) == "ST_BERNARD"
+    assert collectible.getBreedNameOf(1) == "PUG"
+    assert collectible.getBreedNameOf(2) == "SHIBA_INU"
+    assert collectible.ownerOf(2) == accounts[1]
+
+
+def test_advanced_collectible_batch_must_not_be_empty():
+    if is_not_local_network():
+        pytest.skip()
+
+    deploy()
+    with pytest.raises(exceptions.VirtualMachineError):
+        create_token_batch(get_account(), 0)
+
+
+def test_advanced_collectible_batch_is_capped():
+    if is_not_local_network():
+        pytest.skip()
+
+    collectible = deploy()
+    with pytest.raises(exceptions.VirtualMachineError):
+        create_token_batch(get_account(), collectible.getMaxBatchSize() + 1)
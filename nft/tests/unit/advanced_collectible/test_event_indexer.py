@@ -0,0 +1,57 @@
+from scripts.helpers import is_not_local_network, get_account
+from scripts.advanced_collectible.deploy import deploy
+from scripts.advanced_collectible.event_indexer import EventIndexer, get_event_indexer
+import pytest
+from brownie import accounts
+
+
+def test_indexer_stores_breeds_and_requests(create_token_and_fulfill_random):
+    if is_not_local_network():
+        pytest.skip()
+
+    collectible = deploy()
+    create_token_and_fulfill_random(collectible, get_account(), 8)
+    create_tx = create_token_and_fulfill_random(collectible, accounts[1], 12)
+
+    with EventIndexer(":memory:", initial_range=1) as indexer:
+        indexer.sync(collectible.address, collectible.tx.block_number)
+
+        assert indexer.get_breeds(collectible.address) == {
+            0: "ST_BERNARD",
+            1: "PUG",
+        }
+        assert (
+            indexer.get_request_sender(
+                collectible.address,
+                create_tx.events["RequestedCollectible"]["requestId"],
+            )
+            == accounts[1].address
+        )
+
+
+def test_indexer_resumes_from_checkpoint(create_token_and_fulfill_random):
+    if is_not_local_network():
+        pytest.skip()
+
+    collectible = deploy()
+    create_token_and_fulfill_random(collectible, get_account(), 8)
+
+    with EventIndexer(":memory:") as indexer:
+        indexer.sync(collectible.address, collectible.tx.block_number)
+        assert indexer.get_breeds(collectible.address) == {0: "ST_BERNARD"}
+
+        create_token_and_fulfill_random(collectible, get_account(), 10)
+        indexer.sync(collectible.address, collectible.tx.block_number)
+        assert indexer.get_breeds(collectible.address) == {
+            0: "ST_BERNARD",
+            1: "SHIBA_INU",
+        }
+
+
+def test_local_indexer_is_kept_in_memory():
+    if is_not_local_network():
+        pytest.skip()
+
+    with get_event_indexer() as indexer:
+        # sqlite gives no file name for an in-memory database
+        assert indexer.database.execute("PRAGMA database_list").fetchone()[2] == ""
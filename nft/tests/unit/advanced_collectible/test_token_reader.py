@@ -0,0 +1,19 @@
+from scripts.helpers import is_not_local_network, get_account
+from scripts.advanced_collectible.deploy import deploy
+from scripts.advanced_collectible.token_reader import batch_read
+import json
+import pytest
+
+
+def test_batch_read_returns_plain_values(create_token_and_fulfill_random):
+    if is_not_local_network():
+        pytest.skip()
+
+    collectible = deploy()
+    create_token_and_fulfill_random(collectible, get_account(), 8)
+    create_token_and_fulfill_random(collectible, get_account(), 12)
+
+    breeds = batch_read(collectible.getBreedNameOf, [0, 1], batch_size=1)
+
+    assert [type(breed) for breed in breeds.values()] == [str, str]
+    assert json.loads(json.dumps(breeds)) == {"0": "ST_BERNARD", "1": "PUG"}
@@ -0,0 +1,42 @@
+from scripts.helpers import is_not_local_network, get_account
+from scripts.advanced_collectible.deploy import deploy
+import pytest
+from brownie import accounts, exceptions
+
+BASE_URI = "ipfs://QmUNLLsPACCz1vLxQVkXqqLX5R1X345qqfHbsf67hvA3Nn/"
+
+
+def test_token_uri_is_derived_from_base_uri(create_token_and_fulfill_random):
+    if is_not_local_network():
+        pytest.skip()
+
+    collectible = deploy()
+    create_token_and_fulfill_random(collectible, get_account(), 8)
+    assert collectible.tokenURI(0) == ""
+
+    collectible.setBaseURI(BASE_URI, {"from": get_account()})
+    assert collectible.tokenURI(0) == BASE_URI + "0-ST_BERNARD.json"
+
+
+def test_token_uri_set_per_token_wins_over_base_uri(
+    create_token_and_fulfill_random,
+):
+    if is_not_local_network():
+        pytest.skip()
+
+    collectible = deploy()
+    create_token_and_fulfill_random(collectible, get_account(), 8)
+    collectible.setBaseURI(BASE_URI, {"from": get_account()})
+    collectible.setTokenURI(0, "ipfs://Qm0", {"from": get_account()})
+
+    assert collectible.tokenURI(0) == "ipfs://Qm0"
+
+
+def test_only_owner_can_set_base_uri(create_token_and_fulfill_random):
+    if is_not_local_network():
+        pytest.skip()
+
+    collectible = deploy()
+    create_token_and_fulfill_random(collectible, get_account(), 8)
+    with pytest.raises(exceptions.VirtualMachineError):
+        collectible.setBaseURI(BASE_URI, {"from": accounts[1]})
@@ -0,0 +1,28 @@
+from brownie import accounts
+from scripts.dependencies import get_mock_contract
+from scripts.helpers import is_not_local_network, get_account
+from scripts.advanced_collectible.deploy import deploy
+from scripts.advanced_collectible.create_token import create_token_batch
+from vrf import wait_for_request_of
+from vrf_fulfiller import AutoFulfiller
+import pytest
+
+
+def test_auto_fulfiller_mints_batches():
+    if is_not_local_network():
+        pytest.skip()
+
+    collectible = deploy()
+    fulfiller = AutoFulfiller(
+        get_mock_contract("vrf_coordinator"), accounts[-1], interval=0.05
+    ).start()
+    try:
+        create_txs = [create_token_batch(get_account(), 3) for _ in range(4)]
+        for create_tx in create_txs:
+            wait_for_request_of(create_tx, "RequestedCollectible")
+    finally:
+        fulfiller.stop()
+
+    assert fulfiller.fulfilled == 4
+    assert collectible.getTokenCount() == 12
+    assert collectible.ownerOf(11) == get_account()
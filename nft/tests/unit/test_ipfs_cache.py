@@ -0,0 +1,88 @@
+from scripts.ipfs_cache import UploadCache
+from concurrent.futures import ThreadPoolExecutor
+import time
+
+
+def write(path, content):
+    path.write_bytes(content)
+    return str(path)
+
+
+def counting_upload(uploads, cid):
+    def upload():
+        uploads.append(cid)
+        return cid
+
+    return upload
+
+
+def test_same_content_is_uploaded_once(tmp_path):
+    cache = UploadCache(str(tmp_path / "cache.json"))
+    first = write(tmp_path / "first.png", b"pug")
+    second = write(tmp_path / "second.png", b"pug")
+    uploads = []
+
+    assert cache.get_or_upload(first, counting_upload(uploads, "QmPug")) == "QmPug"
+    assert cache.get_or_upload(second, counting_upload(uploads, "QmOther")) == "QmPug"
+    assert uploads == ["QmPug"]
+
+
+def test_changed_file_is_uploaded_again(tmp_path):
+    cache = UploadCache(str(tmp_path / "cache.json"))
+    image = write(tmp_path / "pug.png", b"pug")
+    uploads = []
+
+    cache.get_or_upload(image, counting_upload(uploads, "QmPug"))
+    write(tmp_path / "pug.png", b"new pug")
+
+    assert cache.get_or_upload(image, counting_upload(uploads, "QmNew")) == "QmNew"
+    assert uploads == ["QmPug", "QmNew"]
+
+
+def test_cache_is_persisted(tmp_path):
+    cache_path = str(tmp_path / "cache" / "development.json")
+    image = write(tmp_path / "pug.png", b"pug")
+    uploads = []
+
+    cache = UploadCache(cache_path)
+    cache.get_or_upload(image, counting_upload(uploads, "QmPug"))
+    cache.save()
+
+    reloaded = UploadCache(cache_path)
+    assert reloaded.get_or_upload(image, counting_upload(uploads, "QmOther")) == "QmPug"
+    assert uploads == ["QmPug"]
+
+
+def test_least_recently_used_cid_is_evicted(tmp_path):
+    cache = UploadCache(str(tmp_path / "cache.json"), max_entries=2)
+    uploads = []
+    pug = write(tmp_path / "pug.png", b"pug")
+    shiba = write(tmp_path / "shiba.png", b"shiba")
+    bernard = write(tmp_path / "bernard.png", b"bernard")
+
+    cache.get_or_upload(pug, counting_upload(uploads, "QmPug"))
+    cache.get_or_upload(shiba, counting_upload(uploads, "QmShiba"))
+    cache.get_or_upload(pug, counting_upload(uploads, "QmPug"))
+    cache.get_or_upload(bernard, counting_upload(uploads, "QmBernard"))
+    cache.get_or_upload(shiba, counting_upload(uploads, "QmShiba"))
+
+    assert uploads == ["QmPug", "QmShiba", "QmBernard", "QmShiba"]
+
+
+def test_concurrent_uploads_of_same_content_are_shared(tmp_path):
+    cache = UploadCache(str(tmp_path / "cache.json"))
+    image = write(tmp_path / "pug.png", b"pug")
+    uploads = []
+
+    def slow_upload():
+        time.sleep(0.1)
+        uploads.append("QmPug")
+        return "QmPug"
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        cids = list(
+            pool.map(lambda _: cache.get_or_upload(image, slow_upload), range(8))
+        )
+
+    assert cids == ["QmPug"] * 8
+    assert uploads == ["QmPug"]
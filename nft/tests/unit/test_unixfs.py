@@ -0,0 +1,119 @@
+from scripts.ipfs_offline import OfflineIpfsUploader
+from scripts.unixfs import (
+    CHUNK_SIZE,
+    UNIXFS_FILE,
+    UNIXFS_RAW,
+    add_directory,
+    add_file,
+    cid_to_string,
+)
+import io
+
+
+def read_varint(fp):
+    value, shift = 0, 0
+    while True:
+        byte = fp.read(1)[0]
+        value |= (byte & 0x7F) << shift
+        shift += 7
+        if byte < 0x80:
+            return value
+
+
+def read_leaf_type(block):
+    fp = io.BytesIO(block)
+    fp.read(1)
+    read_varint(fp)
+    fp.read(1)
+    return read_varint(fp)
+
+
+def read_car_blocks(car_binary):
+    fp = io.BytesIO(car_binary)
+    fp.read(read_varint(fp))
+    blocks = []
+    while fp.tell() < len(car_binary):
+        blocks.append(fp.read(read_varint(fp)))
+    return blocks
+
+
+def test_cid_v0_matches_ipfs_add():
+    assert (
+        cid_to_string(add_file(io.BytesIO(b"hello world\n")).cid)
+        == "QmT78zSuBmuS4z925WZfrqQ1qHaJ56DQaTfyMUF7F8ff5o"
+    )
+    assert (
+        cid_to_string(add_file(io.BytesIO(b"")).cid)
+        == "QmbFMke1KXqnYyBBWxB74N4c5SBnJMVAiMNRcGu6x1AwQH"
+    )
+
+
+def test_cid_v1_matches_ipfs_add():
+    assert (
+        cid_to_string(add_file(io.BytesIO(b"hello world"), cid_version=1).cid)
+        == "bafkreifzjut3te2nhyekklss27nh3k72ysco7y32koao5eei66wof36n5e"
+    )
+
+
+def test_empty_directory_cid_matches_ipfs():
+    assert (
+        cid_to_string(add_directory({}).cid)
+        == "QmUNLLsPACCz1vLxQVkXqqLX5R1X345qqfHbsf67hvA3Nn"
+    )
+    assert (
+        cid_to_string(add_directory({}, cid_version=1).cid)
+        == "bafybeiczsscdsbs7ffqz55asqdf3smv6klcw3gofszvwlyarci47bgf354"
+    )
+
+
+def test_large_file_is_chunked():
+    blocks = []
+    node = add_file(
+        io.BytesIO(b"\1" * (CHUNK_SIZE * 3 + 1)),
+        emit=lambda cid, block: blocks.append(cid),
+    )
+
+    assert node.filesize == CHUNK_SIZE * 3 + 1
+    # the first full chunk is a File leaf, the two after it the same Raw leaf
+    assert len(set(blocks)) == 4
+    assert len(blocks) == 5
+    assert blocks[-1] == node.cid
+
+
+def test_leaf_types_follow_ipfs_add():
+    blocks = []
+    add_file(
+        io.BytesIO(b"\1" * (CHUNK_SIZE * 3 + 1)),
+        emit=lambda cid, block: blocks.append(block),
+    )
+    single_chunk_blocks = []
+    add_file(
+        io.BytesIO(b"\1" * CHUNK_SIZE),
+        emit=lambda cid, block: single_chunk_blocks.append(block),
+    )
+
+    assert [read_leaf_type(block) for block in blocks[:-1]] == [
+        UNIXFS_FILE,
+        UNIXFS_RAW,
+        UNIXFS_RAW,
+        UNIXFS_RAW,
+    ]
+    assert [read_leaf_type(block) for block in single_chunk_blocks] == [UNIXFS_FILE]
+
+
+def test_collection_is_exported_to_car(tmp_path):
+    (tmp_path / "pug.png").write_bytes(b"pug")
+    (tmp_path / "0-PUG.json").write_bytes(b'{"name": "PUG"}')
+    (tmp_path / "1-PUG.json").write_bytes(b'{"name": "PUG"}')
+
+    uploader = OfflineIpfsUploader()
+    urls = uploader.upload_files(
+        [str(tmp_path / name) for name in ["pug.png", "0-PUG.json", "1-PUG.json"]]
+    )
+    root = uploader.export_car(str(tmp_path / "car" / "development.car"))
+
+    assert urls[0].startswith("ipfs://Qm") and urls[0].endswith("?filename=pug.png")
+    assert urls[1].split("?")[0] == urls[2].split("?")[0]
+    car_binary = (tmp_path / "car" / "development.car").read_bytes()
+    assert len(read_car_blocks(car_binary)) == 3
+    assert root.startswith("Qm")
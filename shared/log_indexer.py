@@ -0,0 +1,187 @@
+# Used by nft and stake-yield, their scripts/__init__.py put /shared on the
+# path. `scripts` below is the package of the project running it.
+import abc
+import os
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from brownie import config, network, web3
+from scripts.helpers import is_local_network
+
+CHECKPOINTS_SCHEMA = """
+CREATE TABLE IF NOT EXISTS checkpoints (
+    contract TEXT PRIMARY KEY,
+    block INTEGER NOT NULL
+);
+"""
+
+
+def to_hex(value):
+    value = value if isinstance(value, str) else value.hex()
+    return value if value.startswith("0x") else "0x" + value
+
+
+def get_topic(event_signature):
+    return to_hex(web3.keccak(text=event_signature))
+
+
+def decode_words(data):
+    data = bytes.fromhex(data[2:]) if isinstance(data, str) else bytes(data)
+    return [int.from_bytes(data[i : i + 32], "big") for i in range(0, len(data), 32)]
+
+
+class LogIndexer(abc.ABC):
+    """
+    Incrementally indexes the logs of a contract into sqlite.
+
+    Subclasses give the `schema` of their own tables, the handler of every
+    event signature in `get_handlers` and how a log reaches its handler in
+    `store_log`. Block ranges are fetched in parallel with `eth_getLogs`.
+    The range doubles after every fully successful round and halves when
+    the node rejects one, and the checkpoint only moves past ranges that
+    were stored.
+    """
+
+    schema = ""
+
+    def __init__(
+        self,
+        database_path,
+        initial_range=2000,
+        max_range=100000,
+        concurrency=4,
+        confirmations=0,
+    ):
+        directory = os.path.dirname(database_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.database = sqlite3.connect(database_path)
+        self.database.executescript(CHECKPOINTS_SCHEMA + self.schema)
+        self.range_size = initial_range
+        self.max_range = max_range
+        self.concurrency = concurrency
+        self.confirmations = confirmations
+        self.topics = {
+            get_topic(signature): handler
+            for signature, handler in self.get_handlers().items()
+        }
+
+    @abc.abstractmethod
+    def get_handlers(self):
+        pass
+
+    @abc.abstractmethod
+    def store_log(self, contract_address, log):
+        pass
+
+    def get_checkpoint(self, contract_address):
+        row = self.database.execute(
+            "SELECT block FROM checkpoints WHERE contract = ?", (contract_address,)
+        ).fetchone()
+        return None if row is None else row[0]
+
+    def get_logs(self, contract_address, block_range):
+        from_block, to_block = block_range
+        try:
+            return web3.eth.get_logs(
+                {
+                    "address": contract_address,
+                    "fromBlock": from_block,
+                    "toBlock": to_block,
+                    "topics": [list(self.topics)],
+                }
+            )
+        except ValueError:
+            # too many results or too wide a range for the node
+            return None
+
+    def get_next_ranges(self, start, end):
+        ranges = []
+        while start <= end and len(ranges) < self.concurrency:
+            ranges.append((start, min(start + self.range_size - 1, end)))
+            start += self.range_size
+        return ranges
+
+    def sync(self, contract_address, start_block=0):
+        checkpoint = self.get_checkpoint(contract_address)
+        start = start_block if checkpoint is None else checkpoint + 1
+        end = web3.eth.block_number - self.confirmations
+
+        with ThreadPoolExecutor(max_workers=self.concurrency) as pool:
+            while start <= end:
+                ranges = self.get_next_ranges(start, end)
+                results = pool.map(
+                    lambda block_range: self.get_logs(contract_address, block_range),
+                    ranges,
+                )
+                stored_until = self.store_ranges(contract_address, ranges, results)
+
+                if stored_until is None and self.range_size == 1:
+                    raise ValueError("Node rejected logs of block {}.".format(start))
+                if stored_until is None or stored_until < ranges[-1][1]:
+                    self.range_size = max(1, self.range_size // 2)
+                else:
+                    self.range_size = min(self.range_size * 2, self.max_range)
+                if stored_until is not None:
+                    start = stored_until + 1
+
+    def store_ranges(self, contract_address, ranges, results):
+        stored_until = None
+        with self.database:
+            for (_, to_block), logs in zip(ranges, results):
+                if logs is None:
+                    break
+                for log in logs:
+                    self.store_log(contract_address, log)
+                stored_until = to_block
+
+            if stored_until is not None:
+                self.database.execute(
+                    "INSERT OR REPLACE INTO checkpoints VALUES (?, ?)",
+                    (contract_address, stored_until),
+                )
+        return stored_until
+
+    def close(self):
+        self.database.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+def get_database_path(indexer_config):
+    # local chains restart from scratch, an index kept on disk would go stale
+    if is_local_network():
+        return ":memory:"
+    database_dir = indexer_config.get("database_dir", "./indexer")
+    return "{}/{}.sqlite".format(database_dir, network.show_active())
+
+
+def get_indexer_settings(indexer_config):
+    return {
+        "initial_range": indexer_config.get("initial_range", 2000),
+        "max_range": indexer_config.get("max_range", 100000),
+        "concurrency": indexer_config.get("concurrency", 4),
+        "confirmations": (
+            0 if is_local_network() else indexer_config.get("confirmations", 3)
+        ),
+    }
+
+
+def get_deployment_block(contract, start_block_key):
+    if contract.tx is not None:
+        return contract.tx.block_number
+    if is_local_network():
+        return 0
+    # scanning a live chain from its genesis takes hours
+    network_config = config["networks"].get(network.show_active(), {})
+    start_block = network_config.get(start_block_key)
+    if start_block is None:
+        raise ValueError(
+            "Set {} of {} to the deployment block of {}.".format(
+                start_block_key, network.show_active(), contract.address
+            )
+        )
+    return start_block
@@ -0,0 +1,81 @@
+# Used by nft and lottery_app, their scripts/__init__.py put /shared on the
+# path. `scripts` below is the package of the project running it.
+import time
+from brownie import config, web3
+from scripts.dependencies import get_vrf_coordinator_address
+
+RANDOM_WORDS_FULFILLED = "RandomWordsFulfilled(uint256,uint256,uint96,bool)"
+
+
+def get_wait_config():
+    return config.get("vrf_wait", {})
+
+
+def to_hex(value):
+    value = value if isinstance(value, str) else value.hex()
+    return value if value.startswith("0x") else "0x" + value
+
+
+def wait_for(condition, timeout=300, initial_interval=1, max_interval=15, backoff=1.5):
+    """
+    Polls `condition` until it returns something truthy and returns that.
+
+    The interval starts short, so a fast fulfillment is noticed within a
+    second, and grows up to `max_interval` to go easy on the node while a
+    slow one is pending.
+    """
+    deadline = time.monotonic() + timeout
+    interval = initial_interval
+    while True:
+        result = condition()
+        if result:
+            return result
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise TimeoutError("Gave up waiting after {}s.".format(timeout))
+        time.sleep(min(interval, remaining))
+        interval = min(interval * backoff, max_interval)
+
+
+def get_fulfillment(coordinator_address, request_id, from_block):
+    logs = web3.eth.get_logs(
+        {
+            "address": coordinator_address,
+            "fromBlock": from_block,
+            "toBlock": "latest",
+            "topics": [
+                to_hex(web3.keccak(text=RANDOM_WORDS_FULFILLED)),
+                "0x{:064x}".format(request_id),
+            ],
+        }
+    )
+    if not logs:
+        return None
+    data = to_hex(logs[0]["data"])[2:]
+    return {
+        "request_id": request_id,
+        "output_seed": int(data[0:64], 16),
+        "payment": int(data[64:128], 16),
+        "success": bool(int(data[128:192], 16)),
+        "block_number": logs[0]["blockNumber"],
+    }
+
+
+def wait_for_fulfillment(request_id, from_block, coordinator_address=None):
+    coordinator_address = coordinator_address or get_vrf_coordinator_address()
+    wait_config = get_wait_config()
+    fulfillment = wait_for(
+        lambda: get_fulfillment(coordinator_address, request_id, from_block),
+        timeout=wait_config.get("timeout", 300),
+        initial_interval=wait_config.get("initial_interval", 1),
+        max_interval=wait_config.get("max_interval", 15),
+    )
+    if not fulfillment["success"]:
+        raise ValueError(
+            "Request {} was fulfilled but the callback reverted.".format(request_id)
+        )
+    return fulfillment
+
+
+def wait_for_request_of(tx, event_name):
+    return wait_for_fulfillment(tx.events[event_name]["requestId"], tx.block_number)
@@ -0,0 +1,157 @@
+# Used by nft and lottery_app, their scripts/__init__.py put /shared on the
+# path. `scripts` below is the package of the project running it.
+import threading
+from contextlib import contextmanager
+from brownie import accounts, config, exceptions, web3
+from scripts.dependencies import get_mock_contract
+from scripts.helpers import is_local_network
+from vrf import to_hex
+
+RANDOM_WORDS_REQUESTED = (
+    "RandomWordsRequested(bytes32,uint256,uint256,uint64,uint16,uint32,uint32,address)"
+)
+# the mock forgets a request once it is fulfilled
+ALREADY_FULFILLED = "nonexistent request"
+
+
+def get_auto_fulfill_config():
+    return config.get("vrf_auto_fulfill", {})
+
+
+def decode_random_words_requested(log):
+    data = to_hex(log["data"])[2:]
+    words = [int(data[i : i + 64], 16) for i in range(0, len(data), 64)]
+    request_id, _, _, _, num_words = words
+    return {
+        "request_id": request_id,
+        "num_words": num_words,
+        "consumer": web3.toChecksumAddress(to_hex(log["topics"][3])[-40:]),
+    }
+
+
+def get_seeded_words(seed, request_id, num_words):
+    return [
+        int.from_bytes(
+            web3.solidityKeccak(
+                ["uint256", "uint256", "uint256"], [seed, request_id, i]
+            ),
+            "big",
+        )
+        for i in range(num_words)
+    ]
+
+
+class AutoFulfiller:
+    """
+    Fulfills the requests of a VRFCoordinatorV2Mock from a background thread.
+
+    New RandomWordsRequested logs are polled every `interval` seconds and the
+    fulfillments of up to `batch_size` requests are broadcast before waiting
+    for any of them. Without a `seed` the mock derives the words from the
+    request id, with one they come from keccak(seed, requestId, index).
+    """
+
+    def __init__(self, coordinator, account, interval=0.2, batch_size=50, seed=None):
+        self.coordinator = coordinator
+        self.account = account
+        self.interval = interval
+        self.batch_size = batch_size
+        self.seed = seed
+        self.topic = to_hex(web3.keccak(text=RANDOM_WORDS_REQUESTED))
+        self.from_block = web3.eth.block_number
+        self.fulfilled = 0
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(target=self.run, daemon=True)
+
+    def get_requests(self):
+        to_block = web3.eth.block_number
+        if to_block < self.from_block:
+            return []
+        logs = web3.eth.get_logs(
+            {
+                "address": self.coordinator.address,
+                "fromBlock": self.from_block,
+                "toBlock": to_block,
+                "topics": [self.topic],
+            }
+        )
+        self.from_block = to_block + 1
+        return [decode_random_words_requested(log) for log in logs]
+
+    def get_words(self, request):
+        if self.seed is None:
+            return []
+        return get_seeded_words(self.seed, request["request_id"], request["num_words"])
+
+    def fulfill(self, request):
+        try:
+            return self.coordinator.fulfillRandomWordsWithOverride(
+                request["request_id"],
+                request["consumer"],
+                self.get_words(request),
+                {"from": self.account, "required_confs": 0, "silent": True},
+            )
+        except exceptions.VirtualMachineError as error:
+            # already fulfilled by hand, as the unit tests do
+            if error.revert_msg != ALREADY_FULFILLED:
+                raise
+            return None
+
+    def fulfill_batch(self, requests):
+        txs = [self.fulfill(request) for request in requests]
+        for tx in txs:
+            if tx is None:
+                continue
+            tx.wait(1)
+            if tx.status == 1:
+                self.fulfilled += 1
+            elif tx.revert_msg != ALREADY_FULFILLED:
+                raise ValueError(
+                    "Fulfillment {} reverted: {}".format(tx.txid, tx.revert_msg)
+                )
+
+    def poll(self):
+        requests = self.get_requests()
+        for start in range(0, len(requests), self.batch_size):
+            self.fulfill_batch(requests[start : start + self.batch_size])
+
+    def run(self):
+        while not self.stopped.wait(self.interval):
+            self.poll()
+
+    def start(self):
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.stopped.set()
+        self.thread.join()
+
+
+def is_auto_fulfill_enabled():
+    return is_local_network() and get_auto_fulfill_config().get("enabled", False)
+
+
+def get_auto_fulfiller():
+    auto_fulfill_config = get_auto_fulfill_config()
+    # its own account, so it never races the scripts for a nonce
+    return AutoFulfiller(
+        get_mock_contract("vrf_coordinator"),
+        accounts[-1],
+        interval=auto_fulfill_config.get("interval", 0.2),
+        batch_size=auto_fulfill_config.get("batch_size", 50),
+        seed=auto_fulfill_config.get("seed"),
+    )
+
+
+@contextmanager
+def auto_fulfill():
+    if not is_auto_fulfill_enabled():
+        yield None
+        return
+
+    fulfiller = get_auto_fulfiller().start()
+    try:
+        yield fulfiller
+    finally:
+        fulfiller.stop()
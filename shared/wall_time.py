@@ -0,0 +1,44 @@
+# Used by the tests/conftest.py of stake-yield and lottery_app, which re-export
+# pytest_configure below.
+import time
+import pytest
+
+
+class WallTimeReport:
+    """
+    Wall time of the test run and the time spent in every test module.
+
+    Setup, call and teardown all count, that is where deployments happen.
+    """
+
+    def __init__(self):
+        self.started_at = None
+        self.module_durations = {}
+
+    def pytest_sessionstart(self):
+        self.started_at = time.perf_counter()
+
+    def pytest_runtest_logreport(self, report):
+        module = report.nodeid.split("::")[0]
+        self.module_durations[module] = (
+            self.module_durations.get(module, 0) + report.duration
+        )
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if not self.module_durations:
+            return
+        wall_time = time.perf_counter() - self.started_at
+        terminalreporter.write_sep("=", "wall time")
+        for module, duration in sorted(
+            self.module_durations.items(), key=lambda item: item[1], reverse=True
+        ):
+            terminalreporter.write_line("{:>9.2f}s  {}".format(duration, module))
+        terminalreporter.write_line("{:>9.2f}s  total".format(wall_time))
+
+
+wall_time_report = pytest.StashKey[WallTimeReport]()
+
+
+def pytest_configure(config):
+    config.stash[wall_time_report] = WallTimeReport()
+    config.pluginmanager.register(config.stash[wall_time_report], "wall_time_report")
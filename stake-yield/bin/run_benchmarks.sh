@@ -0,0 +1 @@
+RUN_BENCHMARKS=1 brownie test tests/benchmarks --network development -s
@@ -3,9 +3,13 @@
 pragma solidity ^0.8.0;
 
 import "@openzeppelin/contracts/token/ERC20/ERC20.sol";
+import "@openzeppelin/contracts/token/ERC20/extensions/draft-ERC20Permit.sol";
 
-contract DappToken is ERC20 {
-    constructor(uint256 initialSupplyInWei) ERC20("DAPP TOKEN", "DAPP") {
+contract DappToken is ERC20, ERC20Permit {
+    constructor(uint256 initialSupplyInWei)
+        ERC20("DAPP TOKEN", "DAPP")
+        ERC20Permit("DAPP TOKEN")
+    {
         _mint(msg.sender, initialSupplyInWei);
     }
 }
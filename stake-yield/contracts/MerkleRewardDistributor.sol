@@ -0,0 +1,70 @@
+// SPDX-License-Identifier: MIT
+
+pragma solidity ^0.8.0;
+
+import "@openzeppelin/contracts/access/Ownable.sol";
+import "@openzeppelin/contracts/token/ERC20/IERC20.sol";
+import "@openzeppelin/contracts/token/ERC20/utils/SafeERC20.sol";
+import "@openzeppelin/contracts/utils/cryptography/MerkleProof.sol";
+
+/**
+ * Rewards computed off-chain, one merkle root per epoch.
+ * Holders pull their own reward with a proof of keccak(keccak(abi.encode(holder, amount))).
+ */
+contract MerkleRewardDistributor is Ownable {
+    using SafeERC20 for IERC20;
+
+    IERC20 internal rewardToken;
+    bytes32[] internal epochRoots;
+    mapping(uint256 => mapping(address => bool)) internal claimed;
+
+    constructor(address _rewardTokenAddress) {
+        rewardToken = IERC20(_rewardTokenAddress);
+    }
+
+    function publishEpoch(bytes32 _root, uint256 _total)
+        public
+        onlyOwner
+        returns (uint256)
+    {
+        rewardToken.safeTransferFrom(msg.sender, address(this), _total);
+        epochRoots.push(_root);
+        return epochRoots.length - 1;
+    }
+
+    function getEpochCount() public view returns (uint256) {
+        return epochRoots.length;
+    }
+
+    function getEpochRoot(uint256 _epoch) public view returns (bytes32) {
+        require(_epoch < epochRoots.length, "Unknown epoch.");
+        return epochRoots[_epoch];
+    }
+
+    function isClaimed(uint256 _epoch, address _holder)
+        public
+        view
+        returns (bool)
+    {
+        return claimed[_epoch][_holder];
+    }
+
+    function claim(
+        uint256 _epoch,
+        uint256 _amount,
+        bytes32[] calldata _proof
+    ) public {
+        require(!isClaimed(_epoch, msg.sender), "Reward already claimed.");
+
+        bytes32 _leaf = keccak256(
+            bytes.concat(keccak256(abi.encode(msg.sender, _amount)))
+        );
+        require(
+            MerkleProof.verify(_proof, getEpochRoot(_epoch), _leaf),
+            "Invalid proof."
+        );
+
+        claimed[_epoch][msg.sender] = true;
+        rewardToken.safeTransfer(msg.sender, _amount);
+    }
+}
@@ -4,20 +4,52 @@ pragma solidity ^0.8.0;
 
 import "@openzeppelin/contracts/access/Ownable.sol";
 import "@openzeppelin/contracts/token/ERC20/IERC20.sol";
+import "@openzeppelin/contracts/token/ERC20/extensions/draft-IERC20Permit.sol";
 import "@openzeppelin/contracts/utils/structs/EnumerableSet.sol";
-import "@openzeppelin/contracts/utils/structs/EnumerableMap.sol";
 import "@chainlink/contracts/src/v0.8/interfaces/AggregatorV3Interface.sol";
 
 contract TokenFarm is Ownable {
     using EnumerableSet for EnumerableSet.AddressSet;
-    using EnumerableMap for EnumerableMap.AddressToUintMap;
+
+    struct Portfolio {
+        address holder;
+        address[] tokens;
+        uint256[] balances;
+        uint256[] values;
+        uint256 totalValue;
+    }
 
     EnumerableSet.AddressSet internal allowedTokens;
     mapping(address => address) internal tokenPriceFeeds;
-    mapping(address => mapping(address => uint256)) internal stakesByToken;
-    mapping(address => EnumerableMap.AddressToUintMap) internal stakesByHolder;
+    mapping(address => uint256) internal tokenPriceScales;
+    mapping(address => uint256) internal roundTokenUnitValues;
+    // bit of each allowed token, by its position in allowedTokens
+    mapping(address => uint256) internal tokenBits;
+    mapping(address => uint256) internal totalStakedByToken;
+    // holder => bits of the tokens it has a stake in
+    mapping(address => uint256) internal heldTokens;
+    // holder => token => balance
+    mapping(address => mapping(address => uint256)) internal stakes;
     EnumerableSet.AddressSet internal stakeholders;
     IERC20 internal dappToken;
+    bool internal rewardRoundOpen;
+    uint256 internal rewardCursor;
+    uint256 internal rewardRoundCount;
+
+    event TokenAllowed(address indexed token, address priceFeed);
+    event Staked(
+        address indexed holder,
+        address indexed token,
+        uint256 amount,
+        uint256 balance
+    );
+    event Unstaked(
+        address indexed holder,
+        address indexed token,
+        uint256 amount
+    );
+    event RewardRoundStarted(uint256 indexed round, uint256 stakeholders);
+    event Rewarded(address indexed holder, uint256 amount);
 
     constructor(address _dappTokenAddress, address _dappTokenPriceFeed) {
         dappToken = IERC20(_dappTokenAddress);
@@ -28,8 +60,20 @@ contract TokenFarm is Ownable {
         public
         onlyOwner
     {
-        allowedTokens.add(_token);
+        bool _isNew = allowedTokens.add(_token);
+        if (_isNew) {
+            require(allowedTokens.length() <= 256, "Too many allowed tokens.");
+            tokenBits[_token] = 1 << (allowedTokens.length() - 1);
+        }
         tokenPriceFeeds[_token] = _priceFeed;
+        // feed decimals never change, no need to ask for them on every read
+        tokenPriceScales[_token] =
+            10**(18 - AggregatorV3Interface(_priceFeed).decimals());
+        if (_isNew && rewardRoundOpen) {
+            // the round prices were read before this token was allowed
+            roundTokenUnitValues[_token] = getTokenUnitValue(_token);
+        }
+        emit TokenAllowed(_token, _priceFeed);
     }
 
     function isTokenAllowed(address _token) public view returns (bool) {
@@ -37,11 +81,9 @@ contract TokenFarm is Ownable {
     }
 
     function getTokenUnitValue(address _token) public view returns (uint256) {
-        AggregatorV3Interface _priceFeed = AggregatorV3Interface(
-            tokenPriceFeeds[_token]
-        );
-        (, int256 price, , , ) = _priceFeed.latestRoundData();
-        return uint256(price) * (10**(18 - _priceFeed.decimals()));
+        (, int256 price, , , ) = AggregatorV3Interface(tokenPriceFeeds[_token])
+            .latestRoundData();
+        return uint256(price) * tokenPriceScales[_token];
     }
 
     function stake(address _token, uint256 _amount) public {
@@ -50,23 +92,55 @@ contract TokenFarm is Ownable {
 
         IERC20(_token).transferFrom(msg.sender, address(this), _amount);
 
-        stakesByToken[_token][msg.sender] += _amount;
+        stakes[msg.sender][_token] += _amount;
+        totalStakedByToken[_token] += _amount;
+
+        uint256 _heldTokens = heldTokens[msg.sender];
+        if (_heldTokens & tokenBits[_token] == 0) {
+            if (_heldTokens == 0) {
+                stakeholders.add(msg.sender);
+            }
+            heldTokens[msg.sender] = _heldTokens | tokenBits[_token];
+        }
+        emit Staked(msg.sender, _token, _amount, stakes[msg.sender][_token]);
+    }
 
-        uint256 _tokenBalance = isStakeholder(msg.sender) ? getStakeholderTokenBalance(msg.sender, _token) : 0;
-        stakesByHolder[msg.sender].set(_token, _tokenBalance + _amount);
-        stakeholders.add(msg.sender);
+    /**
+     * Stakes with an EIP-2612 signature instead of a prior approve,
+     * so a stake is one transaction.
+     */
+    function stakeWithPermit(
+        address _token,
+        uint256 _amount,
+        uint256 _deadline,
+        uint8 _v,
+        bytes32 _r,
+        bytes32 _s
+    ) public {
+        // a permit front run from the mempool already set the allowance,
+        // stake still goes through, or fails in transferFrom if it did not
+        try
+            IERC20Permit(_token).permit(
+                msg.sender,
+                address(this),
+                _amount,
+                _deadline,
+                _v,
+                _r,
+                _s
+            )
+        {} catch {}
+        stake(_token, _amount);
     }
 
     function getTotalStakedToken(address _token) public view returns (uint256) {
-        uint256 result = 0;
-        for (uint256 i = 0; i < stakeholders.length(); i++) {
-            result += stakesByToken[_token][stakeholders.at(i)];
-        }
-        return result;
+        return totalStakedByToken[_token];
     }
 
     function isStakeholder(address _user) public view returns (bool) {
-        return stakeholders.contains(_user);
+        // a holder that unstaked everything during a reward round stays in
+        // the set until a round's cursor gets to it
+        return heldTokens[_user] != 0;
     }
 
     function unstake(address _token) public {
@@ -77,11 +151,16 @@ contract TokenFarm is Ownable {
 
         IERC20(_token).transfer(msg.sender, _tokenBalance);
 
-        stakesByToken[_token][msg.sender] = 0;
-        stakesByHolder[msg.sender].remove(_token);
-        if (stakesByHolder[msg.sender].length() == 0) {
+        stakes[msg.sender][_token] = 0;
+        totalStakedByToken[_token] -= _tokenBalance;
+        uint256 _heldTokens = heldTokens[msg.sender] & ~tokenBits[_token];
+        heldTokens[msg.sender] = _heldTokens;
+        // removing moves the last stakeholder into the freed slot, which may
+        // be behind the reward cursor, so during a round the cursor does it
+        if (_heldTokens == 0 && !rewardRoundOpen) {
             stakeholders.remove(msg.sender);
         }
+        emit Unstaked(msg.sender, _token, _tokenBalance);
     }
 
     function getStakeholderTokenBalance(address _holder, address _token)
@@ -91,9 +170,29 @@ contract TokenFarm is Ownable {
     {
         require(isStakeholder(_holder), "Unknown stakeholder.");
 
-        return stakesByHolder[_holder].contains(_token) 
-            ? stakesByHolder[_holder].get(_token) 
-            : 0;
+        return stakes[_holder][_token];
+    }
+
+    function getHeldTokens(address _holder)
+        internal
+        view
+        returns (address[] memory)
+    {
+        uint256 _bits = heldTokens[_holder];
+        uint256 _count = 0;
+        for (uint256 _rest = _bits; _rest != 0; _rest &= _rest - 1) {
+            _count++;
+        }
+
+        address[] memory _tokens = new address[](_count);
+        _count = 0;
+        for (uint256 i = 0; _bits != 0; i++) {
+            if (_bits & 1 == 1) {
+                _tokens[_count++] = allowedTokens.at(i);
+            }
+            _bits >>= 1;
+        }
+        return _tokens;
     }
 
     function getStakeholderTokenValue(address _stakeholder, address _token)
@@ -106,13 +205,87 @@ contract TokenFarm is Ownable {
     }
 
     function reward() public onlyOwner {
-        for (uint256 i = 0; i < stakeholders.length(); i++) {
-            rewardStakeholder(stakeholders.at(i));
+        startRewardRound();
+        rewardNextStakeholders(stakeholders.length());
+    }
+
+    /**
+     * A round rewards every stakeholder once, in batches of bounded gas,
+     * so it keeps working however many stakeholders the farm has.
+     * Prices are read once when the round starts and used for every batch.
+     * Stakeholders that unstaked everything are removed, not rewarded,
+     * when the cursor gets to them.
+     */
+    function startRewardRound() public onlyOwner {
+        require(!rewardRoundOpen, "Reward round in progress.");
+        rewardRoundOpen = true;
+        rewardCursor = 0;
+
+        for (uint256 i = 0; i < allowedTokens.length(); i++) {
+            address _token = allowedTokens.at(i);
+            roundTokenUnitValues[_token] = getTokenUnitValue(_token);
+        }
+        emit RewardRoundStarted(rewardRoundCount++, stakeholders.length());
+    }
+
+    function rewardNextStakeholders(uint256 _count)
+        public
+        onlyOwner
+        returns (uint256)
+    {
+        require(rewardRoundOpen, "No reward round in progress.");
+
+        uint256 _cursor = rewardCursor;
+        for (uint256 i = 0; i < _count && _cursor < stakeholders.length(); i++) {
+            address _stakeholder = stakeholders.at(_cursor);
+            if (heldTokens[_stakeholder] == 0) {
+                // the last stakeholder takes its slot, still ahead of the cursor
+                stakeholders.remove(_stakeholder);
+            } else {
+                rewardStakeholderAtRoundPrices(_stakeholder);
+                _cursor++;
+            }
         }
+        rewardCursor = _cursor;
+
+        if (_cursor == stakeholders.length()) {
+            rewardRoundOpen = false;
+        }
+        return stakeholders.length() - _cursor;
+    }
+
+    function getRewardRoundProgress()
+        public
+        view
+        returns (
+            bool,
+            uint256,
+            uint256
+        )
+    {
+        return (rewardRoundOpen, rewardCursor, stakeholders.length());
+    }
+
+    function getRewardRoundCount() public view returns (uint256) {
+        return rewardRoundCount;
     }
 
     function rewardStakeholder(address _stakeholder) public onlyOwner {
-        dappToken.transferFrom(msg.sender, _stakeholder, getStakeholderTotalValue(_stakeholder) / 10);
+        uint256 _reward = getStakeholderTotalValue(_stakeholder) / 10;
+        dappToken.transferFrom(msg.sender, _stakeholder, _reward);
+        emit Rewarded(_stakeholder, _reward);
+    }
+
+    function rewardStakeholderAtRoundPrices(address _stakeholder) internal {
+        uint256 _value = 0;
+        address[] memory _tokens = getHeldTokens(_stakeholder);
+        for (uint256 i = 0; i < _tokens.length; i++) {
+            _value +=
+                (roundTokenUnitValues[_tokens[i]] * stakes[_stakeholder][_tokens[i]]) /
+                (10**18);
+        }
+        dappToken.transferFrom(msg.sender, _stakeholder, _value / 10);
+        emit Rewarded(_stakeholder, _value / 10);
     }
 
     function getStakeholderTotalValue(address _holder)
@@ -123,11 +296,75 @@ contract TokenFarm is Ownable {
         require(isStakeholder(_holder), "Unknown stakeholder.");
 
         uint256 balance = 0;
-        address _token;
-        for (uint256 i = 0; i < stakesByHolder[_holder].length(); i++) {
-            (_token, ) = stakesByHolder[_holder].at(i);
-            balance += getStakeholderTokenValue(_holder, _token);
+        address[] memory _tokens = getHeldTokens(_holder);
+        for (uint256 i = 0; i < _tokens.length; i++) {
+            balance += getStakeholderTokenValue(_holder, _tokens[i]);
         }
         return balance;
     }
+
+    function getStakeholderCount() public view returns (uint256) {
+        return stakeholders.length();
+    }
+
+    function getStakeholders(uint256 _offset, uint256 _limit)
+        public
+        view
+        returns (address[] memory)
+    {
+        uint256 _end = _offset + _limit;
+        if (_end > stakeholders.length()) {
+            _end = stakeholders.length();
+        }
+        if (_offset >= _end) {
+            return new address[](0);
+        }
+
+        address[] memory _holders = new address[](_end - _offset);
+        for (uint256 i = _offset; i < _end; i++) {
+            _holders[i - _offset] = stakeholders.at(i);
+        }
+        return _holders;
+    }
+
+    /**
+     * Everything a holder has staked, valued at current prices, in one call.
+     * Unlike the per token getters it returns an empty portfolio for
+     * addresses that are not stakeholders instead of reverting.
+     */
+    function getStakeholderPortfolio(address _holder)
+        public
+        view
+        returns (Portfolio memory)
+    {
+        address[] memory _tokens = getHeldTokens(_holder);
+        Portfolio memory _portfolio = Portfolio(
+            _holder,
+            _tokens,
+            new uint256[](_tokens.length),
+            new uint256[](_tokens.length),
+            0
+        );
+        for (uint256 i = 0; i < _tokens.length; i++) {
+            uint256 _balance = stakes[_holder][_tokens[i]];
+            uint256 _value = (getTokenUnitValue(_tokens[i]) * _balance) / (10**18);
+            _portfolio.balances[i] = _balance;
+            _portfolio.values[i] = _value;
+            _portfolio.totalValue += _value;
+        }
+        return _portfolio;
+    }
+
+    function getStakeholderPortfolios(uint256 _offset, uint256 _limit)
+        public
+        view
+        returns (Portfolio[] memory)
+    {
+        address[] memory _holders = getStakeholders(_offset, _limit);
+        Portfolio[] memory _portfolios = new Portfolio[](_holders.length);
+        for (uint256 i = 0; i < _holders.length; i++) {
+            _portfolios[i] = getStakeholderPortfolio(_holders[i]);
+        }
+        return _portfolios;
+    }
 }
@@ -0,0 +1,78 @@
+// SPDX-License-Identifier: MIT
+
+pragma solidity ^0.8.0;
+
+import "@openzeppelin/contracts/access/Ownable.sol";
+import "@openzeppelin/contracts/token/ERC20/IERC20.sol";
+import "@openzeppelin/contracts/utils/structs/EnumerableSet.sol";
+import "@openzeppelin/contracts/utils/structs/EnumerableMap.sol";
+
+/**
+ * The stake bookkeeping TokenFarm used before the compact layout,
+ * every balance written both by token and by holder. Only kept to
+ * compare the gas of stake and unstake against it.
+ */
+contract MockDoubleBookkeepingTokenFarm is Ownable {
+    using EnumerableSet for EnumerableSet.AddressSet;
+    using EnumerableMap for EnumerableMap.AddressToUintMap;
+
+    EnumerableSet.AddressSet internal allowedTokens;
+    mapping(address => mapping(address => uint256)) internal stakesByToken;
+    mapping(address => uint256) internal totalStakedByToken;
+    mapping(address => EnumerableMap.AddressToUintMap) internal stakesByHolder;
+    EnumerableSet.AddressSet internal stakeholders;
+
+    function addAllowedToken(address _token) public onlyOwner {
+        allowedTokens.add(_token);
+    }
+
+    function isTokenAllowed(address _token) public view returns (bool) {
+        return allowedTokens.contains(_token);
+    }
+
+    function stake(address _token, uint256 _amount) public {
+        require(_amount > 0, "Amount must be greater than 0.");
+        require(isTokenAllowed(_token), "Token is not allowed.");
+
+        IERC20(_token).transferFrom(msg.sender, address(this), _amount);
+
+        stakesByToken[_token][msg.sender] += _amount;
+        totalStakedByToken[_token] += _amount;
+
+        uint256 _tokenBalance = isStakeholder(msg.sender) ? getStakeholderTokenBalance(msg.sender, _token) : 0;
+        stakesByHolder[msg.sender].set(_token, _tokenBalance + _amount);
+        stakeholders.add(msg.sender);
+    }
+
+    function isStakeholder(address _user) public view returns (bool) {
+        return stakeholders.contains(_user);
+    }
+
+    function unstake(address _token) public {
+        require(isStakeholder(msg.sender), "Unknown stakeholder.");
+
+        uint256 _tokenBalance = getStakeholderTokenBalance(msg.sender, _token);
+        require(_tokenBalance > 0, "Balance must be greater than 0.");
+
+        IERC20(_token).transfer(msg.sender, _tokenBalance);
+
+        stakesByToken[_token][msg.sender] = 0;
+        totalStakedByToken[_token] -= _tokenBalance;
+        stakesByHolder[msg.sender].remove(_token);
+        if (stakesByHolder[msg.sender].length() == 0) {
+            stakeholders.remove(msg.sender);
+        }
+    }
+
+    function getStakeholderTokenBalance(address _holder, address _token)
+        public
+        view
+        returns (uint256)
+    {
+        require(isStakeholder(_holder), "Unknown stakeholder.");
+
+        return stakesByHolder[_holder].contains(_token) 
+            ? stakesByHolder[_holder].get(_token) 
+            : 0;
+    }
+}
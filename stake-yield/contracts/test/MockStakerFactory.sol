@@ -0,0 +1,38 @@
+// SPDX-License-Identifier: MIT
+
+pragma solidity ^0.8.0;
+
+import "@openzeppelin/contracts/token/ERC20/IERC20.sol";
+import "../TokenFarm.sol";
+
+contract MockStaker {
+    function stake(
+        TokenFarm _farm,
+        IERC20 _token,
+        uint256 _amount
+    ) external {
+        _token.approve(address(_farm), _amount);
+        _farm.stake(address(_token), _amount);
+    }
+}
+
+/**
+ * Fills a farm with stakeholders for the gas benchmarks,
+ * many per transaction instead of four transactions per account.
+ */
+contract MockStakerFactory {
+    function addStakers(
+        TokenFarm _farm,
+        IERC20[] calldata _tokens,
+        uint256 _count,
+        uint256 _amount
+    ) external {
+        for (uint256 i = 0; i < _count; i++) {
+            MockStaker _staker = new MockStaker();
+            for (uint256 j = 0; j < _tokens.length; j++) {
+                _tokens[j].transferFrom(msg.sender, address(_staker), _amount);
+                _staker.stake(_farm, _tokens[j], _amount);
+            }
+        }
+    }
+}
@@ -3,9 +3,13 @@
 pragma solidity ^0.8.0;
 
 import "@openzeppelin/contracts/token/ERC20/ERC20.sol";
+import "@openzeppelin/contracts/token/ERC20/extensions/draft-ERC20Permit.sol";
 
-contract MockWETH is ERC20 {
-    constructor(uint256 initialSupplyInWei) ERC20("Mock WETH", "WETH") {
+contract MockWETH is ERC20, ERC20Permit {
+    constructor(uint256 initialSupplyInWei)
+        ERC20("Mock WETH", "WETH")
+        ERC20Permit("Mock WETH")
+    {
         _mint(msg.sender, initialSupplyInWei);
     }
 }
@@ -2,7 +2,7 @@ import { useEthers } from "@usedapp/core";
 import helperConfig from "../helper-config.json";
 import { makeStyles } from "@material-ui/core";
 import { constants } from "ethers";
-import networkMapping from "../chain-info/deployments/map.json";
+import chainExport from "../chain-export.json";
 import brownieConfig from "../brownie-config.json";
 import { YourWallet } from "./your-wallet";
 
@@ -24,10 +24,10 @@ export const Main = () => {
   const classes = useStyles();
   const { account, chainId } = useEthers();
   let chainIdStr = chainId ? String(chainId) : "default";
-  const chainIdKey = chainIdStr as keyof typeof networkMapping;
-  const dappAddress = chainId ? networkMapping[chainIdKey]["DappToken"][0] : constants.AddressZero;
-  const wethAddress = chainId ? networkMapping[chainIdKey]["MockWETH"][0] : constants.AddressZero;
-  const fauAddress = chainId ? networkMapping[chainIdKey]["MockFAU"][0] : constants.AddressZero;
+  const chainIdKey = chainIdStr as keyof typeof chainExport.networks;
+  const dappAddress = chainId ? chainExport.networks[chainIdKey]["DappToken"] : constants.AddressZero;
+  const wethAddress = chainId ? chainExport.networks[chainIdKey]["MockWETH"] : constants.AddressZero;
+  const fauAddress = chainId ? chainExport.networks[chainIdKey]["MockFAU"] : constants.AddressZero;
 
   const supportedTokens: Array<Token> = [
     {
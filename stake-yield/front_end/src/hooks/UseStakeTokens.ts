@@ -1,21 +1,19 @@
 import { useEffect, useState } from "react";
 import { useEthers, useContractFunction, Notification } from "@usedapp/core";
 import { constants, utils } from "ethers";
-import TokenFarm from "../chain-info/contracts/TokenFarm.json";
-import ERC20 from "../chain-info/contracts/dependencies/OpenZeppelin/openzeppelin-contracts@4.7.0/IERC20.json";
+import chainExport from "../chain-export.json";
 import { Contract } from "@ethersproject/contracts";
-import networkMapping from "../chain-info/deployments/map.json";
 
 export const useStakeTokens = (tokenAddress: string) => {
   const { chainId } = useEthers();
-  const { abi } = TokenFarm;
+  const abi = chainExport.abis.TokenFarm;
   let chainIdStr = chainId ? String(chainId) : "default";
-  const chainIdKey = chainIdStr as keyof typeof networkMapping;
-  const tokenFarmAddress = chainId ? networkMapping[chainIdKey]["TokenFarm"][0] : constants.AddressZero;
+  const chainIdKey = chainIdStr as keyof typeof chainExport.networks;
+  const tokenFarmAddress = chainId ? chainExport.networks[chainIdKey]["TokenFarm"] : constants.AddressZero;
   const tokenFarmInterface = new utils.Interface(abi);
   const tokenFarmContract = new Contract(tokenFarmAddress, tokenFarmInterface);
 
-  const erc20ABI = ERC20.abi;
+  const erc20ABI = chainExport.abis.IERC20;
   const erc20Interface = new utils.Interface(erc20ABI);
   const erc20Contract = new Contract(tokenAddress, erc20Interface);
 
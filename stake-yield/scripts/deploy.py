@@ -1,7 +1,4 @@
-import json
 import yaml
-import os
-import shutil
 from scripts.helpers import (
     get_account,
     is_not_dev_network,
@@ -9,7 +6,8 @@ from scripts.helpers import (
     should_update_front_end,
 )
 from scripts.dependencies import get_contract_address
-from brownie import DappToken, TokenFarm
+from scripts.front_end import sync_front_end, to_minified_json, write_atomically
+from brownie import DappToken, TokenFarm, MerkleRewardDistributor
 
 ALLOWED_TOKENS = {"weth_token": "eth_usd_price_feed", "fau_token": "dai_usd_price_feed"}
 
@@ -27,6 +25,14 @@ def deploy_token_farm(dapp_token):
     )
 
 
+def deploy_reward_distributor(dapp_token):
+    return MerkleRewardDistributor.deploy(
+        dapp_token,
+        {"from": get_account()},
+        publish_source=is_not_dev_network(),
+    )
+
+
 def transfer_dapp_token_to_farm(dapp_token, token_farm):
     tx = dapp_token.transfer(
         token_farm,
@@ -49,22 +55,19 @@ def add_extra_allowed_tokens_to_farm(token_farm):
 
 
 def update_front_end():
-    copy_folders_to_front_end("./build", "./front_end/src/chain-info")
+    copied, removed = sync_front_end("./build", "./front_end/src")
     with open("brownie-config.yaml", "r") as brownie_config_yaml:
         config_dict = yaml.load(brownie_config_yaml, Loader=yaml.FullLoader)
-        with open("./front_end/src/brownie-config.json", "w") as brownie_config_json:
-            json.dump(config_dict, brownie_config_json)
-
-
-def copy_folders_to_front_end(src, dest):
-    if os.path.exists(dest):
-        shutil.rmtree(dest)
-    shutil.copytree(src, dest)
+    write_atomically(
+        "./front_end/src/brownie-config.json", to_minified_json(config_dict)
+    )
+    print("Front end: {} files updated, {} removed".format(len(copied), len(removed)))
 
 
 def deploy():
     dapp_token = deploy_dapp_token()
     token_farm = deploy_token_farm(dapp_token)
+    deploy_reward_distributor(dapp_token)
     transfer_dapp_token_to_farm(dapp_token, token_farm)
     add_extra_allowed_tokens_to_farm(token_farm)
     if should_update_front_end():
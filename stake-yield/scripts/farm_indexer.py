@@ -0,0 +1,252 @@
+import time
+from brownie import TokenFarm, config, web3
+from log_indexer import (
+    LogIndexer,
+    decode_words,
+    get_database_path,
+    get_deployment_block,
+    get_indexer_settings,
+    to_hex,
+)
+
+TOKEN_ALLOWED = "TokenAllowed(address,address)"
+STAKED = "Staked(address,address,uint256,uint256)"
+UNSTAKED = "Unstaked(address,address,uint256)"
+REWARDED = "Rewarded(address,uint256)"
+REWARD_ROUND_STARTED = "RewardRoundStarted(uint256,uint256)"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS allowed_tokens (
+    contract TEXT NOT NULL,
+    token TEXT NOT NULL,
+    price_feed TEXT NOT NULL,
+    PRIMARY KEY (contract, token)
+);
+CREATE TABLE IF NOT EXISTS stakes (
+    contract TEXT NOT NULL,
+    holder TEXT NOT NULL,
+    token TEXT NOT NULL,
+    balance TEXT NOT NULL,
+    sort_balance REAL NOT NULL,
+    PRIMARY KEY (contract, holder, token)
+);
+CREATE INDEX IF NOT EXISTS stakes_by_balance
+    ON stakes (contract, token, sort_balance DESC);
+CREATE TABLE IF NOT EXISTS history (
+    contract TEXT NOT NULL,
+    block INTEGER NOT NULL,
+    log_index INTEGER NOT NULL,
+    tx_hash TEXT NOT NULL,
+    holder TEXT NOT NULL,
+    event TEXT NOT NULL,
+    token TEXT,
+    amount TEXT NOT NULL,
+    PRIMARY KEY (contract, block, log_index)
+);
+CREATE INDEX IF NOT EXISTS history_by_holder ON history (contract, holder, block);
+CREATE TABLE IF NOT EXISTS reward_rounds (
+    contract TEXT NOT NULL,
+    round INTEGER NOT NULL,
+    block INTEGER NOT NULL,
+    stakeholders INTEGER NOT NULL,
+    PRIMARY KEY (contract, round)
+);
+"""
+
+
+def get_indexer_config():
+    return config.get("farm_indexer", {})
+
+
+def to_address(value):
+    if isinstance(value, int):
+        value = value.to_bytes(32, "big")
+    return web3.toChecksumAddress(to_hex(value)[-40:])
+
+
+class FarmIndexer(LogIndexer):
+    """
+    Incrementally indexes the TokenFarm events into sqlite.
+
+    Current positions are kept next to the full event history, so TVL, top
+    holders and per holder history are answered locally. Token amounts are
+    stored as text to keep all 256 bits, with a float copy to sort on.
+    """
+
+    schema = SCHEMA
+
+    def get_handlers(self):
+        return {
+            TOKEN_ALLOWED: self.store_token_allowed,
+            STAKED: self.store_staked,
+            UNSTAKED: self.store_unstaked,
+            REWARDED: self.store_rewarded,
+            REWARD_ROUND_STARTED: self.store_reward_round_started,
+        }
+
+    def store_log(self, contract_address, log):
+        topics = [to_hex(topic) for topic in log["topics"]]
+        indexed = [int(topic, 16) for topic in topics[1:]]
+        self.topics[topics[0]](
+            contract_address, indexed, decode_words(log["data"]), log
+        )
+
+    def store_history(self, contract_address, log, holder, event, token, amount):
+        self.database.execute(
+            "INSERT OR REPLACE INTO history VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                contract_address,
+                log["blockNumber"],
+                log["logIndex"],
+                to_hex(log["transactionHash"]),
+                holder,
+                event,
+                token,
+                str(amount),
+            ),
+        )
+
+    def store_balance(self, contract_address, holder, token, balance):
+        if balance == 0:
+            self.database.execute(
+                "DELETE FROM stakes WHERE contract = ? AND holder = ? AND token = ?",
+                (contract_address, holder, token),
+            )
+            return
+        self.database.execute(
+            "INSERT OR REPLACE INTO stakes VALUES (?, ?, ?, ?, ?)",
+            (contract_address, holder, token, str(balance), float(balance)),
+        )
+
+    def store_token_allowed(self, contract_address, indexed, words, log):
+        (token,) = indexed
+        (price_feed,) = words
+        self.database.execute(
+            "INSERT OR REPLACE INTO allowed_tokens VALUES (?, ?, ?)",
+            (contract_address, to_address(token), to_address(price_feed)),
+        )
+
+    def store_staked(self, contract_address, indexed, words, log):
+        holder, token = map(to_address, indexed)
+        amount, balance = words
+        self.store_balance(contract_address, holder, token, balance)
+        self.store_history(contract_address, log, holder, "stake", token, amount)
+
+    def store_unstaked(self, contract_address, indexed, words, log):
+        holder, token = map(to_address, indexed)
+        (amount,) = words
+        self.store_balance(contract_address, holder, token, 0)
+        self.store_history(contract_address, log, holder, "unstake", token, amount)
+
+    def store_rewarded(self, contract_address, indexed, words, log):
+        (holder,) = indexed
+        (amount,) = words
+        self.store_history(
+            contract_address, log, to_address(holder), "reward", None, amount
+        )
+
+    def store_reward_round_started(self, contract_address, indexed, words, log):
+        (round_id,) = indexed
+        (stakeholders,) = words
+        self.database.execute(
+            "INSERT OR REPLACE INTO reward_rounds VALUES (?, ?, ?, ?)",
+            (contract_address, round_id, log["blockNumber"], stakeholders),
+        )
+
+    def get_allowed_tokens(self, contract_address):
+        rows = self.database.execute(
+            "SELECT token, price_feed FROM allowed_tokens WHERE contract = ?",
+            (contract_address,),
+        )
+        return dict(rows)
+
+    def get_total_staked(self, contract_address):
+        rows = self.database.execute(
+            "SELECT token, balance FROM stakes WHERE contract = ?",
+            (contract_address,),
+        )
+        totals = {}
+        for token, balance in rows:
+            totals[token] = totals.get(token, 0) + int(balance)
+        return totals
+
+    def get_tvl(self, contract_address, unit_values):
+        """
+        Value of everything staked, with the wei value of one whole token
+        of each token as `getTokenUnitValue` returns it.
+        """
+        totals = self.get_total_staked(contract_address)
+        return sum(
+            unit_values[token] * total // 10**18 for token, total in totals.items()
+        )
+
+    def get_holder_history(self, contract_address, holder):
+        rows = self.database.execute(
+            "SELECT block, tx_hash, event, token, amount FROM history"
+            " WHERE contract = ? AND holder = ? ORDER BY block, log_index",
+            (contract_address, holder),
+        )
+        return [
+            {
+                "block": block,
+                "tx_hash": tx_hash,
+                "event": event,
+                "token": token,
+                "amount": int(amount),
+            }
+            for block, tx_hash, event, token, amount in rows
+        ]
+
+    def get_reward_rounds(self, contract_address):
+        rows = self.database.execute(
+            "SELECT round, block, stakeholders FROM reward_rounds"
+            " WHERE contract = ? ORDER BY round",
+            (contract_address,),
+        )
+        return [
+            {"round": round_id, "block": block, "stakeholders": stakeholders}
+            for round_id, block, stakeholders in rows
+        ]
+
+    def get_top_holders(self, contract_address, token, limit=10):
+        rows = self.database.execute(
+            "SELECT holder, balance FROM stakes WHERE contract = ? AND token = ?"
+            " ORDER BY sort_balance DESC LIMIT ?",
+            (contract_address, token, limit),
+        )
+        return [(holder, int(balance)) for holder, balance in rows]
+
+
+def get_farm_indexer():
+    indexer_config = get_indexer_config()
+    return FarmIndexer(
+        get_database_path(indexer_config), **get_indexer_settings(indexer_config)
+    )
+
+
+def sync_farm(indexer, token_farm):
+    indexer.sync(
+        token_farm.address, get_deployment_block(token_farm, "farm_indexer_start_block")
+    )
+
+
+def follow_farm(indexer, token_farm, interval=5):
+    while True:
+        sync_farm(indexer, token_farm)
+        time.sleep(interval)
+
+
+def tail():
+    with get_farm_indexer() as indexer:
+        follow_farm(indexer, TokenFarm[-1])
+
+
+def main():
+    token_farm = TokenFarm[-1]
+    with get_farm_indexer() as indexer:
+        sync_farm(indexer, token_farm)
+        tokens = indexer.get_allowed_tokens(token_farm.address)
+        unit_values = {token: token_farm.getTokenUnitValue(token) for token in tokens}
+        print("TVL: {}".format(indexer.get_tvl(token_farm.address, unit_values) / 1e18))
+        for token in tokens:
+            print(token, indexer.get_top_holders(token_farm.address, token, 5))
@@ -0,0 +1,69 @@
+from brownie import TokenFarm, multicall, config, network
+from scripts.helpers import get_account
+
+
+def get_batch_size():
+    return config.get("multicall_batch_size", 200)
+
+
+def get_page_size():
+    return config.get("portfolio_page_size", 100)
+
+
+def get_multicall_address():
+    # local chains deploy their own Multicall2 when this is missing
+    return config["networks"].get(network.show_active(), {}).get("multicall2")
+
+
+def to_portfolio(result):
+    holder, tokens, balances, values, total_value = result
+    return {
+        "holder": holder,
+        "tokens": {
+            token: {"balance": balance, "value": value}
+            for token, balance, value in zip(tokens, balances, values)
+        },
+        "total_value": total_value,
+    }
+
+
+def get_portfolios(token_farm, holders, batch_size=None):
+    """
+    Portfolios of the given holders, `batch_size` of them per eth_call.
+    """
+    batch_size = batch_size or get_batch_size()
+    holders = list(holders)
+    results = {}
+    with multicall(address=get_multicall_address()):
+        for start in range(0, len(holders), batch_size):
+            for holder in holders[start : start + batch_size]:
+                results[holder] = token_farm.getStakeholderPortfolio(holder)
+            multicall.flush()
+    return {holder: to_portfolio(result) for holder, result in results.items()}
+
+
+def get_all_portfolios(token_farm, page_size=None):
+    """
+    Portfolios of every stakeholder, one eth_call per page of `page_size`.
+    """
+    page_size = page_size or get_page_size()
+    portfolios = {}
+    offset = 0
+    while True:
+        page = token_farm.getStakeholderPortfolios(offset, page_size)
+        for result in page:
+            portfolio = to_portfolio(result)
+            # unstaked everything during a reward round, listed until the next
+            if portfolio["tokens"]:
+                portfolios[portfolio["holder"]] = portfolio
+        if len(page) < page_size:
+            return portfolios
+        offset += page_size
+
+
+def main():
+    token_farm = TokenFarm[-1]
+    portfolios = get_all_portfolios(token_farm)
+    for holder, portfolio in portfolios.items():
+        print("{}: {}".format(holder, portfolio["total_value"] / 1e18))
+    print(get_portfolios(token_farm, [get_account().address]))
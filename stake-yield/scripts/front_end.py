@@ -0,0 +1,143 @@
+import hashlib
+import json
+import os
+import shutil
+
+HASH_CHUNK_SIZE = 1024 * 1024
+# read by the front end without being deployed by us
+EXPORTED_INTERFACES = ["IERC20"]
+
+
+def get_content_hash(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def is_same_content(src, dest):
+    if not os.path.exists(dest):
+        return False
+    if os.path.getsize(src) != os.path.getsize(dest):
+        return False
+    return get_content_hash(src) == get_content_hash(dest)
+
+
+def copy_atomically(src, dest):
+    # the dev server never sees a half written file, only the replaced one
+    os.makedirs(os.path.dirname(dest), exist_ok=True)
+    temporary_path = dest + ".tmp"
+    shutil.copy2(src, temporary_path)
+    os.replace(temporary_path, dest)
+
+
+def write_atomically(path, content):
+    if os.path.exists(path):
+        with open(path, "r") as file:
+            if file.read() == content:
+                return False
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    temporary_path = path + ".tmp"
+    with open(temporary_path, "w") as file:
+        file.write(content)
+    os.replace(temporary_path, path)
+    return True
+
+
+def list_files(directory):
+    if not os.path.exists(directory):
+        return set()
+    return {
+        os.path.relpath(os.path.join(root, filename), directory)
+        for root, _, filenames in os.walk(directory)
+        for filename in filenames
+    }
+
+
+def remove_empty_folders(directory):
+    # bottom up, so a folder is checked after its own empty folders are gone
+    for root, _, _ in os.walk(directory, topdown=False):
+        if root != directory and not os.listdir(root):
+            os.rmdir(root)
+
+
+def sync_folder(src, dest):
+    """
+    Mirrors `src` into `dest`, only writing the files whose content changed.
+
+    Returns the relative paths that were copied and removed.
+    """
+    src_files = list_files(src)
+    copied = []
+    for path in sorted(src_files):
+        if not is_same_content(os.path.join(src, path), os.path.join(dest, path)):
+            copy_atomically(os.path.join(src, path), os.path.join(dest, path))
+            copied.append(path)
+
+    removed = sorted(list_files(dest) - src_files)
+    for path in removed:
+        os.remove(os.path.join(dest, path))
+    remove_empty_folders(dest)
+    return copied, removed
+
+
+def get_abis(contracts_dir):
+    """
+    ABIs by contract name and then by the artifact path they were read from.
+    """
+    abis = {}
+    for path in sorted(list_files(contracts_dir)):
+        with open(os.path.join(contracts_dir, path), "r") as file:
+            artifact = json.load(file)
+        abis.setdefault(artifact["contractName"], {})[path] = artifact["abi"]
+    return abis
+
+
+def get_abi(abis, name):
+    # dependencies can bring their own contract of the same name
+    distinct = {to_minified_json(abi): abi for abi in abis[name].values()}
+    if len(distinct) > 1:
+        raise ValueError(
+            "{} has different ABIs in {}.".format(name, ", ".join(abis[name]))
+        )
+    return next(iter(distinct.values()))
+
+
+def build_export(build_dir):
+    """
+    ABIs of the deployed contracts and their latest address on every chain.
+    """
+    with open(os.path.join(build_dir, "deployments", "map.json"), "r") as file:
+        deployments = json.load(file)
+    networks = {
+        chain_id: {name: addresses[0] for name, addresses in contracts.items()}
+        for chain_id, contracts in deployments.items()
+    }
+    names = {name for contracts in networks.values() for name in contracts}
+    names.update(EXPORTED_INTERFACES)
+
+    abis = get_abis(os.path.join(build_dir, "contracts"))
+    return {
+        "abis": {name: get_abi(abis, name) for name in sorted(names) if name in abis},
+        "networks": networks,
+    }
+
+
+def to_minified_json(value):
+    return json.dumps(value, separators=(",", ":"), sort_keys=True)
+
+
+def sync_front_end(build_dir, src_dir):
+    """
+    Syncs the build into `src_dir`/chain-info and regenerates the
+    chain-export.json the front end imports from it.
+
+    Returns the relative paths of chain-info that were copied and removed.
+    """
+    copied, removed = sync_folder(build_dir, os.path.join(src_dir, "chain-info"))
+    write_atomically(
+        os.path.join(src_dir, "chain-export.json"),
+        to_minified_json(build_export(build_dir)),
+    )
+    return copied, removed
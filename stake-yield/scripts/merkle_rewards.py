@@ -0,0 +1,71 @@
+import json
+import os
+from brownie import DappToken, MerkleRewardDistributor, TokenFarm, config
+from scripts.helpers import get_account
+from scripts.farm_reader import get_all_portfolios
+from scripts.merkle_tree import RewardTree, compute_rewards
+
+
+def get_claims_dir():
+    return config.get("merkle_rewards", {}).get("claims_dir", "./claims")
+
+
+def get_stake_snapshot(token_farm):
+    """
+    Staked wei of every holder, one row per holder with a column per token.
+    """
+    portfolios = get_all_portfolios(token_farm)
+    holders = list(portfolios)
+    tokens = sorted({t for p in portfolios.values() for t in p["tokens"]})
+
+    balances = []
+    for holder in holders:
+        stakes = portfolios[holder]["tokens"]
+        balances.append(
+            [stakes[token]["balance"] if token in stakes else 0 for token in tokens]
+        )
+    return holders, tokens, balances
+
+
+def build_reward_tree(token_farm):
+    holders, tokens, balances = get_stake_snapshot(token_farm)
+    unit_values = [token_farm.getTokenUnitValue(token) for token in tokens]
+    return RewardTree(holders, compute_rewards(balances, unit_values))
+
+
+def write_claims(reward_tree, epoch):
+    directory = get_claims_dir()
+    os.makedirs(directory, exist_ok=True)
+    path = "{}/{}.jsonl".format(directory, epoch)
+    with open(path, "w") as file:
+        for holder in reward_tree.holders:
+            claim = reward_tree.get_claim(holder)
+            file.write(json.dumps({"holder": holder, "epoch": epoch, **claim}) + "\n")
+    return path
+
+
+def publish_epoch(distributor, dapp_token, reward_tree):
+    account = get_account()
+    dapp_token.approve(distributor, reward_tree.total, {"from": account}).wait(1)
+    tx = distributor.publishEpoch(
+        reward_tree.root, reward_tree.total, {"from": account}
+    )
+    tx.wait(1)
+    return distributor.getEpochCount() - 1
+
+
+def claim(distributor, holder, epoch, reward_claim):
+    return distributor.claim(
+        epoch, reward_claim["amount"], reward_claim["proof"], {"from": holder}
+    )
+
+
+def main():
+    reward_tree = build_reward_tree(TokenFarm[-1])
+    epoch = publish_epoch(MerkleRewardDistributor[-1], DappToken[-1], reward_tree)
+    path = write_claims(reward_tree, epoch)
+    print(
+        "Published epoch {} of {} holders, claims in {}".format(
+            epoch, len(reward_tree.holders), path
+        )
+    )
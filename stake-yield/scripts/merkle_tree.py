@@ -0,0 +1,96 @@
+from eth_hash.auto import keccak
+
+
+def compute_rewards(balances, unit_values, rate_numerator=1, rate_denominator=10):
+    """
+    Rewards of every holder, in wei.
+
+    `balances` has a row of staked wei per holder, in the order of
+    `unit_values`, the wei value of one whole token as `getTokenUnitValue`
+    returns it. Every stake is valued and floored like
+    `getStakeholderTokenValue` does, then the total is scaled by the rate and
+    floored again, so a holder is never paid more than was earned. Balances
+    and values don't fit in int64, so this is plain Python int arithmetic.
+    """
+    return [
+        sum(balance * value // 10**18 for balance, value in zip(row, unit_values))
+        * rate_numerator
+        // rate_denominator
+        for row in balances
+    ]
+
+
+def encode_leaf(account, amount):
+    # abi.encode(address, uint256)
+    return bytes(12) + bytes.fromhex(account[2:]) + amount.to_bytes(32, "big")
+
+
+def get_leaf(account, amount):
+    # hashed twice, so a leaf can never be passed off as an inner node
+    return keccak(keccak(encode_leaf(account, amount)))
+
+
+def hash_pair(a, b):
+    return keccak(a + b) if a < b else keccak(b + a)
+
+
+class MerkleTree:
+    """
+    Merkle tree with sorted pairs, as OpenZeppelin's MerkleProof verifies.
+
+    A node without a sibling moves up a layer unchanged.
+    """
+
+    def __init__(self, leaves):
+        if not leaves:
+            raise ValueError("A merkle tree needs at least one leaf.")
+        self.layers = [list(leaves)]
+        while len(self.layers[-1]) > 1:
+            layer = self.layers[-1]
+            parents = list(map(hash_pair, layer[0:-1:2], layer[1::2]))
+            if len(layer) % 2 == 1:
+                parents.append(layer[-1])
+            self.layers.append(parents)
+
+    @property
+    def root(self):
+        return self.layers[-1][0]
+
+    def get_proof(self, index):
+        proof = []
+        for layer in self.layers[:-1]:
+            sibling = index ^ 1
+            if sibling < len(layer):
+                proof.append(layer[sibling])
+            index //= 2
+        return proof
+
+
+def verify_proof(proof, root, leaf):
+    node = leaf
+    for sibling in proof:
+        node = hash_pair(node, sibling)
+    return node == root
+
+
+class RewardTree:
+    def __init__(self, holders, rewards):
+        self.holders = list(holders)
+        self.amounts = [int(reward) for reward in rewards]
+        self.indexes = {holder: i for i, holder in enumerate(self.holders)}
+        self.tree = MerkleTree(list(map(get_leaf, self.holders, self.amounts)))
+
+    @property
+    def root(self):
+        return self.tree.root
+
+    @property
+    def total(self):
+        return sum(self.amounts)
+
+    def get_claim(self, holder):
+        index = self.indexes[holder]
+        return {
+            "amount": self.amounts[index],
+            "proof": ["0x" + node.hex() for node in self.tree.get_proof(index)],
+        }
@@ -0,0 +1,66 @@
+from brownie import chain
+from eth_account import Account
+from eth_account.messages import encode_structured_data
+
+PERMIT_TYPES = {
+    "EIP712Domain": [
+        {"name": "name", "type": "string"},
+        {"name": "version", "type": "string"},
+        {"name": "chainId", "type": "uint256"},
+        {"name": "verifyingContract", "type": "address"},
+    ],
+    "Permit": [
+        {"name": "owner", "type": "address"},
+        {"name": "spender", "type": "address"},
+        {"name": "value", "type": "uint256"},
+        {"name": "nonce", "type": "uint256"},
+        {"name": "deadline", "type": "uint256"},
+    ],
+}
+DEFAULT_VALIDITY = 60 * 60
+
+
+def get_permit_message(token, owner, spender, amount, deadline):
+    return {
+        "types": PERMIT_TYPES,
+        "primaryType": "Permit",
+        "domain": {
+            "name": token.name(),
+            "version": "1",
+            "chainId": chain.id,
+            "verifyingContract": token.address,
+        },
+        "message": {
+            "owner": owner.address,
+            "spender": str(spender),
+            "value": amount,
+            "nonce": token.nonces(owner),
+            "deadline": deadline,
+        },
+    }
+
+
+def sign_permit(token, owner, spender, amount, deadline=None):
+    """
+    EIP-2612 permit of `owner` for `spender` to pull `amount` of `token`.
+
+    Signed off-chain with the owner's private key, so the owner has to be a
+    local account, e.g. one of `accounts.add()`. Returns the arguments that
+    follow the amount in `permit` and `stakeWithPermit`.
+    """
+    deadline = deadline or chain.time() + DEFAULT_VALIDITY
+    message = get_permit_message(token, owner, spender, amount, deadline)
+    signed = Account.sign_message(
+        encode_structured_data(primitive=message), owner.private_key
+    )
+    return (
+        deadline,
+        signed.v,
+        signed.r.to_bytes(32, "big"),
+        signed.s.to_bytes(32, "big"),
+    )
+
+
+def stake_with_permit(token_farm, token, owner, amount):
+    permit = sign_permit(token, owner, token_farm, amount)
+    return token_farm.stakeWithPermit(token, amount, *permit, {"from": owner})
@@ -1,5 +1,6 @@
 from scripts.helpers import get_account, eth_to_wei
-from brownie import DappToken, MockWETH, MockFAU
+from scripts.farm_reader import get_portfolios
+from brownie import DappToken, MockWETH, MockFAU, TokenFarm
 
 
 def main():
@@ -17,3 +18,8 @@ def main():
     fau = MockFAU[-1]
     print(fau.totalSupply() / 1e18)
     print(fau.balanceOf(account) / 1e18)
+
+    portfolio = get_portfolios(TokenFarm[-1], [account.address])[account.address]
+    for token, stake in portfolio["tokens"].items():
+        print(token, stake["balance"] / 1e18, stake["value"] / 1e18)
+    print(portfolio["total_value"] / 1e18)
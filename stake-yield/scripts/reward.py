@@ -0,0 +1,35 @@
+from brownie import TokenFarm, config
+from scripts.helpers import get_account
+
+
+def get_reward_batch_size():
+    return config.get("reward_batch_size", 100)
+
+
+def distribute_rewards(token_farm, batch_size=None):
+    """
+    Rewards every stakeholder in transactions of `batch_size` stakeholders.
+
+    An unfinished round, e.g. of a run that was interrupted, is resumed
+    instead of started again.
+    """
+    batch_size = batch_size or get_reward_batch_size()
+    account = get_account()
+
+    round_open, _, _ = token_farm.getRewardRoundProgress()
+    if not round_open:
+        token_farm.startRewardRound({"from": account}).wait(1)
+
+    txs = []
+    while True:
+        tx = token_farm.rewardNextStakeholders(batch_size, {"from": account})
+        tx.wait(1)
+        txs.append(tx)
+        round_open, cursor, total = token_farm.getRewardRoundProgress()
+        print("Rewarded {}/{} stakeholders".format(cursor, total))
+        if not round_open:
+            return txs
+
+
+def main():
+    distribute_rewards(TokenFarm[-1])
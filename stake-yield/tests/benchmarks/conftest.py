@@ -0,0 +1,81 @@
+import os
+from web3 import Web3
+from brownie import (
+    DappToken,
+    TokenFarm,
+    MockWETH,
+    MockFAU,
+    MockV3AggregatorETHUSD,
+    MockV3AggregatorDAIUSD,
+    MockStakerFactory,
+    accounts,
+)
+import pytest
+
+STAKERS_PER_TX = 25
+STAKER_AMOUNT = Web3.toWei(0.001, "ether")
+
+
+def pytest_collection_modifyitems(config, items):
+    # thousands of stakeholders take minutes, only run when asked for
+    if os.environ.get("RUN_BENCHMARKS"):
+        return
+    skip = pytest.mark.skip(reason="set RUN_BENCHMARKS=1 to run benchmarks")
+    for item in items:
+        item.add_marker(skip)
+
+
+@pytest.fixture(scope="module")
+def owner():
+    return accounts[0]
+
+
+@pytest.fixture(scope="module")
+def user():
+    return accounts[1]
+
+
+@pytest.fixture(scope="module")
+def dapp_token(owner):
+    return DappToken.deploy(Web3.toWei(10000, "ether"), {"from": owner})
+
+
+@pytest.fixture(scope="module")
+def weth(owner, user):
+    weth = MockWETH.deploy(Web3.toWei(10000, "ether"), {"from": owner})
+    weth.transfer(user, Web3.toWei(100, "ether"), {"from": owner})
+    return weth
+
+
+@pytest.fixture(scope="module")
+def fau(owner, user):
+    fau = MockFAU.deploy(Web3.toWei(10000, "ether"), {"from": owner})
+    fau.transfer(user, Web3.toWei(100, "ether"), {"from": owner})
+    return fau
+
+
+@pytest.fixture(scope="module")
+def token_farm(dapp_token, weth, fau, owner):
+    weth_feed = MockV3AggregatorETHUSD.deploy(8, 2000 * 10**8, {"from": owner})
+    fau_feed = MockV3AggregatorDAIUSD.deploy(8, 1 * 10**8, {"from": owner})
+    token_farm = TokenFarm.deploy(dapp_token, fau_feed, {"from": owner})
+    token_farm.addAllowedToken(weth, weth_feed, {"from": owner})
+    token_farm.addAllowedToken(fau, fau_feed, {"from": owner})
+    dapp_token.approve(token_farm, Web3.toWei(10000, "ether"), {"from": owner})
+    return token_farm
+
+
+@pytest.fixture(scope="module")
+def add_stakers(token_farm, owner):
+    factory = MockStakerFactory.deploy({"from": owner})
+
+    def add(tokens, count):
+        for token in tokens:
+            token.approve(factory, count * STAKER_AMOUNT, {"from": owner})
+        for start in range(0, count, STAKERS_PER_TX):
+            batch = min(STAKERS_PER_TX, count - start)
+            factory.addStakers(
+                token_farm, tokens, batch, STAKER_AMOUNT, {"from": owner}
+            )
+
+    return add
@@ -0,0 +1,38 @@
+import random
+import time
+from scripts.merkle_tree import RewardTree, compute_rewards, get_leaf, verify_proof
+
+HOLDER_COUNT = 1_000_000
+UNIT_VALUES = [2000 * 10**18, 1 * 10**18, 1 * 10**18]
+
+
+def test_reward_tree_of_a_million_holders():
+    holders = ["0x{:040x}".format(i + 1) for i in range(HOLDER_COUNT)]
+    # up to 1,000 of every token, in wei
+    generator = random.Random(7)
+    balances = [
+        [generator.randrange(1000 * 10**18) for _ in UNIT_VALUES]
+        for _ in range(HOLDER_COUNT)
+    ]
+
+    started_at = time.perf_counter()
+    rewards = compute_rewards(balances, UNIT_VALUES)
+    computed_at = time.perf_counter()
+    reward_tree = RewardTree(holders, rewards)
+    built_at = time.perf_counter()
+
+    print()
+    print(
+        "rewards of {:,} holders: {:.3f}s".format(
+            HOLDER_COUNT, computed_at - started_at
+        )
+    )
+    print("merkle tree:              {:.3f}s".format(built_at - computed_at))
+    print("root 0x{}".format(reward_tree.root.hex()))
+
+    for holder in random.Random(7).sample(holders, 100):
+        reward_claim = reward_tree.get_claim(holder)
+        proof = [bytes.fromhex(node[2:]) for node in reward_claim["proof"]]
+        leaf = get_leaf(holder, reward_claim["amount"])
+        assert len(proof) <= 20
+        assert verify_proof(proof, reward_tree.root, leaf)
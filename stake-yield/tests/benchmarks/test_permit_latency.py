@@ -0,0 +1,68 @@
+import time
+from web3 import Web3
+from brownie import accounts
+from scripts.permit import stake_with_permit
+import pytest
+
+benchmark = pytest.mark.require_network("development")
+
+STAKE_COUNT = 50
+AMOUNT = Web3.toWei(0.1, "ether")
+
+
+def stake_with_approve(token_farm, token, user):
+    approve_tx = token.approve(token_farm, AMOUNT, {"from": user})
+    approve_tx.wait(1)
+    stake_tx = token_farm.stake(token, AMOUNT, {"from": user})
+    stake_tx.wait(1)
+    return [approve_tx, stake_tx]
+
+
+def stake_in_one_transaction(token_farm, token, user):
+    stake_tx = stake_with_permit(token_farm, token, user, AMOUNT)
+    stake_tx.wait(1)
+    return [stake_tx]
+
+
+def measure(stake, token_farm, token, user):
+    latencies = []
+    gas_used = 0
+    for _ in range(STAKE_COUNT):
+        started_at = time.perf_counter()
+        txs = stake(token_farm, token, user)
+        latencies.append(time.perf_counter() - started_at)
+        gas_used += sum(tx.gas_used for tx in txs)
+    latencies.sort()
+    return {
+        "txs": len(txs),
+        "median": latencies[len(latencies) // 2],
+        "p95": latencies[int(len(latencies) * 0.95)],
+        "gas": gas_used // STAKE_COUNT,
+    }
+
+
+@benchmark
+def test_stake_with_permit_latency(token_farm, weth, owner):
+    # signing needs a private key, dev accounts only live in the node
+    user = accounts.add()
+    owner.transfer(user, Web3.toWei(10, "ether"))
+    weth.transfer(user, 2 * STAKE_COUNT * AMOUNT, {"from": owner})
+
+    results = {
+        "approve + stake": measure(stake_with_approve, token_farm, weth, user),
+        "stakeWithPermit": measure(stake_in_one_transaction, token_farm, weth, user),
+    }
+
+    print()
+    for name, result in results.items():
+        print(
+            "{:<16} {} txs, median {:.1f}ms, p95 {:.1f}ms, {:,} gas".format(
+                name,
+                result["txs"],
+                result["median"] * 1000,
+                result["p95"] * 1000,
+                result["gas"],
+            )
+        )
+
+    assert results["stakeWithPermit"]["median"] < results["approve + stake"]["median"]
@@ -0,0 +1,57 @@
+from web3 import Web3
+import pytest
+
+benchmark = pytest.mark.require_network("development")
+
+STAKEHOLDER_COUNTS = [10, 100, 1000]
+BATCH_SIZE = 50
+TX_BASE_GAS = 21000
+
+
+def stake(token_farm, token, user):
+    amount = Web3.toWei(1, "ether")
+    token.approve(token_farm, amount, {"from": user})
+    token_farm.stake(token, amount, {"from": user})
+
+
+def reward_at_live_prices(token_farm, owner, user):
+    # one stakeholder, reading every feed like reward() used to for each of them
+    tx = token_farm.rewardStakeholder(user, {"from": owner})
+    return tx.gas_used - TX_BASE_GAS
+
+
+def reward_at_round_prices(token_farm, owner, count):
+    txs = [token_farm.startRewardRound({"from": owner})]
+    while token_farm.getRewardRoundProgress()[0]:
+        txs.append(token_farm.rewardNextStakeholders(BATCH_SIZE, {"from": owner}))
+    return sum(tx.gas_used - TX_BASE_GAS for tx in txs) // count
+
+
+@benchmark
+def test_round_price_snapshot_saves_gas(
+    token_farm, weth, fau, owner, user, add_stakers
+):
+    stake(token_farm, weth, user)
+    stake(token_farm, fau, user)
+
+    results = {}
+    stakeholders = 1
+    for count in STAKEHOLDER_COUNTS:
+        add_stakers([weth, fau], count - stakeholders)
+        stakeholders = count
+        results[count] = (
+            reward_at_live_prices(token_farm, owner, user),
+            reward_at_round_prices(token_farm, owner, count),
+        )
+
+    print()
+    for count, (live, snapshot) in results.items():
+        print(
+            "{:>5} stakeholders: {:>6,} gas/holder at live prices, "
+            "{:>6,} at round prices, {:>11,} gas saved per round".format(
+                count, live, snapshot, (live - snapshot) * count
+            )
+        )
+
+    for live, snapshot in results.values():
+        assert snapshot < live
@@ -0,0 +1,53 @@
+from brownie import exceptions
+import pytest
+
+benchmark = pytest.mark.require_network("development")
+
+STAKEHOLDER_COUNTS = [10, 100, 1000]
+BATCH_SIZE = 100
+
+
+def reward_in_one_transaction(token_farm, owner):
+    try:
+        return [token_farm.reward({"from": owner})]
+    except (exceptions.VirtualMachineError, ValueError):
+        # does not fit in a block any more
+        return None
+
+
+def reward_in_batches(token_farm, owner):
+    txs = [token_farm.startRewardRound({"from": owner})]
+    while token_farm.getRewardRoundProgress()[0]:
+        txs.append(token_farm.rewardNextStakeholders(BATCH_SIZE, {"from": owner}))
+    return txs
+
+
+def describe(txs, count):
+    if txs is None:
+        return "exceeds the block gas limit"
+    gas_used = sum(tx.gas_used for tx in txs)
+    return "{:>10,} gas, {:>6,} gas/holder, largest tx {:>10,} gas in {} txs".format(
+        gas_used, gas_used // count, max(tx.gas_used for tx in txs), len(txs)
+    )
+
+
+@benchmark
+def test_reward_gas_per_transaction_is_bounded(token_farm, weth, owner, add_stakers):
+    results = {}
+    stakeholders = 0
+    for count in STAKEHOLDER_COUNTS:
+        add_stakers([weth], count - stakeholders)
+        stakeholders = count
+        results[count] = (
+            reward_in_one_transaction(token_farm, owner),
+            reward_in_batches(token_farm, owner),
+        )
+
+    print()
+    for count, (single, batched) in results.items():
+        print("{:>5} stakeholders".format(count))
+        print("  reward():       {}".format(describe(single, count)))
+        print("  batches of {}: {}".format(BATCH_SIZE, describe(batched, count)))
+
+    largest_batches = [max(tx.gas_used for tx in b) for _, b in results.values()]
+    assert largest_batches[-1] <= largest_batches[1] * 1.05
@@ -0,0 +1,41 @@
+from web3 import Web3
+import pytest
+
+benchmark = pytest.mark.require_network("development")
+
+STAKEHOLDER_COUNTS = [10, 100, 1000, 5000]
+
+
+def measure(token_farm, token, user):
+    amount = Web3.toWei(1, "ether")
+    token.approve(token_farm, amount, {"from": user})
+    stake_tx = token_farm.stake(token, amount, {"from": user})
+    total_gas = token_farm.getTotalStakedToken.estimate_gas(token)
+    unstake_tx = token_farm.unstake(token, {"from": user})
+    return {
+        "stake": stake_tx.gas_used,
+        "unstake": unstake_tx.gas_used,
+        "getTotalStakedToken": total_gas,
+    }
+
+
+@benchmark
+def test_total_staked_gas_is_flat(token_farm, weth, user, add_stakers):
+    results = {}
+    stakeholders = 0
+    for count in STAKEHOLDER_COUNTS:
+        add_stakers([weth], count - stakeholders)
+        stakeholders = count
+        results[count] = measure(token_farm, weth, user)
+
+    print()
+    for count, gas in results.items():
+        print(
+            "{:>5} stakeholders: stake {:>7,}  unstake {:>7,}  getTotalStakedToken {:>6,}".format(
+                count, gas["stake"], gas["unstake"], gas["getTotalStakedToken"]
+            )
+        )
+
+    smallest, largest = results[STAKEHOLDER_COUNTS[0]], results[STAKEHOLDER_COUNTS[-1]]
+    for name in smallest:
+        assert largest[name] <= smallest[name] * 1.05
@@ -0,0 +1,3 @@
+# importing scripts puts /shared on the path
+import scripts
+from wall_time import pytest_configure
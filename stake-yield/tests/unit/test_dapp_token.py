@@ -1,6 +1,7 @@
 from web3 import Web3
-from brownie import DappToken
+from brownie import DappToken, accounts
 from scripts.helpers import get_account, is_not_dev_network
+from scripts.permit import sign_permit
 import pytest
 
 
@@ -13,3 +14,18 @@ def test_dapp_token_can_be_deployed_with_initial_supply():
     assert dapp_token.name() == "DAPP TOKEN"
     assert dapp_token.totalSupply() == initial_supply
     assert dapp_token.balanceOf(owner) == Web3.toWei(10000, "ether")
+
+
+def test_dapp_token_can_be_approved_with_permit():
+    if is_not_dev_network():
+        pytest.skip()
+    holder = accounts.add()
+    spender = accounts[1]
+    dapp_token = DappToken.deploy(Web3.toWei(10000, "ether"), {"from": get_account()})
+
+    amount = Web3.toWei(5, "ether")
+    permit = sign_permit(dapp_token, holder, spender, amount)
+    dapp_token.permit(holder, spender, amount, *permit, {"from": spender})
+
+    assert dapp_token.allowance(holder, spender) == amount
+    assert dapp_token.nonces(holder) == 1
@@ -0,0 +1,100 @@
+from web3 import Web3
+from brownie import (
+    DappToken,
+    TokenFarm,
+    MockWETH,
+    MockFAU,
+    MockV3AggregatorETHUSD,
+    MockV3AggregatorDAIUSD,
+    accounts,
+)
+from scripts.farm_indexer import FarmIndexer, sync_farm
+import pytest
+
+unit_test = pytest.mark.require_network("development")
+
+
+def __stake(token_farm, token, user, ether):
+    amount = Web3.toWei(ether, "ether")
+    token.approve(token_farm, amount, {"from": user})
+    token_farm.stake(token, amount, {"from": user})
+
+
+@pytest.fixture
+def owner():
+    return accounts[0]
+
+
+@pytest.fixture
+def users():
+    return [accounts[1], accounts[2]]
+
+
+@pytest.fixture
+def farm_and_tokens(owner, users):
+    dapp_token = DappToken.deploy(Web3.toWei(10000, "ether"), {"from": owner})
+    weth = MockWETH.deploy(Web3.toWei(10000, "ether"), {"from": owner})
+    fau = MockFAU.deploy(Web3.toWei(10000, "ether"), {"from": owner})
+    weth_feed = MockV3AggregatorETHUSD.deploy(8, 2000 * 10**8, {"from": owner})
+    fau_feed = MockV3AggregatorDAIUSD.deploy(8, 1 * 10**8, {"from": owner})
+
+    token_farm = TokenFarm.deploy(dapp_token, fau_feed, {"from": owner})
+    token_farm.addAllowedToken(weth, weth_feed, {"from": owner})
+    token_farm.addAllowedToken(fau, fau_feed, {"from": owner})
+    dapp_token.approve(token_farm, Web3.toWei(10000, "ether"), {"from": owner})
+    for user in users:
+        weth.transfer(user, Web3.toWei(100, "ether"), {"from": owner})
+        fau.transfer(user, Web3.toWei(100, "ether"), {"from": owner})
+    return (token_farm, weth, fau)
+
+
+@pytest.fixture
+def indexer():
+    with FarmIndexer(":memory:", initial_range=2) as indexer:
+        yield indexer
+
+
+@unit_test
+def test_indexer_keeps_current_stakes(farm_and_tokens, indexer, users):
+    token_farm, weth, fau = farm_and_tokens
+    __stake(token_farm, weth, users[0], 1)
+    __stake(token_farm, weth, users[1], 10)
+    __stake(token_farm, fau, users[0], 5)
+    __stake(token_farm, weth, users[0], 2)
+
+    sync_farm(indexer, token_farm)
+
+    assert len(indexer.get_allowed_tokens(token_farm.address)) == 3
+    assert indexer.get_total_staked(token_farm.address) == {
+        weth.address: 13 * 10**18,
+        fau.address: 5 * 10**18,
+    }
+    assert indexer.get_top_holders(token_farm.address, weth.address) == [
+        (users[1].address, 10 * 10**18),
+        (users[0].address, 3 * 10**18),
+    ]
+    unit_values = {weth.address: 2000 * 10**18, fau.address: 1 * 10**18}
+    assert indexer.get_tvl(token_farm.address, unit_values) == 26005 * 10**18
+
+
+@unit_test
+def test_indexer_syncs_incrementally(farm_and_tokens, indexer, owner, users):
+    token_farm, weth, fau = farm_and_tokens
+    __stake(token_farm, weth, users[0], 1)
+    __stake(token_farm, fau, users[0], 5)
+    sync_farm(indexer, token_farm)
+
+    token_farm.unstake(weth, {"from": users[0]})
+    token_farm.reward({"from": owner})
+    sync_farm(indexer, token_farm)
+
+    assert indexer.get_total_staked(token_farm.address) == {fau.address: 5 * 10**18}
+    history = indexer.get_holder_history(token_farm.address, users[0].address)
+    assert [(h["event"], h["token"], h["amount"]) for h in history] == [
+        ("stake", weth.address, 1 * 10**18),
+        ("stake", fau.address, 5 * 10**18),
+        ("unstake", weth.address, 1 * 10**18),
+        ("reward", None, 5 * 10**17),
+    ]
+    rounds = indexer.get_reward_rounds(token_farm.address)
+    assert [(r["round"], r["stakeholders"]) for r in rounds] == [(0, 1)]
@@ -0,0 +1,102 @@
+import json
+import os
+from scripts.front_end import build_export, sync_folder, sync_front_end
+import pytest
+
+
+def __write(path, content):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as file:
+        file.write(content)
+
+
+def __write_artifact(build_dir, path, name):
+    artifact = {"contractName": name, "abi": [{"name": name}], "bytecode": "0x00"}
+    __write(os.path.join(build_dir, "contracts", path), json.dumps(artifact))
+
+
+def test_sync_only_writes_changed_files(tmp_path):
+    src = str(tmp_path / "build")
+    dest = str(tmp_path / "chain-info")
+    __write(os.path.join(src, "contracts", "TokenFarm.json"), "farm")
+    __write(os.path.join(src, "contracts", "DappToken.json"), "dapp")
+
+    assert sync_folder(src, dest) == (
+        ["contracts/DappToken.json", "contracts/TokenFarm.json"],
+        [],
+    )
+    unchanged_mtime = os.stat(os.path.join(dest, "contracts", "DappToken.json"))
+
+    __write(os.path.join(src, "contracts", "TokenFarm.json"), "farm v2")
+    assert sync_folder(src, dest) == (["contracts/TokenFarm.json"], [])
+    assert sync_folder(src, dest) == ([], [])
+
+    with open(os.path.join(dest, "contracts", "TokenFarm.json")) as file:
+        assert file.read() == "farm v2"
+    assert (
+        os.stat(os.path.join(dest, "contracts", "DappToken.json")).st_mtime_ns
+        == unchanged_mtime.st_mtime_ns
+    )
+
+
+def test_sync_removes_files_gone_from_build(tmp_path):
+    src = str(tmp_path / "build")
+    dest = str(tmp_path / "chain-info")
+    __write(os.path.join(src, "contracts", "TokenFarm.json"), "farm")
+    __write(os.path.join(src, "deployments", "1337", "0x1.json"), "old")
+    sync_folder(src, dest)
+
+    os.remove(os.path.join(src, "deployments", "1337", "0x1.json"))
+    assert sync_folder(src, dest) == ([], ["deployments/1337/0x1.json"])
+    assert not os.path.exists(os.path.join(dest, "deployments"))
+
+
+def test_export_has_abis_and_latest_addresses_only(tmp_path):
+    build_dir = str(tmp_path / "build")
+    __write_artifact(build_dir, "TokenFarm.json", "TokenFarm")
+    __write_artifact(build_dir, "MockV3Aggregator.json", "MockV3Aggregator")
+    __write_artifact(build_dir, "dependencies/OZ/IERC20.json", "IERC20")
+    deployments = {"1337": {"TokenFarm": ["0x2", "0x1"]}, "4": {"TokenFarm": ["0x3"]}}
+    __write(os.path.join(build_dir, "deployments", "map.json"), json.dumps(deployments))
+
+    assert build_export(build_dir) == {
+        "abis": {
+            "IERC20": [{"name": "IERC20"}],
+            "TokenFarm": [{"name": "TokenFarm"}],
+        },
+        "networks": {"1337": {"TokenFarm": "0x2"}, "4": {"TokenFarm": "0x3"}},
+    }
+
+
+def test_export_fails_on_different_abis_of_one_name(tmp_path):
+    build_dir = str(tmp_path / "build")
+    __write_artifact(build_dir, "TokenFarm.json", "TokenFarm")
+    __write_artifact(build_dir, "dependencies/A/IERC20.json", "IERC20")
+    __write(os.path.join(build_dir, "deployments", "map.json"), "{}")
+
+    __write_artifact(build_dir, "dependencies/B/IERC20.json", "IERC20")
+    assert build_export(build_dir)["abis"] == {"IERC20": [{"name": "IERC20"}]}
+
+    artifact = {"contractName": "IERC20", "abi": [{"name": "other"}]}
+    __write(
+        os.path.join(build_dir, "contracts", "dependencies/B/IERC20.json"),
+        json.dumps(artifact),
+    )
+    with pytest.raises(ValueError):
+        build_export(build_dir)
+
+
+def test_sync_front_end_regenerates_the_export(tmp_path):
+    build_dir = str(tmp_path / "build")
+    src_dir = str(tmp_path / "src")
+    __write_artifact(build_dir, "TokenFarm.json", "TokenFarm")
+    deployments = {"1337": {"TokenFarm": ["0x1"]}}
+    __write(os.path.join(build_dir, "deployments", "map.json"), json.dumps(deployments))
+
+    sync_front_end(build_dir, src_dir)
+
+    assert os.path.exists(
+        os.path.join(src_dir, "chain-info", "contracts", "TokenFarm.json")
+    )
+    with open(os.path.join(src_dir, "chain-export.json"), "r") as file:
+        assert json.load(file) == build_export(build_dir)
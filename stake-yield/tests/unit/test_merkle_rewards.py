@@ -0,0 +1,140 @@
+from web3 import Web3
+from brownie import (
+    DappToken,
+    TokenFarm,
+    MerkleRewardDistributor,
+    MockWETH,
+    MockFAU,
+    MockV3AggregatorETHUSD,
+    MockV3AggregatorDAIUSD,
+    accounts,
+    exceptions,
+)
+from scripts.merkle_tree import (
+    RewardTree,
+    compute_rewards,
+    get_leaf,
+    verify_proof,
+)
+from scripts.merkle_rewards import build_reward_tree, publish_epoch, claim
+import pytest
+
+unit_test = pytest.mark.require_network("development")
+
+
+def __holders(count):
+    return ["0x{:040x}".format(i + 1) for i in range(count)]
+
+
+def __deploy_and_stake(token, price_feed, token_farm, owner, stakes):
+    token = token.deploy(Web3.toWei(10000, "ether"), {"from": owner})
+    token_farm.addAllowedToken(token, price_feed, {"from": owner})
+    for user, ether in stakes:
+        amount = Web3.toWei(ether, "ether")
+        token.transfer(user, amount, {"from": owner})
+        token.approve(token_farm, amount, {"from": user})
+        token_farm.stake(token, amount, {"from": user})
+
+
+@pytest.fixture
+def owner():
+    return accounts[0]
+
+
+@pytest.fixture
+def users():
+    return [accounts[1], accounts[2]]
+
+
+@pytest.fixture
+def dapp_token(owner):
+    return DappToken.deploy(Web3.toWei(10000, "ether"), {"from": owner})
+
+
+@pytest.fixture
+def staked_token_farm(dapp_token, owner, users):
+    weth_feed = MockV3AggregatorETHUSD.deploy(8, 2000 * 10**8, {"from": owner})
+    fau_feed = MockV3AggregatorDAIUSD.deploy(8, 1 * 10**8, {"from": owner})
+    token_farm = TokenFarm.deploy(dapp_token, fau_feed, {"from": owner})
+    __deploy_and_stake(
+        MockWETH, weth_feed, token_farm, owner, [(users[0], 1), (users[1], 10)]
+    )
+    __deploy_and_stake(
+        MockFAU, fau_feed, token_farm, owner, [(users[0], 5), (users[1], 2)]
+    )
+    return token_farm
+
+
+@pytest.fixture
+def distributor(dapp_token, owner):
+    return MerkleRewardDistributor.deploy(dapp_token, {"from": owner})
+
+
+def test_rewards_are_ten_percent_of_staked_value():
+    balances = [[1 * 10**18, 5 * 10**18], [10 * 10**18, 2 * 10**18]]
+    rewards = compute_rewards(balances, [2000 * 10**18, 1 * 10**18])
+    assert rewards == [2005 * 10**17, 20002 * 10**17]
+
+
+def test_rewards_keep_every_wei_of_large_balances():
+    # a billion whole tokens and one wei, at every digit of an 8 decimals feed
+    balances = [[10**27 + 1, 3], [10**27, 3]]
+    rewards = compute_rewards(balances, [183412345678 * 10**10, 99987654 * 10**10])
+    assert rewards == [
+        183412345678000000000000000183,
+        183412345678000000000000000000,
+    ]
+
+
+def test_every_holder_has_a_valid_proof():
+    for count in [1, 2, 3, 7, 16]:
+        reward_tree = RewardTree(__holders(count), range(count))
+        for holder in reward_tree.holders:
+            reward_claim = reward_tree.get_claim(holder)
+            proof = [bytes.fromhex(node[2:]) for node in reward_claim["proof"]]
+            leaf = get_leaf(holder, reward_claim["amount"])
+            assert verify_proof(proof, reward_tree.root, leaf)
+            assert not verify_proof(proof, reward_tree.root, get_leaf(holder, 1))
+
+
+@unit_test
+def test_holders_claim_published_rewards(
+    staked_token_farm, distributor, dapp_token, owner, users
+):
+    reward_tree = build_reward_tree(staked_token_farm)
+    assert reward_tree.total == 22007 * 1e17
+
+    epoch = publish_epoch(distributor, dapp_token, reward_tree)
+    assert epoch == 0
+    assert dapp_token.balanceOf(distributor) == 22007 * 1e17
+
+    claim(distributor, users[0], epoch, reward_tree.get_claim(users[0].address))
+    claim(distributor, users[1], epoch, reward_tree.get_claim(users[1].address))
+
+    assert dapp_token.balanceOf(users[0]) == 2005 * 1e17
+    assert dapp_token.balanceOf(users[1]) == 20002 * 1e17
+    assert dapp_token.balanceOf(distributor) == 0
+    assert distributor.isClaimed(epoch, users[0]) == True
+
+
+@unit_test
+def test_reward_cant_be_claimed_twice_or_inflated(
+    staked_token_farm, distributor, dapp_token, users
+):
+    reward_tree = build_reward_tree(staked_token_farm)
+    epoch = publish_epoch(distributor, dapp_token, reward_tree)
+    reward_claim = reward_tree.get_claim(users[0].address)
+
+    with pytest.raises(exceptions.VirtualMachineError):
+        claim(
+            distributor,
+            users[0],
+            epoch,
+            {**reward_claim, "amount": reward_claim["amount"] * 2},
+        )
+    with pytest.raises(exceptions.VirtualMachineError):
+        claim(distributor, users[1], epoch, reward_claim)
+
+    claim(distributor, users[0], epoch, reward_claim)
+    with pytest.raises(exceptions.VirtualMachineError):
+        claim(distributor, users[0], epoch, reward_claim)
@@ -6,9 +6,14 @@ from brownie import (
     MockFAU,
     MockV3AggregatorETHUSD,
     MockV3AggregatorDAIUSD,
+    MockDoubleBookkeepingTokenFarm,
     accounts,
+    chain,
     exceptions,
 )
+from scripts.farm_reader import get_portfolios, get_all_portfolios
+from scripts.permit import sign_permit, stake_with_permit
+from scripts.helpers import is_unit_test_network
 import pytest
 
 unit_test = pytest.mark.require_network("development")
@@ -27,18 +32,7 @@ def __stake(token_farm, token, user, ether):
     token_farm.stake(token, amount, {"from": user})
 
 
-@pytest.fixture
-def owner():
-    return accounts[0]
-
-
-@pytest.fixture
-def users():
-    return [accounts[1], accounts[2]]
-
-
-@pytest.fixture
-def tokens_and_feeds(owner, users):
+def __deploy_tokens_and_feeds(owner, users):
     return (
         __deploy_token(MockWETH, owner, users),
         MockV3AggregatorETHUSD.deploy(8, 2000 * 10**8, {"from": owner}),
@@ -47,30 +41,74 @@ def tokens_and_feeds(owner, users):
     )
 
 
-@pytest.fixture
-def dapp_token(owner, users):
-    return __deploy_token(DappToken, owner, users)
-
-
-@pytest.fixture
-def token_farm(dapp_token, owner, tokens_and_feeds):
+def __deploy_token_farm(dapp_token, owner, tokens_and_feeds):
     (_, _, _, fau_feed) = tokens_and_feeds
     token_farm = TokenFarm.deploy(dapp_token, fau_feed, {"from": owner})
     dapp_token.approve(token_farm, Web3.toWei(10000, "ether"), {"from": owner})
     return token_farm
 
 
-@pytest.fixture
-def allowed_token_farm(token_farm, owner, tokens_and_feeds):
+def __allow_tokens(token_farm, owner, tokens_and_feeds):
     (weth, weth_price_feed, fau, fau_price_feed) = tokens_and_feeds
     token_farm.addAllowedToken(weth, weth_price_feed, {"from": owner}).wait(1)
     token_farm.addAllowedToken(fau, fau_price_feed, {"from": owner}).wait(1)
     return (token_farm, weth, fau)
 
 
-@pytest.fixture
-def staked_token_farm(allowed_token_farm, users):
-    (token_farm, weth, fau) = allowed_token_farm
+@pytest.fixture(scope="module", autouse=True)
+def shared_setup(request):
+    if not is_unit_test_network():
+        pytest.skip()
+    request.getfixturevalue("module_isolation")
+
+
+@pytest.fixture(autouse=True)
+def isolation(shared_setup, fn_isolation):
+    # module fixtures are deployed once, every test reverts to them in one call
+    pass
+
+
+@pytest.fixture(scope="module")
+def owner():
+    return accounts[0]
+
+
+@pytest.fixture(scope="module")
+def users():
+    return [accounts[1], accounts[2]]
+
+
+@pytest.fixture(scope="module")
+def tokens_and_feeds(owner, users):
+    return __deploy_tokens_and_feeds(owner, users)
+
+
+@pytest.fixture(scope="module")
+def dapp_token(owner, users):
+    return __deploy_token(DappToken, owner, users)
+
+
+@pytest.fixture(scope="module")
+def token_farm(dapp_token, owner, tokens_and_feeds):
+    return __deploy_token_farm(dapp_token, owner, tokens_and_feeds)
+
+
+@pytest.fixture(scope="module")
+def allowed_token_farm(dapp_token, owner, tokens_and_feeds):
+    token_farm = __deploy_token_farm(dapp_token, owner, tokens_and_feeds)
+    return __allow_tokens(token_farm, owner, tokens_and_feeds)
+
+
+@pytest.fixture(scope="module")
+def staked_tokens_and_feeds(owner, users):
+    # own tokens, so stakes don't move the balances other fixtures start from
+    return __deploy_tokens_and_feeds(owner, users)
+
+
+@pytest.fixture(scope="module")
+def staked_token_farm(dapp_token, owner, users, staked_tokens_and_feeds):
+    token_farm = __deploy_token_farm(dapp_token, owner, staked_tokens_and_feeds)
+    (_, weth, fau) = __allow_tokens(token_farm, owner, staked_tokens_and_feeds)
 
     __stake(token_farm, weth, users[0], 1)
     __stake(token_farm, fau, users[0], 5)
@@ -527,3 +565,235 @@ def test_rewards_ten_percent_dapp_token_of_total_value_to_all_stakeholders(
     assert dapp_token.balanceOf(owner) == 75993 * 1e17
     assert dapp_token.balanceOf(users[0]) == 3005 * 1e17
     assert dapp_token.balanceOf(users[1]) == 21002 * 1e17
+
+
+@unit_test
+def test_rewards_stakeholders_in_batches(staked_token_farm, owner, users, dapp_token):
+    (token_farm, _, _) = staked_token_farm
+
+    token_farm.startRewardRound({"from": owner}).wait(1)
+    assert token_farm.getRewardRoundProgress() == (True, 0, 2)
+
+    token_farm.rewardNextStakeholders(1, {"from": owner}).wait(1)
+    assert token_farm.getRewardRoundProgress() == (True, 1, 2)
+    assert dapp_token.balanceOf(users[0]) == 3005 * 1e17
+    assert dapp_token.balanceOf(users[1]) == 100 * 1e18
+
+    token_farm.rewardNextStakeholders(1, {"from": owner}).wait(1)
+    assert token_farm.getRewardRoundProgress() == (False, 2, 2)
+    assert dapp_token.balanceOf(owner) == 75993 * 1e17
+    assert dapp_token.balanceOf(users[0]) == 3005 * 1e17
+    assert dapp_token.balanceOf(users[1]) == 21002 * 1e17
+
+
+@unit_test
+def test_only_owner_can_run_reward_round(staked_token_farm, owner, users):
+    (token_farm, _, _) = staked_token_farm
+
+    with pytest.raises(exceptions.VirtualMachineError):
+        token_farm.startRewardRound({"from": users[0]})
+
+    token_farm.startRewardRound({"from": owner}).wait(1)
+
+    with pytest.raises(exceptions.VirtualMachineError):
+        token_farm.rewardNextStakeholders(2, {"from": users[0]})
+
+
+@unit_test
+def test_reward_round_cant_be_started_twice(staked_token_farm, owner):
+    (token_farm, _, _) = staked_token_farm
+
+    with pytest.raises(exceptions.VirtualMachineError):
+        token_farm.rewardNextStakeholders(2, {"from": owner})
+
+    token_farm.startRewardRound({"from": owner}).wait(1)
+
+    with pytest.raises(exceptions.VirtualMachineError):
+        token_farm.startRewardRound({"from": owner})
+
+
+@unit_test
+def test_unstake_behind_reward_cursor_keeps_round_going(
+    staked_token_farm, owner, users, dapp_token
+):
+    (token_farm, weth, fau) = staked_token_farm
+
+    token_farm.startRewardRound({"from": owner}).wait(1)
+    token_farm.rewardNextStakeholders(1, {"from": owner}).wait(1)
+    token_farm.unstake(weth, {"from": users[0]}).wait(1)
+    token_farm.unstake(fau, {"from": users[0]}).wait(1)
+    assert token_farm.isStakeholder(users[0]) == False
+
+    token_farm.rewardNextStakeholders(1, {"from": owner}).wait(1)
+    assert token_farm.getRewardRoundProgress() == (False, 2, 2)
+    assert dapp_token.balanceOf(users[0]) == 3005 * 1e17
+    assert dapp_token.balanceOf(users[1]) == 21002 * 1e17
+
+    # the next round removes it instead of rewarding it
+    token_farm.reward({"from": owner}).wait(1)
+    assert token_farm.getStakeholderCount() == 1
+    assert dapp_token.balanceOf(users[0]) == 3005 * 1e17
+    assert dapp_token.balanceOf(users[1]) == 41004 * 1e17
+
+
+@unit_test
+def test_unstake_ahead_of_reward_cursor_is_not_rewarded(
+    staked_token_farm, owner, users, dapp_token
+):
+    (token_farm, weth, fau) = staked_token_farm
+
+    token_farm.startRewardRound({"from": owner}).wait(1)
+    token_farm.unstake(weth, {"from": users[0]}).wait(1)
+    token_farm.unstake(fau, {"from": users[0]}).wait(1)
+
+    token_farm.rewardNextStakeholders(2, {"from": owner}).wait(1)
+    assert token_farm.getRewardRoundProgress() == (False, 1, 1)
+    assert dapp_token.balanceOf(users[0]) == 100 * 1e18
+    assert dapp_token.balanceOf(users[1]) == 21002 * 1e17
+
+
+@unit_test
+def test_token_allowed_during_reward_round_is_rewarded(
+    staked_token_farm, owner, users, dapp_token
+):
+    (token_farm, _, _) = staked_token_farm
+    token = __deploy_token(MockWETH, owner, users)
+    price_feed = MockV3AggregatorETHUSD.deploy(8, 2000 * 10**8, {"from": owner})
+
+    token_farm.startRewardRound({"from": owner}).wait(1)
+    token_farm.addAllowedToken(token, price_feed, {"from": owner}).wait(1)
+    __stake(token_farm, token, users[0], 1)
+
+    token_farm.rewardNextStakeholders(2, {"from": owner}).wait(1)
+    assert dapp_token.balanceOf(users[0]) == 5005 * 1e17
+
+
+@unit_test
+def test_reward_round_uses_prices_of_its_start(
+    staked_token_farm, owner, users, dapp_token, staked_tokens_and_feeds
+):
+    (token_farm, weth, _) = staked_token_farm
+    (_, weth_price_feed, _, _) = staked_tokens_and_feeds
+
+    token_farm.startRewardRound({"from": owner}).wait(1)
+    token_farm.rewardNextStakeholders(1, {"from": owner}).wait(1)
+    weth_price_feed.updateAnswer(4000 * 10**8, {"from": owner}).wait(1)
+    token_farm.rewardNextStakeholders(1, {"from": owner}).wait(1)
+
+    assert token_farm.getTokenUnitValue(weth) == 4000 * 1e18
+    assert dapp_token.balanceOf(users[0]) == 3005 * 1e17
+    assert dapp_token.balanceOf(users[1]) == 21002 * 1e17
+
+
+@unit_test
+def test_stakeholder_portfolio_in_one_call(staked_token_farm, owner, users):
+    (token_farm, weth, fau) = staked_token_farm
+
+    assert token_farm.getStakeholderPortfolio(users[1]) == (
+        users[1],
+        [weth, fau],
+        [10 * 1e18, 2 * 1e18],
+        [20000 * 1e18, 2 * 1e18],
+        20002 * 1e18,
+    )
+    assert token_farm.getStakeholderPortfolio(owner) == (owner, [], [], [], 0)
+
+
+@unit_test
+def test_stakeholders_can_be_read_in_pages(staked_token_farm, users):
+    (token_farm, _, _) = staked_token_farm
+
+    assert token_farm.getStakeholderCount() == 2
+    assert token_farm.getStakeholders(0, 1) == [users[0]]
+    assert token_farm.getStakeholders(1, 5) == [users[1]]
+    assert token_farm.getStakeholders(2, 5) == []
+
+    portfolios = token_farm.getStakeholderPortfolios(0, 5)
+    assert [portfolio[0] for portfolio in portfolios] == [users[0], users[1]]
+    assert [portfolio[4] for portfolio in portfolios] == [2005 * 1e18, 20002 * 1e18]
+
+
+@unit_test
+def test_portfolios_are_read_in_batches(staked_token_farm, owner, users):
+    (token_farm, weth, fau) = staked_token_farm
+
+    holders = [users[0].address, users[1].address, owner.address]
+    portfolios = get_portfolios(token_farm, holders, 2)
+    assert portfolios[users[0].address]["tokens"] == {
+        weth.address: {"balance": 1e18, "value": 2000 * 1e18},
+        fau.address: {"balance": 5 * 1e18, "value": 5 * 1e18},
+    }
+    assert portfolios[users[1].address]["total_value"] == 20002 * 1e18
+    assert portfolios[owner.address]["tokens"] == {}
+
+    all_portfolios = get_all_portfolios(token_farm, 1)
+    assert list(all_portfolios) == [users[0].address, users[1].address]
+    assert all_portfolios[users[0].address] == portfolios[users[0].address]
+
+
+def __stake_and_unstake_gas(token_farm, weth, fau, user):
+    steps = []
+    for token in [weth, fau, weth]:
+        token.approve(token_farm, Web3.toWei(1, "ether"), {"from": user})
+        steps.append(token_farm.stake(token, Web3.toWei(1, "ether"), {"from": user}))
+    steps.append(token_farm.unstake(weth, {"from": user}))
+    steps.append(token_farm.unstake(fau, {"from": user}))
+    return [tx.gas_used for tx in steps]
+
+
+@unit_test
+def test_stake_and_unstake_use_less_gas_than_double_bookkeeping(
+    allowed_token_farm, owner, users
+):
+    (token_farm, weth, fau) = allowed_token_farm
+    double_bookkeeping_farm = MockDoubleBookkeepingTokenFarm.deploy({"from": owner})
+    double_bookkeeping_farm.addAllowedToken(weth, {"from": owner}).wait(1)
+    double_bookkeeping_farm.addAllowedToken(fau, {"from": owner}).wait(1)
+
+    steps = [
+        "first stake",
+        "stake of second token",
+        "stake top up",
+        "unstake of one token",
+        "unstake of last token",
+    ]
+    before = __stake_and_unstake_gas(double_bookkeeping_farm, weth, fau, users[0])
+    after = __stake_and_unstake_gas(token_farm, weth, fau, users[1])
+
+    for step, gas_before, gas_after in zip(steps, before, after):
+        assert gas_after < gas_before, "{}: {:,} -> {:,} gas".format(
+            step, gas_before, gas_after
+        )
+
+
+@pytest.fixture
+def permit_user(owner, allowed_token_farm):
+    (_, weth, _) = allowed_token_farm
+    # permits are signed off-chain, with the key of a local account
+    user = accounts.add()
+    owner.transfer(user, Web3.toWei(1, "ether")).wait(1)
+    weth.transfer(user, Web3.toWei(100, "ether"), {"from": owner}).wait(1)
+    return user
+
+
+@unit_test
+def test_stake_with_permit_in_one_transaction(allowed_token_farm, permit_user):
+    (token_farm, weth, _) = allowed_token_farm
+
+    stake_with_permit(token_farm, weth, permit_user, Web3.toWei(2, "ether")).wait(1)
+
+    assert weth.balanceOf(token_farm) == 2 * 1e18
+    assert weth.balanceOf(permit_user) == 98 * 1e18
+    assert weth.allowance(permit_user, token_farm) == 0
+    assert token_farm.getStakeholderTokenBalance(permit_user, weth) == 2 * 1e18
+
+
+@unit_test
+def test_cant_stake_with_expired_permit(allowed_token_farm, permit_user):
+    (token_farm, weth, _) = allowed_token_farm
+    amount = Web3.toWei(2, "ether")
+    permit = sign_permit(weth, permit_user, token_farm, amount, chain.time() - 1)
+
+    with pytest.raises(exceptions.VirtualMachineError):
+        token_farm.stakeWithPermit(weth, amount, *permit, {"from": permit_user})
+    assert token_farm.isStakeholder(permit_user) == False